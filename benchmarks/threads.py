@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Throughput benchmark of ThreadSafeDotty shared between threads.
+
+Every thread makes the same number of operations on one shared document,
+mixing reads, writes and iteration in given proportions. Total number of
+operations per second is printed for 1, 4 and 16 threads, next to plain
+Dotty guarded by single mutex. Run from repository root::
+
+    python benchmarks/threads.py [--operations N] [--writes PERCENT] [--iterations PERCENT]
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotty_dict import Dotty  # noqa: E402
+from dotty_dict.threadsafe import ThreadSafeDotty  # noqa: E402
+
+__author__ = 'Pawel Zadrozny'
+__copyright__ = 'Copyright (c) 2017, Pawel Zadrozny'
+
+THREADS = (1, 4, 16)
+KEYS = ['users.u{}.profile.score'.format(i) for i in range(100)]
+
+
+class MutexDotty:
+    """Plain Dotty with every operation guarded by single mutex."""
+
+    def __init__(self, dictionary):
+        self.dot = Dotty(dictionary)
+        self.mutex = threading.Lock()
+
+    def __getitem__(self, key):
+        with self.mutex:
+            return self.dot[key]
+
+    def __setitem__(self, key, value):
+        with self.mutex:
+            self.dot[key] = value
+
+    def find(self, key):
+        with self.mutex:
+            return list(self.dot.find(key))
+
+
+def document():
+    dot = Dotty({})
+    for i, key in enumerate(KEYS):
+        dot[key] = i
+    return dot.to_dict()
+
+
+def worker(dot, operations, writes, iterations, seed):
+    """Make operations on shared document.
+
+    :param dot: Shared document
+    :param int operations: Number of operations
+    :param int writes: Percent of writes
+    :param int iterations: Percent of iterations over all scores
+    :param int seed: Seed of random choice of keys and operations
+    """
+    rand = random.Random(seed)
+    for _ in range(operations):
+        key = KEYS[rand.randrange(len(KEYS))]
+        roll = rand.randrange(100)
+        if roll < writes:
+            dot[key] = roll
+        elif roll < writes + iterations:
+            for _ in dot.find('users.*.profile.score'):
+                pass
+        else:
+            dot[key]
+
+
+def measure(factory, threads, args):
+    """Return operations per second made by given number of threads.
+
+    :param factory: Function creating shared document from dictionary
+    :param int threads: Number of threads
+    :param args: Parsed command line arguments
+    :return float: Operations per second
+    """
+    dot = factory(document())
+    pool = [threading.Thread(target=worker,
+                             args=(dot, args.operations, args.writes, args.iterations, n))
+            for n in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return threads * args.operations / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--operations', type=int, default=20000, help='operations per thread')
+    parser.add_argument('--writes', type=int, default=10, help='percent of writes')
+    parser.add_argument('--iterations', type=int, default=1, help='percent of iterations')
+    args = parser.parse_args(argv)
+
+    print('{:>8} {:>16} {:>16}'.format('threads', 'ThreadSafeDotty', 'mutex'))
+    for threads in THREADS:
+        print('{:>8} {:>16.0f} {:>16.0f}'.format(
+            threads, measure(ThreadSafeDotty, threads, args), measure(MutexDotty, threads, args)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Micro-benchmark of deep key access at growing depth.
+
+Measures get, set, delete and membership test of single deep key in
+document nested 1, 5, 20 and 100 levels deep, and prints best time of
+every operation in microseconds. Run from repository root, on both
+revisions to compare::
+
+    python benchmarks/traversal.py [--number N] [--repeat N]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotty_dict import dotty  # noqa: E402
+
+__author__ = 'Pawel Zadrozny'
+__copyright__ = 'Copyright (c) 2017, Pawel Zadrozny'
+
+DEPTHS = (1, 5, 20, 100)
+
+
+def nested(depth):
+    """Return dictionary nested depth levels deep and its deepest key.
+
+    :param int depth: Number of levels
+    :return tuple: Dictionary and key of value at the bottom
+    """
+    keys = ['key{}'.format(level) for level in range(depth)]
+    data = 'value'
+    for key in reversed(keys):
+        data = {key: data}
+    return data, '.'.join(keys)
+
+
+def operations(depth):
+    """Return benchmarked operations for given depth.
+
+    :param int depth: Number of levels
+    :return list: Pairs of operation name and function
+    """
+    data, key = nested(depth)
+    dot = dotty(data)
+
+    def delete():
+        del dot[key]
+        dot[key] = 'value'
+
+    return [
+        ('get', lambda: dot[key]),
+        ('set', lambda: dot.__setitem__(key, 'value')),
+        ('delete', delete),
+        ('contains', lambda: key in dot),
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=10000, help='calls per measurement')
+    parser.add_argument('--repeat', type=int, default=5, help='measurements per operation')
+    args = parser.parse_args(argv)
+
+    print('{:>6} {:>10} {:>12}'.format('depth', 'operation', 'usec/call'))
+    for depth in DEPTHS:
+        for name, function in operations(depth):
+            best = min(timeit.repeat(function, number=args.number, repeat=args.repeat))
+            print('{:>6} {:>10} {:>12.3f}'.format(depth, name, best / args.number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
-from dotty_dict.dotty_dict import Dotty, dotty
+from dotty_dict import frozen, json_backends, mapped, streaming, threadsafe
+from dotty_dict.dotty_dict import Dotty, DottyPath, DottyView, dotty
 
 __author__ = 'Pawel Zadrozny'
 __copyright__ = 'Copyright (c) 2017, Pawel Zadrozny'
 __email__ = 'pawel.zny@gmail.com'
 __version__ = '1.3.1'
-__all__ = ['Dotty', 'dotty']
+__all__ = ['Dotty', 'DottyPath', 'DottyView', 'dotty', 'frozen', 'json_backends', 'mapped',
+           'streaming', 'threadsafe']
@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Dotty over asynchronous key-value stores.
+
+Store is any object with coroutine method ``get(key)`` returning value
+or None when key does not exist, like async clients of Redis-like stores.
+When store also has coroutine method ``get_many(keys)`` returning list
+of values, keys needed at the same level are fetched with single call.
+
+Values returned by store can be plain dicts and lists, which are walked
+locally, or other stores, which are fetched from on the next level.
+"""
+import asyncio
+from collections import OrderedDict
+from time import monotonic
+
+from dotty_dict.dotty_dict import Dotty, _missing
+
+__author__ = 'Pawel Zadrozny'
+__copyright__ = 'Copyright (c) 2017, Pawel Zadrozny'
+
+
+def _is_store(value):
+    get = getattr(value, 'get', None)
+    return get is not None and asyncio.iscoroutinefunction(get)
+
+
+class AsyncDotty:
+    """Dot notation access to asynchronous store.
+
+    Supports the same dot notation, list indices, slices and predicates
+    as Dotty. Slices and predicates are applied only to plain lists,
+    stores found below them are returned as they are.
+
+    Deep keys requested together are resolved level by level. At every
+    level distinct keys of every store are fetched at once, and all
+    stores are queried concurrently. Fetched values are cached for
+    ``ttl`` seconds and dropped from cache by first fetch after that.
+
+    Store can not tell missing key from key set to None, so both are
+    treated as missing.
+
+    :param store: Object with coroutine method get(key)
+    :param str separator: Character used to chain deep access.
+    :param str esc_char: Escape character for separator.
+    :param bool no_list: If set to True then numeric keys will NOT be converted to list indices
+    :param float ttl: Number of seconds fetched values are cached for, 0 disables cache
+    :raises AttributeError: If store has no coroutine method get
+    """
+
+    def __init__(self, store, separator='.', esc_char='\\', no_list=False, ttl=0):
+        if not _is_store(store):
+            raise AttributeError('Store must have coroutine method get')
+        self.store = store
+        self.separator = separator
+        self.esc_char = esc_char
+        self.no_list = no_list
+        self.ttl = ttl
+        self._cache = OrderedDict()   # chain of keys: (expiry time, value), oldest first
+        self._local = Dotty({}, separator=separator, esc_char=esc_char, no_list=no_list)
+
+    def __repr__(self):
+        return 'AsyncDotty(store={!r}, separator={!r}, esc_char={!r})'.format(
+            self.store, self.separator, self.esc_char)
+
+    async def get(self, key, default=None):
+        """Get value from deep key or default if key does not exist.
+
+        :param str key: Single key or chain of keys
+        :param Any default: Default value if deep key does not exist
+        :return: Any or default value
+        """
+        return (await self.get_many([key], default))[0]
+
+    async def get_many(self, keys, default=None):
+        """Get values of many deep keys at once.
+
+        :param keys: Iterable of single keys, chains of keys or compiled paths
+        :param Any default: Default value for every deep key which does not exist
+        :return list: Values in order of given keys
+        """
+        paths = [self._local.compile(key) for key in keys]
+        results = [default] * len(paths)
+        # (position of path, store, chain of keys leading to store, position of segment)
+        pending = [(position, self.store, (), 0) for position in range(len(paths))]
+        while pending:
+            requests = {}
+            for position, store, chain, pos in pending:
+                key = paths[position].segments[pos][0]
+                requests.setdefault(chain + (key,), (store, key))
+            fetched = await self._fetch(requests)
+
+            waiting = []
+            for position, _store, chain, pos in pending:
+                segments = paths[position].segments
+                chain += (segments[pos][0],)
+                value = fetched[chain]
+                pos += 1
+                try:
+                    value, chain, pos = self._walk_local(value, chain, segments, pos)
+                except (KeyError, IndexError):
+                    continue
+                if value is _missing:
+                    continue
+                if pos < len(segments):
+                    waiting.append((position, value, chain, pos))
+                else:
+                    results[position] = value
+            pending = waiting
+        return results
+
+    def _walk_local(self, value, chain, segments, pos):
+        """Walk plain dicts and lists until next store or end of path.
+
+        :param value: Value fetched from store
+        :param tuple chain: Chain of keys leading to value
+        :param tuple segments: Compiled path segments
+        :param int pos: Position of next segment
+        :return tuple: Value, chain of keys leading to it and position of next segment
+        :raises KeyError: If key does not exist
+        """
+        local = self._local
+        while pos < len(segments) and value is not _missing and not _is_store(value):
+            if value is None:
+                return None, chain, len(segments)
+            segment = segments[pos]
+            if segment[2] is not None and isinstance(value, list) and not self.no_list:
+                return local._get_from(value, segments, pos), chain, len(segments)
+            value = local._traverse(value, (segment,))
+            chain += (segment[0],)
+            pos += 1
+        return value, chain, pos
+
+    async def _fetch(self, requests):
+        """Fetch values from stores.
+
+        :param dict requests: Chain of keys mapped to (store, key) pairs
+        :return dict: Chain of keys mapped to value or missing marker
+        """
+        fetched = {}
+        by_store = {}
+        cache = self._cache
+        self._evict(monotonic())
+        for chain, (store, key) in requests.items():
+            cached = cache.get(chain)
+            if cached is not None:
+                fetched[chain] = cached[1]
+            else:
+                by_store.setdefault(id(store), (store, []))[1].append((chain, key))
+
+        batches = list(by_store.values())
+        if not batches:
+            return fetched
+        answers = await asyncio.gather(*(self._fetch_from(store, [key for _, key in wanted])
+                                         for store, wanted in batches))
+        expires = monotonic() + self.ttl
+        for (_, wanted), values in zip(batches, answers):
+            for (chain, _), value in zip(wanted, values):
+                if value is None:
+                    value = _missing
+                fetched[chain] = value
+                if self.ttl > 0:
+                    cache[chain] = (expires, value)
+                    cache.move_to_end(chain)
+        return fetched
+
+    def _evict(self, now):
+        """Remove expired values from cache.
+
+        All values live for the same time, so cache is kept in order of
+        expiry and only its oldest values need to be checked.
+
+        :param float now: Current time
+        """
+        cache = self._cache
+        while cache and next(iter(cache.values()))[0] <= now:
+            cache.popitem(last=False)
+
+    @staticmethod
+    async def _fetch_from(store, keys):
+        get_many = getattr(store, 'get_many', None)
+        if get_many is not None and asyncio.iscoroutinefunction(get_many):
+            return list(await get_many(keys))
+        return await asyncio.gather(*(store.get(key) for key in keys))
+
+    def cache_clear(self):
+        """Remove all cached values."""
+        self._cache.clear()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Columnar extraction of deep keys from many documents.
+
+Values of every deep key are collected from all documents into separate
+column, ready to be passed to analytics libraries. NumPy arrays are
+available when NumPy is installed.
+"""
+from array import array
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from dotty_dict.dotty_dict import Dotty
+
+__author__ = 'Pawel Zadrozny'
+__copyright__ = 'Copyright (c) 2017, Pawel Zadrozny'
+
+
+def extract(records, keys, default=None, defaults=None, typecodes=None, as_numpy=False,
+            separator='.', esc_char='\\', no_list=False):
+    """Extract values of deep keys from many documents into columns.
+
+    Keys are compiled once for all documents. Values are read with plain
+    item access first, and full Dotty lookup is used only when it fails,
+    so list indices, slices and predicates work the same as in Dotty.
+
+    Columns of keys listed in ``typecodes`` are collected into
+    :class:`array.array` of given typecode, other columns into lists.
+    Default values of typed columns must fit their typecode. None does
+    not fit any typecode, so typed columns get default value in place
+    of None, also when None is found on the way to deep key.
+
+    :param records: Iterable of dictionaries or Dotty instances
+    :param keys: Iterable of single keys, chains of keys or compiled paths
+    :param Any default: Default value for every deep key which does not exist
+    :param dict defaults: Default values of particular keys
+    :param dict typecodes: Keys mapped to typecodes of :class:`array.array`
+    :param bool as_numpy: If set to True then every column is converted to NumPy array
+    :param str separator: Character used to chain deep access.
+    :param str esc_char: Escape character for separator.
+    :param bool no_list: If set to True then numeric keys will NOT be converted to list indices
+    :raises ValueError: If NumPy arrays are requested but NumPy is not installed
+    :return dict: Given keys mapped to columns of values in order of records
+    """
+    if as_numpy and numpy is None:
+        raise ValueError('NumPy arrays requested but NumPy is not installed')
+    keys = list(keys)
+    defaults = defaults or {}
+    typecodes = typecodes or {}
+    local = Dotty({}, separator=separator, esc_char=esc_char, no_list=no_list)
+    get_from = local._get_from
+
+    columns = []
+    plan = []
+    for key in keys:
+        path = local.compile(key)
+        typecode = typecodes.get(key)
+        column = [] if typecode is None else array(typecode)
+        columns.append(column)
+        missing = defaults.get(key, default)
+        plan.append((path.keys, path.segments, missing,
+                     None if typecode is None else missing, column.append))
+
+    for record in records:
+        if type(record) is not dict and isinstance(record, Dotty):
+            record = record._data
+        _extract_record(record, plan, get_from)
+
+    if as_numpy:
+        columns = [numpy.asarray(column) for column in columns]
+    return dict(zip(keys, columns))
+
+
+def _extract_record(record, plan, get_from):
+    """Append values of deep keys of single document to their columns.
+
+    :param dict record: Document
+    :param list plan: Tuples of chain of keys, compiled path segments,
+        value of missing key, value in place of None and append method of column
+    :param get_from: Full Dotty lookup used when plain item access fails
+    """
+    for chain, segments, missing, if_none, append in plan:
+        value = record
+        try:
+            for part in chain:
+                value = value[part]
+        except (KeyError, IndexError, TypeError):
+            try:
+                value = get_from(record, segments, 0)
+            except (KeyError, IndexError):
+                value = missing
+        append(if_none if value is None else value)
@@ -1,29 +1,720 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 try:
-    from collections.abc import Mapping
+    from collections.abc import Mapping, MutableSequence
 except ImportError:
-    from collections import Mapping
+    from collections import Mapping, MutableSequence
 
+from collections import OrderedDict, namedtuple
 from functools import lru_cache
 import json
+import operator
+import re
+import weakref
+
+from dotty_dict import json_backends
 
 __author__ = 'Pawel Zadrozny'
 __copyright__ = 'Copyright (c) 2017, Pawel Zadrozny'
 
 
-def dotty(dictionary=None, no_list=False):
+def split_key(key, separator='.', esc_char='\\'):
+    """Split dot notated chain of keys.
+
+    Works with custom separators and escape characters.
+    Keys which are not strings are returned as single element list.
+
+    :param str key: Single key or chain of keys
+    :param str separator: Character used to chain deep access.
+    :param str esc_char: Escape character for separator.
+    :return list: List of keys
+    """
+    if not isinstance(key, str):
+        return [key]
+    esc_stamp = (esc_char + separator, '<#esc#>')
+    skp_stamp = ('\\' + esc_char + separator, '<#skp#>' + separator)
+
+    stamp_esc = ('<#esc#>', separator)
+    stamp_skp = ('<#skp#>', esc_char)
+
+    key = key.replace(*skp_stamp).replace(*esc_stamp)
+    keys = key.split(separator)
+    for i, k in enumerate(keys):
+        keys[i] = k.replace(*stamp_esc).replace(*stamp_skp)
+
+    return keys
+
+
+def join_keys(keys, separator='.', esc_char='\\'):
+    """Join chain of keys into dot notated key.
+
+    Separators inside keys are escaped, so :func:`split_key`
+    returns the same chain of keys. Keys which are not strings
+    are converted to strings.
+
+    :param keys: Iterable of keys
+    :param str separator: Character used to chain deep access.
+    :param str esc_char: Escape character for separator.
+    :return str: Dot notated chain of keys
+    """
+    keys = list(keys)
+    last = len(keys) - 1
+    return separator.join(_escape_key(key, separator, esc_char, i == last)
+                          for i, key in enumerate(keys))
+
+
+def _escape_key(key, separator='.', esc_char='\\', last=True):
+    """Escape single key, so it can be joined into dot notated chain.
+
+    :param key: Single key, converted to string if needed
+    :param str separator: Character used to chain deep access.
+    :param str esc_char: Escape character for separator.
+    :param bool last: Whether key is the last one in chain
+    :return str: Escaped key
+    """
+    key = str(key).replace(separator, esc_char + separator)
+    if not last and key.endswith(esc_char):
+        key = key[:-len(esc_char)] + '\\' + esc_char
+    return key
+
+
+_PREDICATE_RE = re.compile(r'\?(!?)([^=!<>]+)(?:(==|=|!=|<=|>=|<|>)(.*))?\Z', re.DOTALL)
+
+_operators = {
+    '=': operator.eq,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+
+class Predicate:
+    """Filter of list items by value of their field.
+
+    Predicate segment starts with question mark and selects list items
+    which are dictionaries matching condition:
+
+    * ``?field`` - field exists,
+    * ``?!field`` - field does not exist,
+    * ``?field=value`` or ``?field==value``, ``?field!=value`` - equality,
+    * ``?field<value``, ``?field<=value``, ``?field>value``, ``?field>=value`` - comparison.
+
+    Value is parsed as json, so ``?price>10`` compares numbers and
+    ``?active=true`` compares booleans. Value which is not valid json is
+    compared as string. Separator inside value has to be escaped,
+    e.g. ``items.?price>9\\.5``.
+
+    Item which does not have field, or which field can not be compared
+    with value, does not match. Condition is not checked any further
+    once field is missing.
+
+    :param str field: Name of field
+    :param str op: Comparison operator or None for existence check
+    :param Any value: Value to compare with
+    :param bool negate: If set to True then item matches when field does not exist
+    """
+
+    __slots__ = ('field', 'op', 'value', 'negate', 'match')
+
+    def __init__(self, field, op=None, value=None, negate=False):
+        self.field = field
+        self.op = op
+        self.value = value
+        self.negate = negate
+        self.match = self._build_match()
+
+    def _build_match(self):
+        """Build function checking single item.
+
+        Function result is truthy when item matches. It is a plain closure,
+        so it can be handed to :func:`filter` without method call overhead.
+
+        :return: Function taking item
+        """
+        field, expected, negate = self.field, self.value, self.negate
+        if self.op is None:
+            def match(item):
+                try:
+                    item[field]
+                except KeyError:
+                    return negate
+                except (TypeError, IndexError):
+                    return False
+                return not negate
+            return match
+
+        compare = _operators[self.op]
+
+        def match(item):
+            try:
+                return compare(item[field], expected)
+            except (KeyError, TypeError, IndexError):
+                return False
+        return match
+
+    @classmethod
+    def parse(cls, key):
+        """Parse predicate segment.
+
+        :param str key: Single key
+        :return Predicate: Predicate or None if key is not a predicate
+        """
+        match = _PREDICATE_RE.match(key)
+        if match is None:
+            return None
+        negate, field, op, raw = match.groups()
+        if negate and op is not None:
+            return None
+        value = None
+        if op is not None:
+            try:
+                value = json.loads(raw)
+            except ValueError:
+                value = raw
+        return cls(field, op, value, bool(negate))
+
+    def __repr__(self):
+        return 'Predicate(field={!r}, op={!r}, value={!r}, negate={!r})'.format(
+            self.field, self.op, self.value, self.negate)
+
+    def __call__(self, item):
+        return bool(self.match(item))
+
+    def test(self, found, value):
+        """Check condition against value of field.
+
+        :param bool found: Whether field exists
+        :param Any value: Value of field
+        :return bool: True if condition is met
+        """
+        if not found or self.op is None:
+            return found is not self.negate
+        try:
+            return bool(_operators[self.op](value, self.value))
+        except TypeError:
+            return False
+
+
+def _select(data, selector):
+    """Return items of list selected by slice or predicate.
+
+    :param list data: List to select from
+    :param selector: List slice or Predicate
+    :return: Iterable of selected items
+    """
+    if type(selector) is slice:
+        return data[selector]
+    return filter(selector.match, data)
+
+
+def _select_indices(data, selector):
+    """Return indices of list items selected by slice or predicate.
+
+    :param list data: List to select from
+    :param selector: List slice or Predicate
+    :return: Iterable of indices
+    """
+    if type(selector) is slice:
+        return range(len(data))[selector]
+    match = selector.match
+    return (i for i, item in enumerate(data) if match(item))
+
+
+def _classify(key):
+    """Pre-classify single key as list index, list selector or plain key.
+
+    List selector is either list slice or :class:`Predicate`.
+
+    :param key: Single key
+    :return tuple: Key, list index or None, list selector or None
+    """
+    index = list_slice = None
+    if type(key) is int:
+        index = key
+    elif isinstance(key, str):
+        if key.isdigit():
+            try:
+                index = int(key)
+            except ValueError:
+                pass
+        elif key.startswith('?'):
+            list_slice = Predicate.parse(key)
+        elif ':' in key:
+            try:
+                list_slice = slice(*(None if x == '' else int(x) for x in key.split(':')))
+            except (TypeError, ValueError):
+                pass
+    return key, index, list_slice
+
+
+class DottyPath:
+    """Compiled chain of keys.
+
+    Key is split and every part is classified as list index,
+    list slice or plain key only once. Compiled path can be passed
+    to every Dotty accessor instead of dot notated string.
+
+    :param str key: Single key or chain of keys
+    :param str separator: Character used to chain deep access.
+    :param str esc_char: Escape character for separator.
+    """
+
+    __slots__ = ('keys', 'segments', 'has_slice', '_hash')
+
+    def __init__(self, key, separator='.', esc_char='\\'):
+        self._set_keys(split_key(key, separator, esc_char))
+
+    def _set_keys(self, keys):
+        self.keys = tuple(keys)
+        self.segments = tuple(_classify(k) for k in self.keys)
+        self.has_slice = any(s[2] is not None for s in self.segments)
+        self._hash = hash(self.keys)
+
+    @classmethod
+    def from_keys(cls, keys):
+        """Create path from already split chain of keys.
+
+        :param keys: Iterable of keys
+        :return DottyPath: Compiled path
+        """
+        path = cls.__new__(cls)
+        path._set_keys(keys)
+        return path
+
+    def __repr__(self):
+        return 'DottyPath({!r})'.format(list(self.keys))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        return iter(self.keys)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, DottyPath):
+            return self.keys == other.keys
+        return NotImplemented
+
+
+@lru_cache(maxsize=1024)
+def _compile(key, separator, esc_char):
+    return DottyPath(key, separator, esc_char)
+
+
+class _PathTrie:
+    """Prefix tree of compiled paths.
+
+    Every node remembers positions of paths ending in it,
+    positions of paths going deeper and positions of all paths
+    passing through it.
+
+    :param tuple segment: Compiled path segment leading to this node
+    """
+
+    __slots__ = ('segment', 'children', 'ends', 'through', 'below')
+
+    def __init__(self, segment=None):
+        self.segment = segment
+        self.children = {}
+        self.ends = []
+        self.through = []
+        self.below = []
+
+    def insert(self, segments, position):
+        """Add compiled path segments to tree.
+
+        :param tuple segments: Compiled path segments
+        :param int position: Position of path in input sequence
+        """
+        node = self
+        node.below.append(position)
+        for segment in segments:
+            node.through.append(position)
+            child = node.children.get(segment[0])
+            if child is None:
+                child = node.children[segment[0]] = _PathTrie(segment)
+            child.below.append(position)
+            node = child
+        node.ends.append(position)
+
+
+@lru_cache(maxsize=256)
+def _build_trie(paths):
+    root = _PathTrie()
+    for position, path in enumerate(paths):
+        root.insert(path.segments, position)
+    return root
+
+
+_KEY, _ANY, _DEEP = 'key', 'any', 'deep'
+
+
+@lru_cache(maxsize=256)
+def _compile_query(path):
+    """Compile path into query matcher.
+
+    Star ``*`` matches any single key or list index, double star ``**``
+    matches any chain of keys, including empty one. Repeated double stars
+    are collapsed into one, as they match the same.
+
+    :param DottyPath path: Compiled path
+    :return tuple: Pairs of segment kind and compiled segment
+    """
+    query = []
+    for segment in path.segments:
+        key = segment[0]
+        kind = _DEEP if key == '**' else _ANY if key == '*' else _KEY
+        if kind is _DEEP and query and query[-1][0] is _DEEP:
+            continue
+        query.append((kind, segment))
+    return tuple(query)
+
+
+def _children(data, pos, keys, use_list):
+    """Yield pending query states of every child of container.
+
+    :param data: Portion of dictionary to operate on
+    :param int pos: Position in query of children
+    :param tuple keys: Chain of keys leading to data or None
+    :param bool use_list: If set to False then lists have no children
+    :return: Generator of (data, query position, keys) states
+    """
+    if isinstance(data, dict):
+        items = data.items()
+    elif isinstance(data, list) and use_list:
+        items = enumerate(data)
+    else:
+        return
+    if keys is None:
+        for _, value in items:
+            yield value, pos, None
+    else:
+        for k, value in items:
+            yield value, pos, keys + (k,)
+
+
+def _extend_to(data, key):
+    """Extend list with None up to list index given as key.
+
+    :param list data: List to extend
+    :param key: List index as integer or string of digits
+    :raises KeyError: If key is not a list index
+    :return int: List index
+    """
+    if type(key) is not int:
+        if not key.isdigit():
+            raise KeyError("List index must be an integer, got {}".format(key))
+        key = int(key)
+    if key >= len(data):
+        data.extend([None] * (key + 1 - len(data)))
+    return key
+
+
+def _open(value, descend, use_list):
+    """Unwrap Dotty and return iterator of its items, if it is a container.
+
+    :param value: Any value
+    :param bool descend: If set to False then value is not entered
+    :param bool use_list: If set to False then lists are not entered
+    :return tuple: Unwrapped value and iterator of (key, item) pairs or None
+    """
+    if isinstance(value, Dotty):
+        value = value._data
+    if descend and value:
+        if isinstance(value, dict):
+            return value, iter(value.items())
+        if use_list and isinstance(value, list):
+            return value, enumerate(value)
+    return value, None
+
+
+def _dotted_names(prefix, key, separator, esc_char):
+    """Return dotted key of value and prefix of dotted keys of its items.
+
+    :param str prefix: Dotted key of parent followed by separator
+    :param key: Single key, converted to string if needed
+    :param str separator: Character used to chain deep access.
+    :param str esc_char: Escape character for separator.
+    :return tuple: Dotted key and prefix of nested keys
+    """
+    key = str(key)
+    if separator in key or esc_char in key:
+        return (prefix + _escape_key(key, separator, esc_char, True),
+                prefix + _escape_key(key, separator, esc_char, False) + separator)
+    name = prefix + key
+    return name, name + separator
+
+
+def _common_items(old, new):
+    """Pair items of two dictionaries or two lists under the same key.
+
+    :param old: Dictionary or list
+    :param new: Container of the same kind
+    :return: Iterable of (key, old value, new value) triples
+    """
+    if isinstance(old, list):
+        return zip(range(len(new)), old, new)
+    return ((key, value, new[key]) for key, value in old.items() if key in new)
+
+
+def _other_items(old, new):
+    """Yield operations for items which are only in one of two containers.
+
+    Removed list items are listed from the end, so indices of
+    remaining items do not change. Items added to dictionary are listed
+    before removed ones, so dictionary is not left empty while patch is
+    applied, and is not replaced with list when digit key is added.
+
+    :param old: Dictionary or list
+    :param new: Container of the same kind
+    :return: Generator of (operation, key, value) triples
+    """
+    if isinstance(old, list):
+        common = min(len(old), len(new))
+        for index in range(len(old) - 1, common - 1, -1):
+            yield 'remove', index, None
+        for index in range(common, len(new)):
+            yield 'add', index, new[index]
+        return
+    for key, value in new.items():
+        if key not in old:
+            yield 'add', key, value
+    for key in old:
+        if key not in new:
+            yield 'remove', key, None
+
+
+def _patchable(old, new, use_list):
+    """Tell if two containers of the same type can be compared item by item.
+
+    Setting digit key in empty dictionary replaces it with list, so
+    empty dictionary can not be filled with such keys by a patch and
+    must be changed as a whole.
+
+    :param old: Any value
+    :param new: Value of the same type
+    :param bool use_list: If set to False then lists are compared as a whole
+    :return bool: True if items of containers can be compared
+    """
+    if type(old) is list:
+        return use_list
+    if type(old) is not dict:
+        return False
+    return bool(old) or not use_list or not any(str(key).isdigit() for key in new)
+
+
+def _fill(results, positions, value):
+    """Set results at given positions to value.
+
+    :param list results: Results in order of paths
+    :param list positions: Positions of paths
+    :param Any value: Value to set
+    """
+    for position in positions:
+        results[position] = value
+
+
+def _unique(pairs):
+    """Yield (chain of keys, value) pairs with chain of keys not seen before.
+
+    :param pairs: Iterable of (chain of keys, value) pairs
+    :return: Generator of pairs
+    """
+    seen = set()
+    for keys, value in pairs:
+        if keys not in seen:
+            seen.add(keys)
+            yield keys, value
+
+
+def _sliced(data, indices, pos, keys):
+    """Yield pending query states of selected list items.
+
+    :param list data: List to operate on
+    :param indices: Iterable of selected indices
+    :param int pos: Position in query of items
+    :param tuple keys: Chain of keys leading to data or None
+    :return: Generator of (data, query position, keys) states
+    """
+    for i in indices:
+        yield data[i], pos, None if keys is None else keys + (i,)
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+DottySettings = namedtuple('DottySettings', ['separator', 'esc_char', 'no_list', 'identity_hash'])
+
+# settings are immutable, so every Dotty with the same settings shares one object
+_shared_settings = lru_cache(maxsize=256)(DottySettings)
+_default_settings = _shared_settings('.', '\\', False, False)
+
+DiffOp = namedtuple('DiffOp', ['op', 'key', 'value'])
+DiffOp.__doc__ = """Single difference between two documents.
+
+Operation is one of ``add``, ``remove`` or ``change``. Key is dot
+notated and escaped. Value is None for ``remove``.
+"""
+
+_missing = object()
+
+
+class ReadCache:
+    """Least recently used cache of values read from Dotty.
+
+    Cache is owned by single Dotty instance and is cleared
+    on every write made through that instance.
+
+    :param int maxsize: Maximum number of cached values
+    """
+
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._store = OrderedDict()
+
+    def get(self, key, default=_missing):
+        """Get cached value and mark it as recently used.
+
+        :param key: Compiled path
+        :param Any default: Returned when value is not cached
+        :return: Cached value or default
+        """
+        try:
+            value = self._store[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._store.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """Cache value evicting least recently used one if cache is full.
+
+        :param key: Compiled path
+        :param Any value: Value to cache
+        """
+        self._store[key] = value
+        if len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached values and reset statistics."""
+        self._store.clear()
+        self.hits = self.misses = 0
+
+    def info(self):
+        """Return cache statistics.
+
+        :return CacheInfo: Hits, misses, maxsize and current size
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._store))
+
+
+class _Ownership:
+    """Containers owned by Dotty which shares all other ones.
+
+    Documents sharing containers belong to the same group, held by weak
+    references under their ids, so Dotty knows when it shares containers
+    no more. Group set to None is never left. Owned containers are held by their ids,
+    so ids are not reused. Containers which are not reachable from root
+    through owned ones are dropped every time their number doubles.
+
+    :param dict root: Root dictionary of Dotty
+    :param group: WeakValueDictionary of documents sharing containers or None
+    """
+
+    __slots__ = ('root', 'containers', 'group', 'limit')
+
+    def __init__(self, root, group):
+        self.root = root
+        self.containers = {id(root): root}
+        self.group = group
+        self.limit = 64
+
+    def __contains__(self, container):
+        return id(container) in self.containers
+
+    def shared(self):
+        """Tell if containers can still be shared with other documents.
+
+        :return bool: False if all other documents of group are gone
+        """
+        return self.group is None or len(self.group) > 1
+
+    def add(self, container):
+        """Remember private copy of container.
+
+        Container must be already placed in its owned parent.
+
+        :param container: Copied dictionary or list
+        """
+        containers = self.containers
+        containers[id(container)] = container
+        if len(containers) > self.limit:
+            self._prune()
+
+    def _prune(self):
+        containers = self.containers
+        kept = {id(self.root): self.root}
+        stack = [self.root]
+        while stack:
+            data = stack.pop()
+            for child in data.values() if isinstance(data, Mapping) else data:
+                if id(child) in containers and id(child) not in kept:
+                    kept[id(child)] = child
+                    stack.append(child)
+        self.containers = kept
+        self.limit = max(64, 2 * len(kept))
+
+
+def _share(document, clone):
+    """Make two documents sharing containers copy them on write.
+
+    All containers of document but its root become shared again.
+    Clone joins group of document, if it already has one.
+
+    :param Dotty document: Document sharing its containers
+    :param Dotty clone: Document with copy of root of the other one
+    """
+    owned = document._owned
+    group = weakref.WeakValueDictionary() if owned is None else owned.group
+    if group is not None:
+        group[id(document)] = document
+        group[id(clone)] = clone
+    document._owned = _Ownership(document._data, group)
+    clone._owned = _Ownership(clone._data, group)
+
+
+def dotty(dictionary=None, no_list=False, cache_size=0, identity_hash=False):
     """Factory function for Dotty class.
 
     Create Dotty wrapper around existing or new dictionary.
 
     :param dict dictionary: Any dictionary or dict-like object
     :param bool no_list: If set to True then numeric keys will NOT be converted to list indices
+    :param int cache_size: Number of values kept in read cache, 0 disables cache
+    :param bool identity_hash: If set to True then Dotty is hashed and compared by identity
+        of wrapped dict
     :return: Dotty instance
     """
     if dictionary is None:
         dictionary = {}
-    return Dotty(dictionary, separator='.', esc_char='\\', no_list=no_list)
+    if type(dictionary) is not dict:
+        return Dotty(dictionary, separator='.', esc_char='\\', no_list=no_list,
+                     cache_size=cache_size, identity_hash=identity_hash)
+    if no_list or identity_hash:
+        settings = _shared_settings('.', '\\', bool(no_list), bool(identity_hash))
+    else:
+        settings = _default_settings
+    return Dotty._wrap(dictionary, settings, cache_size)
 
 
 class Dotty:
@@ -40,20 +731,93 @@ class Dotty:
     All changes made in original dictionary are reflected in dotty wrapped dict
     and vice versa.
 
+    Read cache is disabled by default. When enabled, it is cleared on every
+    write made through Dotty. Changes made directly in original dictionary
+    are not tracked, so call :meth:`cache_clear` after them.
+
+    By default hash is computed from string representation of wrapped dict,
+    which costs as much as ``str()`` of whole document. With ``identity_hash``
+    hash is computed in constant time from identity of wrapped dict instead.
+    Wrappers around the same dict still share hash, but wrappers around two
+    different dicts with equal content will not, so such Dotty is equal
+    only to dict it wraps and to other wrappers around it, the same as
+    when either side of comparison is hashed by identity. Dotty hashed by
+    identity must not be mixed with Dotty hashed by content in one set.
+
     :param dict dictionary: Any dictionary or dict-like object
     :param str separator: Character used to chain deep access.
     :param str esc_char: Escape character for separator.
     :param bool no_list: If set to True then numeric keys will NOT be converted to list indices
+    :param int cache_size: Number of values kept in read cache, 0 disables cache
+    :param bool identity_hash: If set to True then Dotty is hashed and compared by identity
+        of wrapped dict
     """
 
-    def __init__(self, dictionary, separator='.', esc_char='\\', no_list=False):
-        if not isinstance(dictionary, (Mapping, dict)):
+    __slots__ = ('_data', '_settings', '_cache', '_fingerprint', '_owned', '_views', '__weakref__')
+
+    _mutating_methods = frozenset(('clear', 'popitem', 'update'))
+
+    def __init__(self, dictionary, separator='.', esc_char='\\', no_list=False, cache_size=0,
+                 identity_hash=False):
+        if type(dictionary) is not dict and not isinstance(dictionary, (Mapping, dict)):
             raise AttributeError('Dictionary must be type of dict')
         else:
             self._data = dictionary
-        self.separator = separator
-        self.esc_char = esc_char
-        self.no_list = no_list
+        if separator == '.' and esc_char == '\\' and not no_list and not identity_hash:
+            self._settings = _default_settings
+        else:
+            self._settings = _shared_settings(separator, esc_char, bool(no_list),
+                                              bool(identity_hash))
+        self._cache = ReadCache(cache_size) if cache_size > 0 else None
+        self._fingerprint = None
+        self._owned = None
+        self._views = None
+
+    @classmethod
+    def _wrap(cls, data, settings, cache_size=0):
+        """Wrap dictionary without checking its type.
+
+        :param dict data: Dictionary to wrap
+        :param DottySettings settings: Shared settings
+        :param int cache_size: Number of values kept in read cache, 0 disables cache
+        :return: Dotty instance
+        """
+        self = cls.__new__(cls)
+        self._data = data
+        self._settings = settings
+        self._cache = ReadCache(cache_size) if cache_size > 0 else None
+        self._fingerprint = None
+        self._owned = None
+        self._views = None
+        return self
+
+    @property
+    def settings(self):
+        """Settings shared by all Dotty instances configured the same way.
+
+        :return DottySettings: Separator, escape character, no_list and identity_hash flags
+        """
+        return self._settings
+
+    @property
+    def separator(self):
+        """Character used to chain deep access."""
+        return self._settings.separator
+
+    @property
+    def esc_char(self):
+        """Escape character for separator."""
+        return self._settings.esc_char
+
+    @property
+    def no_list(self):
+        """If True then numeric keys are NOT converted to list indices."""
+        return self._settings.no_list
+
+    @property
+    def identity_hash(self):
+        """If True then Dotty is hashed and compared by identity of wrapped dict."""
+        return self._settings.identity_hash
 
     def __repr__(self):
         return 'Dotty(dictionary={}, separator={!r}, esc_char={!r})'.format(
@@ -63,44 +827,47 @@ class Dotty:
         return str(self._data)
 
     def __hash__(self):
+        if self._settings.identity_hash:
+            return hash(id(self._data))
         return hash(str(self))
 
     def __eq__(self, other):
-        try:
-            return sorted(self._data.items()) == sorted(other.items())
-        except AttributeError:
+        identity = self._settings.identity_hash
+        if isinstance(other, Dotty):
+            identity = identity or other._settings.identity_hash
+            other = other._data
+        elif not isinstance(other, (Mapping, dict)):
+            return False
+        if self._data is other:
+            return True
+        if identity:
             return False
+        try:
+            return self._data == other
+        except RecursionError:
+            return _deep_equal(self._data, other)
 
     def __len__(self):
         return len(self._data)
 
     def __getattr__(self, item):
+        if item in self._mutating_methods:
+            self._invalidate()
         return getattr(self._data, item)
 
     def __contains__(self, item):
-        def search_in(items, data):
-            """Recursively search for deep key in dict.
-
-            :param list items: List of dictionary keys
-            :param data: Portion of dictionary to operate on
-            :return bool: Predicate of key existence
-            """
-            it = items.pop(0)
-            if it.isdigit():
-                idx = int(it)
-                if idx < len(data):
-                    if items:
-                        return search_in(items, data[idx])
-                    else:
-                        return data[idx]
-                else:
-                    return False
-
-            if items and it in data:
-                return search_in(items, data[it])
-            return it in data
-
-        return search_in(self._split(item), self._data)
+        segments = self.compile(item).segments
+        try:
+            data = self._traverse(self._data, segments[:-1])
+        except (KeyError, IndexError):
+            return False
+        key = self._resolve(data, segments[-1])
+        if isinstance(data, list):
+            return isinstance(key, int) and key < len(data)
+        try:
+            return key in data
+        except TypeError:
+            return False
 
     @staticmethod
     def _find_data_type(item, data):
@@ -128,74 +895,297 @@ class Dotty:
                 pass
         return item
 
-    @lru_cache(maxsize=32)  # noqa: B019  # TODO: find a workaround for B019
     def __getitem__(self, item):
-        def get_from(items, data):
-            """Recursively get value from dictionary deep key.
-
-            :param list items: List of dictionary keys
-            :param data: Portion of dictionary to operate on
-            :return: Value from dictionary
-            :raises KeyError: If key does not exist
-            """
-            it = items.pop(0)
-            if isinstance(data, list) and it.isdigit() and not self.no_list:
-                it = int(it)
-            elif it not in data and isinstance(data, dict):
-                it = self._find_data_type(it, data)
-            elif isinstance(data, list) and ':' in it and not self.no_list:
-                # TODO: fix C417 Unnecessary use of map - use a generator expression instead.
-                list_slice = slice(*map(lambda x: None if x == '' else int(x), it.split(':')))  # noqa: C417
-                if items:
-                    return [get_from(items.copy(), x) for x in data[list_slice]]
-                else:
-                    return data[list_slice]
+        path = self.compile(item)
+        cache = self._cache
+        if cache is None or path.has_slice:
+            return self._get(path)
+        value = cache.get(path)
+        if value is _missing:
+            value = self._get(path)
+            cache.put(path, value)
+        return value
+
+    def _get(self, path):
+        return self._get_from(self._data, path.segments, 0)
+
+    def _get_from(self, data, segments, start):
+        """Get value from dictionary deep key.
+
+        List slice followed by other keys fans out into every sliced item.
+
+        :param data: Portion of dictionary to operate on
+        :param tuple segments: Compiled path segments
+        :param int start: Position of first segment to use
+        :return: Value from dictionary
+        :raises KeyError: If key does not exist
+        """
+        use_list = not self._settings.no_list
+        for pos in range(start, len(segments)):
+            key, index, list_slice = segments[pos]
+            if isinstance(data, dict):
+                try:
+                    data = data[key]
+                except KeyError:
+                    data = data[self._find_data_type(key, data)]
+            elif list_slice is not None and use_list and isinstance(data, list):
+                return self._get_sliced(_select(data, list_slice), segments, pos + 1)
+            else:
+                if index is not None and use_list and isinstance(data, list):
+                    key = index
+                try:
+                    data = data[key]
+                except TypeError:
+                    raise KeyError("List index must be an integer, got {}".format(key))
+            if data is None:
+                return None
+        return data
+
+    def _get_sliced(self, items, segments, start):
+        """Get value of remaining deep key from every sliced item.
+
+        :param items: Iterable of sliced list items
+        :param tuple segments: Compiled path segments
+        :param int start: Position of first segment to use
+        :return list: Values in order of items
+        """
+        last = len(segments) - 1
+        if start == last:
+            # single key left, plain dicts are read in place
+            key = segments[last][0]
+            return [x[key] if type(x) is dict and key in x
+                    else self._get_from(x, segments, last) for x in items]
+        if start < last:
+            return [self._get_from(x, segments, start) for x in items]
+        return list(items)
+
+    def _resolve(self, data, segment):
+        """Return key under which segment is stored in data.
+
+        :param data: Portion of dictionary to operate on
+        :param tuple segment: Compiled path segment
+        :return: List index or dictionary key
+        """
+        key, index, _ = segment
+        if isinstance(data, dict):
+            if key not in data:
+                return self._find_data_type(key, data)
+        elif isinstance(data, list) and index is not None and not self._settings.no_list:
+            return index
+        return key
+
+    def _traverse(self, data, segments):
+        """Walk data through all segments.
+
+        :param data: Portion of dictionary to operate on
+        :param tuple segments: Compiled path segments
+        :return: Value under last segment
+        :raises KeyError: If key does not exist
+        :raises IndexError: If list index is out of range
+        """
+        use_list = not self._settings.no_list
+        for key, index, _ in segments:
+            if isinstance(data, dict):
+                try:
+                    data = data[key]
+                except KeyError:
+                    data = data[self._find_data_type(key, data)]
+                continue
+            if index is not None and use_list and isinstance(data, list):
+                key = index
             try:
-                data = data[it]
+                data = data[key]
             except TypeError:
-                raise KeyError("List index must be an integer, got {}".format(it))
-            if items and data is not None:
-                return get_from(items, data)
+                raise KeyError("List index must be an integer, got {}".format(key))
+        return data
+
+    def __setitem__(self, key, value):
+        segments = self.compile(key).segments
+        self._invalidate()
+        if self._owned is not None:
+            self._own_path(segments[:-1])
+        use_list = not self._settings.no_list
+        data = self._data
+        for pos in range(len(segments) - 1):
+            it, index, _ = segments[pos]
+            in_list = isinstance(data, list) and index is not None and use_list
+            if in_list:
+                it = index
+                nested = data[it] if it < len(data) else None
             else:
-                return data
+                if isinstance(data, dict) and it not in data:
+                    it = self._find_data_type(it, data)
+                nested = data.get(it)
+
+            if not nested:
+                nested = [] if segments[pos + 1][1] is not None and use_list else {}
+                if in_list:
+                    self.set_list_index(data, it, nested)
+                else:
+                    data[it] = nested
+            data = nested
 
-        return get_from(self._split(item), self._data)
+        it = self._resolve(data, segments[-1])
+        if isinstance(data, list):
+            self.set_list_index(data, it, value)
+        else:
+            data[it] = value
 
-    def __setitem__(self, key, value):
-        def set_to(items, data):
-            """Recursively set value to dictionary deep key.
+    def _descend(self, data, segment, next_segment, undo=None):
+        """Go one level deeper into data creating missing container.
 
-            :param list items: List of dictionary keys
-            :param data: Portion of dictionary to operate on
-            """
-            it = items.pop(0)
-            if items:
+        Works the same as single step of :meth:`__setitem__`.
+        Type of created container depends on next segment.
+        List is created for list index, otherwise dictionary.
 
-                if items[0].isdigit():
-                    next_item = []
-                else:
-                    next_item = {}
-
-                if it.isdigit():
-                    it = int(it)
-                    try:
-                        if not data[it]:
-                            data[it] = next_item
-                    except IndexError:
-                        self.set_list_index(data, it, next_item)
-                    set_to(items, data[it])
-                else:
-                    if not data.get(it):
-                        data[it] = next_item
-                    set_to(items, data[it])
+        :param data: Portion of dictionary to operate on
+        :param tuple segment: Compiled path segment
+        :param tuple next_segment: Compiled path segment following segment
+        :param list undo: Journal of changes, if given
+        :return: Container under segment
+        """
+        use_list = not self._settings.no_list
+        it, index, _ = segment
+        in_list = isinstance(data, list) and index is not None and use_list
+        if in_list:
+            it = index
+            nested = data[it] if it < len(data) else None
+        else:
+            if isinstance(data, dict) and it not in data:
+                it = self._find_data_type(it, data)
+            nested = data.get(it)
+
+        if not nested:
+            nested = [] if next_segment[1] is not None and use_list else {}
+            self._store(data, it, nested, undo)
+        return nested
 
+    def _assign(self, data, segment, value, undo=None):
+        """Set value under last segment of path.
+
+        :param data: Portion of dictionary to operate on
+        :param tuple segment: Compiled path segment
+        :param Any value: Value to set
+        :param list undo: Journal of changes, if given
+        """
+        self._store(data, self._resolve(data, segment), value, undo)
+
+    def _store(self, data, it, value, undo):
+        if undo is not None:
+            if isinstance(data, list):
+                old = data[it] if isinstance(it, int) and it < len(data) else None
+                undo.append((data, it, len(data), old))
             else:
-                if it.isdigit():
-                    self.set_list_index(data, it, value)
-                else:
-                    data[it] = value
+                undo.append((data, it, it in data, data.get(it)))
+        if isinstance(data, list):
+            self.set_list_index(data, it, value)
+        else:
+            data[it] = value
 
-        set_to(self._split(key), self._data)
+    @staticmethod
+    def _rollback(undo):
+        """Revert changes recorded in journal.
+
+        :param list undo: Journal of changes
+        """
+        for data, it, state, old in reversed(undo):
+            if isinstance(data, list):
+                if isinstance(it, int) and it < state:
+                    data[it] = old
+                del data[state:]
+            elif state:
+                data[it] = old
+            else:
+                del data[it]
+
+    def set_many(self, mapping, atomic=False):
+        """Set values of many deep keys at once.
+
+        Keys are arranged in prefix tree, so common part of keys is walked
+        and missing containers are created only once. Result is the same
+        as setting keys one by one in given order, except that values
+        replaced by later keys are never written, so errors which writing
+        them would raise are not raised either.
+
+        :param mapping: Mapping or iterable of (key, value) pairs
+        :param bool atomic: If set to True then all changes are reverted when any write fails
+        """
+        if isinstance(mapping, Mapping):
+            mapping = mapping.items()
+        keys, values = [], []
+        for key, value in mapping:
+            keys.append(self.compile(key))
+            values.append(value)
+        paths = tuple(keys)
+
+        self._invalidate()
+        if self._owned is not None:
+            for path in paths:
+                self._own_path(path.segments[:-1])
+        undo = [] if atomic else None
+        try:
+            self._set_trie(_build_trie(paths), paths, values, undo)
+        except Exception:
+            if undo:
+                self._rollback(undo)
+            raise
+
+    def _set_trie(self, trie, paths, values, undo=None):
+        """Write values along prefix tree of paths.
+
+        Value of path is skipped when later path ends in the same node
+        or goes through it, because it would be replaced anyway.
+
+        :param _PathTrie trie: Prefix tree of paths
+        :param tuple paths: Compiled paths
+        :param list values: Values in order of paths
+        :param list undo: Journal of changes, if given
+        """
+        stack = [(trie, self._data, -1, 0)]
+        while stack:
+            node, data, after, depth = stack.pop()
+            for child in node.children.values():
+                floor = after
+                for position in child.ends:
+                    if position > floor:
+                        floor = position
+                if floor > after:
+                    self._assign(data, child.segment, values[floor], undo)
+
+                nested = child.through
+                if floor >= 0:
+                    nested = [p for p in nested if p > floor]
+                if nested:
+                    next_segment = paths[nested[0]].segments[depth + 1]
+                    container = self._descend(data, child.segment, next_segment, undo)
+                    stack.append((child, container, floor, depth + 1))
+
+    def deep_update(self, other):
+        """Merge other dictionary into Dotty.
+
+        Nested dictionaries are merged key by key, any other value
+        replaces current one. Like with dict .update values are not copied.
+
+        :param other: Dictionary, dict-like object or Dotty
+        """
+        self._invalidate()
+        owned = self._owned
+        stack = [(self._data, other)]
+        while stack:
+            target, source = stack.pop()
+            if isinstance(source, Dotty):
+                source = source._data
+            for key, value in source.items():
+                if isinstance(value, Dotty):
+                    value = value._data
+                current = target.get(key)
+                if isinstance(value, Mapping) and isinstance(current, Mapping):
+                    if owned is not None and current not in owned:
+                        current = target[key] = current.copy()
+                        owned.add(current)
+                    stack.append((current, value))
+                else:
+                    target[key] = value
 
     @staticmethod
     def set_list_index(data, index, value):
@@ -212,29 +1202,104 @@ class Dotty:
             data[int(index)] = value
 
     def __delitem__(self, key):
-        def del_key(items, data):
-            """Recursively remove deep key from dict.
-
-            :param list items: List of dictionary keys
-            :param data: Portion of dictionary to operate on
-            :raises KeyError: If key does not exist
-            """
-            it = items.pop(0)
-            if it.isdigit():
-                it = int(it)
-            if items:
-                del_key(items, data[it])
-            else:
-                del data[it]
-
-        del_key(self._split(key), self._data)
+        segments = self.compile(key).segments
+        self._invalidate()
+        if self._owned is not None:
+            self._own_path(segments[:-1])
+        data = self._traverse(self._data, segments[:-1])
+        it = self._resolve(data, segments[-1])
+        try:
+            del data[it]
+        except TypeError:
+            raise KeyError("List index must be an integer, got {}".format(it))
 
     def copy(self):
         """Returns a shallow copy of dictionary wrapped in Dotty.
 
+        Copy uses the same separator, escape character and other settings.
+
+        :return: Dotty instance
+        """
+        return self._clone(self._data.copy())
+
+    def snapshot(self):
+        """Returns a copy-on-write copy of Dotty.
+
+        Snapshot shares all nested dicts and lists with this Dotty.
+        Writes made through either of them with setting, deleting or popping
+        deep keys, :meth:`set_many` or :meth:`deep_update` copy only
+        containers on the way to changed key, so the other one never sees
+        the change. Snapshot uses the same settings.
+
+        Shared containers must not be changed directly, bypassing Dotty.
+        Also dicts and lists read from either of them may be shared.
+        Writes made through this Dotty replace them with copies too, so
+        nested dicts and lists read from it before are detached and do not
+        see later writes. Once snapshots and documents sharing containers
+        with this Dotty are gone, writes are made in place again.
+
+        :return: Dotty instance
+        """
+        clone = self._clone(self._data.copy())
+        _share(self, clone)
+        return clone
+
+    def _clone(self, data):
+        """Wrap data in new Dotty with the same settings.
+
+        :param dict data: Dictionary to wrap
         :return: Dotty instance
         """
-        return dotty(self._data.copy())
+        return Dotty._wrap(data, self._settings,
+                           self._cache.maxsize if self._cache is not None else 0)
+
+    def view(self, key):
+        """Returns view of nested dictionary under deep key.
+
+        View works like Dotty wrapped around nested dictionary, but it
+        shares settings and state with this Dotty. Writes made through
+        view clear read cache of this Dotty and respect its snapshots,
+        and view follows writes made through this Dotty, even when they
+        replace nested dictionary. Recently used views are cached, and so
+        are views still in use, so asking for view of the same key again
+        returns the same object.
+
+        :param str key: Single key or chain of keys
+        :raises KeyError: If key does not exist
+        :raises AttributeError: If value under key is not a dictionary
+        :return DottyView: View of nested dictionary
+        """
+        path = self.compile(key)
+        state = self._views
+        if state is not None:
+            view = state.get(path)
+            if view is not None:
+                return view
+        view = DottyView(self, path)
+        self._views.put(path, view)
+        return view
+
+    def _own_path(self, segments):
+        """Replace shared containers on the way to deep key with private copies.
+
+        Containers copied by this Dotty are remembered and not copied again.
+
+        :param tuple segments: Compiled path segments
+        """
+        owned = self._owned
+        data = self._data
+        for segment in segments:
+            try:
+                key = self._resolve(data, segment)
+                child = data[key]
+            except (KeyError, IndexError, TypeError):
+                return
+            if not isinstance(child, (dict, list)):
+                return
+            if child not in owned:
+                child = data[key] = child.copy()
+                owned.add(child)
+            data = child
 
     @staticmethod
     def fromkeys(seq, value=None):
@@ -248,6 +1313,66 @@ class Dotty:
         """
         return dotty(dict.fromkeys(seq, value))
 
+    @staticmethod
+    def from_json(data, backend=None):
+        """Create a new dictionary from json document.
+
+        New created dictionary is wrapped in Dotty.
+
+        :param data: Json document as str or bytes
+        :param str backend: Name of json backend, default backend is used if not given
+        :raises AttributeError: If json document is not an object
+        :return: Dotty instance
+        """
+        return dotty(json_backends.get_backend(backend).loads(data))
+
+    @staticmethod
+    def unflatten(items, separator='.', esc_char='\\', no_list=False):
+        """Create a new dictionary from (dotted_key, value) pairs.
+
+        Reverse of :meth:`flatten`. Structure is built in a single pass.
+        Key followed by list index creates list, which is extended
+        with None up to the highest index seen so far.
+
+        :param items: Mapping or iterable of (dotted_key, value) pairs
+        :param str separator: Character used to chain deep access.
+        :param str esc_char: Escape character for separator.
+        :param bool no_list: If set to True then numeric keys will NOT be converted to list indices
+        :raises KeyError: If key other than list index is used on list
+        :return: Dotty instance
+        """
+        if isinstance(items, Mapping):
+            items = items.items()
+        use_list = not no_list
+        root = {}
+        # siblings usually come one after another, so the container
+        # of previous key is reused without walking from root
+        cached_parent, cached = '', root
+        for key, value in items:
+            if type(key) is str and esc_char not in key:
+                parent, _, leaf = key.rpartition(separator)
+                if parent == cached_parent:
+                    keys, data = (leaf,), cached
+                else:
+                    keys, data = key.split(separator), root
+            else:
+                parent, keys, data = None, split_key(key, separator, esc_char), root
+            last = len(keys) - 1
+            for pos, k in enumerate(keys):
+                if type(data) is list:
+                    k = _extend_to(data, k)
+                if pos == last:
+                    data[k] = value
+                    cached_parent, cached = parent, data
+                    break
+                child = data[k] if type(data) is list else data.get(k)
+                if child is None:
+                    following = keys[pos + 1]
+                    is_index = type(following) is int or following.isdigit()
+                    child = data[k] = [] if use_list and is_index else {}
+                data = child
+        return Dotty(root, separator=separator, esc_char=esc_char, no_list=no_list)
+
     def get(self, key, default=None):
         """Get value from deep key or default if key does not exist.
 
@@ -263,6 +1388,169 @@ class Dotty:
         except (KeyError, IndexError):
             return default
 
+    def get_many(self, keys, default=None):
+        """Get values of many deep keys at once.
+
+        Keys are arranged in prefix tree, so common part of
+        keys like ``data.user.name`` and ``data.user.email``
+        is walked only once.
+
+        :param keys: Iterable of single keys, chains of keys or compiled paths
+        :param Any default: Default value for every deep key which does not exist
+        :return list: Values in order of given keys
+        """
+        paths = tuple(self.compile(key) for key in keys)
+        results = [default] * len(paths)
+        self._collect(self._data, _build_trie(paths), paths, results)
+        return results
+
+    def _collect(self, data, trie, paths, results):
+        """Put values of paths arranged in prefix tree into results.
+
+        Results of paths which do not exist are left untouched.
+
+        :param data: Portion of dictionary to operate on
+        :param _PathTrie trie: Prefix tree of paths
+        :param tuple paths: Compiled paths
+        :param list results: Results in order of paths
+        """
+        use_list = not self._settings.no_list
+        stack = [(trie, data, 0)]
+        while stack:
+            node, data, depth = stack.pop()
+            _fill(results, node.ends, data)
+            for child in node.children.values():
+                key, index, list_slice = child.segment
+                try:
+                    if isinstance(data, dict):
+                        value = data[key] if key in data else data[self._find_data_type(key, data)]
+                    elif isinstance(data, list) and use_list and list_slice is not None:
+                        self._collect_sliced(data, child.below, paths, depth, results)
+                        continue
+                    else:
+                        value = self._traverse(data, (child.segment,))
+                except (KeyError, IndexError):
+                    continue
+                if value is None:
+                    _fill(results, child.below, None)
+                else:
+                    stack.append((child, value, depth + 1))
+
+    def _collect_sliced(self, data, positions, paths, depth, results):
+        """Put values of paths going through list slice into results.
+
+        :param list data: Sliced list
+        :param list positions: Positions of paths going through slice
+        :param tuple paths: Compiled paths
+        :param int depth: Position of slice segment in paths
+        :param list results: Results in order of paths
+        """
+        for position in positions:
+            try:
+                results[position] = self._get_from(data, paths[position].segments, depth)
+            except (KeyError, IndexError):
+                pass
+
+    def get_many_dict(self, keys, default=None):
+        """Get values of many deep keys at once as dictionary.
+
+        Works the same as :meth:`get_many`.
+
+        :param keys: Iterable of single keys, chains of keys or compiled paths
+        :param Any default: Default value for every deep key which does not exist
+        :return dict: Given keys mapped to values
+        """
+        keys = list(keys)
+        return dict(zip(keys, self.get_many(keys, default)))
+
+    def find(self, key):
+        """Find values matching deep key with wildcards.
+
+        Star ``*`` matches any single key or list index and double
+        star ``**`` matches any chain of keys, including empty one,
+        e.g. ``items.*.price`` or ``**.id``. Literal keys, list indices,
+        slices and predicates work the same as in regular access.
+
+        Values are yielded lazily in document order. Keys which
+        do not exist are skipped. Wrapped dictionary must not be
+        changed while iterating.
+
+        :param str key: Chain of keys with wildcards or compiled path
+        :return: Generator of matching values
+        """
+        for _, value in self._find(self.compile(key), False):
+            yield value
+
+    def find_items(self, key):
+        """Find (dotted_key, value) pairs matching deep key with wildcards.
+
+        Works the same as :meth:`find`. Returned keys use separator
+        and escape character of this Dotty.
+
+        :param str key: Chain of keys with wildcards or compiled path
+        :return: Generator of (dotted_key, value) pairs
+        """
+        separator, esc_char = self.separator, self.esc_char
+        for keys, value in self._find(self.compile(key), True):
+            yield join_keys(keys, separator, esc_char), value
+
+    def _find(self, path, with_keys):
+        """Walk data matching compiled path.
+
+        Chains of keys reached more than once are yielded only once.
+
+        :param DottyPath path: Compiled path
+        :param bool with_keys: If set to True then chain of keys is tracked
+        :return: Generator of (chain of keys or None, value) pairs
+        """
+        query = _compile_query(path)
+        if sum(kind is _DEEP for kind, _ in query) > 1:
+            # different splits of chain between many ``**`` reach the same node
+            return _unique(self._match(query, True))
+        return self._match(query, with_keys)
+
+    def _match(self, query, with_keys):
+        """Walk data matching compiled query.
+
+        Stack holds iterators of pending (data, query position, keys)
+        states, so memory grows with depth of data, not with its size.
+
+        :param tuple query: Compiled query
+        :param bool with_keys: If set to True then chain of keys is tracked
+        :return: Generator of (chain of keys or None, value) pairs
+        """
+        end = len(query)
+        use_list = not self._settings.no_list
+        stack = [iter(((self._data, 0, () if with_keys else None),))]
+        while stack:
+            state = next(stack[-1], None)
+            if state is None:
+                stack.pop()
+                continue
+            data, pos, keys = state
+            while pos < end:
+                kind, segment = query[pos]
+                if kind is _ANY:
+                    stack.append(_children(data, pos + 1, keys, use_list))
+                    break
+                if kind is _DEEP:
+                    stack.append(_children(data, pos, keys, use_list))
+                    pos += 1
+                    continue
+                list_slice = segment[2]
+                if list_slice is not None and use_list and isinstance(data, list):
+                    stack.append(_sliced(data, _select_indices(data, list_slice), pos + 1, keys))
+                    break
+                try:
+                    data = self._traverse(data, (segment,))
+                except (KeyError, IndexError):
+                    break
+                if keys is not None:
+                    keys += (segment[0],)
+                pos += 1
+            else:
+                yield keys, data
+
     def pop(self, key, default=None):
         """Pop key from Dotty.
 
@@ -274,18 +1562,22 @@ class Dotty:
         :raises KeyError: If key does not exist and default has not been provided
         :return: Any or default value
         """
-
-        def pop_from(items, data):
-            it = items.pop(0)
-            if it not in data:
-                return default
-            if items:
-                data = data[it]
-                return pop_from(items, data)
-            else:
-                return data.pop(it, default)
-
-        return pop_from(self._split(key), self._data)
+        segments = self.compile(key).segments
+        self._invalidate()
+        if self._owned is not None:
+            self._own_path(segments[:-1])
+        try:
+            data = self._traverse(self._data, segments[:-1])
+        except (KeyError, IndexError):
+            return default
+        it = self._resolve(data, segments[-1])
+        if isinstance(data, list):
+            if isinstance(it, int) and it < len(data):
+                return data.pop(it)
+            return default
+        if not isinstance(data, Mapping):
+            return default
+        return data.pop(it, default)
 
     def setdefault(self, key, default=None):
         """Get key value if exist otherwise set default value under given key
@@ -304,23 +1596,272 @@ class Dotty:
             self.__setitem__(key, default)
             return default
 
-    def to_dict(self):
+    def to_dict(self, mode='deep'):
         """Return wrapped dictionary.
 
-        This method does not copy wrapped dictionary.
+        Available modes:
+
+        * ``deep`` - copy all nested dicts, lists and tuples, unwrap nested Dotty.
+          Shared and recursive references are preserved.
+        * ``shallow`` - copy top level dictionary only, unwrap Dotty values.
+        * ``view`` - return wrapped dictionary itself without copying.
 
+        :param str mode: One of ``deep``, ``shallow`` or ``view``
+        :raises ValueError: If mode is unknown
         :return dict: Wrapped dictionary
         """
-        return json.loads(self.to_json())
-
-    def to_json(self):
+        if mode == 'deep':
+            return _deep_copy(self._data)
+        if mode == 'shallow':
+            return {k: v._data if isinstance(v, Dotty) else v for k, v in self._data.items()}
+        if mode == 'view':
+            return self._data
+        raise ValueError('Unknown mode {!r}'.format(mode))
+
+    def to_json(self, backend=None):
         """Return wrapped dictionary as json string.
 
         This method does not copy wrapped dictionary.
 
+        :param str backend: Name of json backend, default backend is used if not given
         :return str: Wrapped dictionary as json string
         """
-        return json.dumps(self._data, cls=DottyEncoder)
+        return json_backends.get_backend(backend).dumps(self._data, _json_default)
+
+    def flatten(self):
+        """Iterate over (dotted_key, value) pairs of all leaves.
+
+        Leaf is a value other than dictionary or list, empty dictionary
+        or empty list. Lists are leaves too when ``no_list`` is set.
+        Keys are escaped with separator and escape character of this
+        Dotty, so :meth:`unflatten` builds the same structure back.
+        Keys which are not strings are converted to strings.
+
+        Pairs are yielded lazily in document order, memory grows only
+        with depth of the document.
+
+        :return: Generator of (dotted_key, value) pairs
+        """
+        return self._walk(None, True, True)
+
+    def walk(self, max_depth=None, leaves_only=False):
+        """Iterate over all nested values with their chains of keys.
+
+        Values are visited depth first in document order. Every dictionary
+        and list is yielded before its items, unless ``leaves_only`` is set.
+        Lists are not entered when ``no_list`` is set. Nested Dotty is
+        unwrapped.
+
+        Chain of keys is a tuple of original, not escaped keys and list
+        indices. Memory grows only with depth of the document.
+
+        :param int max_depth: Do not go deeper than given number of keys,
+            values at max depth are treated as leaves
+        :param bool leaves_only: If set to True then only leaves are yielded
+        :return: Generator of (tuple of keys, value) pairs
+        """
+        return self._walk(max_depth, leaves_only, False)
+
+    def deep_items(self, max_depth=None, leaves_only=False):
+        """Iterate over (dotted_key, value) pairs of all nested values.
+
+        Works the same as :meth:`walk`, but chains of keys are joined
+        and escaped with separator and escape character of this Dotty.
+
+        :param int max_depth: Do not go deeper than given number of keys,
+            values at max depth are treated as leaves
+        :param bool leaves_only: If set to True then only leaves are yielded
+        :return: Generator of (dotted_key, value) pairs
+        """
+        return self._walk(max_depth, leaves_only, True)
+
+    def deep_keys(self, max_depth=None, leaves_only=False):
+        """Iterate over dotted keys of all nested values.
+
+        Works the same as :meth:`deep_items`.
+
+        :param int max_depth: Do not go deeper than given number of keys,
+            values at max depth are treated as leaves
+        :param bool leaves_only: If set to True then only leaves are yielded
+        :return: Generator of dotted keys
+        """
+        for key, _ in self._walk(max_depth, leaves_only, True):
+            yield key
+
+    def _walk(self, max_depth, leaves_only, dotted):
+        """Walk nested values depth first.
+
+        Stack holds partially consumed iterators of open containers,
+        together with chain of keys leading to them.
+
+        :param int max_depth: Maximum number of keys in chain or None
+        :param bool leaves_only: If set to True then only leaves are yielded
+        :param bool dotted: If set to True then chains are joined into dotted keys
+        :return: Generator of (chain of keys, value) pairs
+        """
+        separator, esc_char = self.separator, self.esc_char
+        use_list = not self._settings.no_list
+        top = [('' if dotted else (), iter(self._data.items()), 1)]
+        stack = top if max_depth is None or max_depth > 0 else []
+        while stack:
+            prefix, items, depth = stack.pop()
+            descend = max_depth is None or depth < max_depth
+            for key, value in items:
+                # exact types first, they are by far the most common
+                kind = type(value)
+                if kind is dict:
+                    children = iter(value.items()) if descend and value else None
+                elif kind is list:
+                    children = enumerate(value) if descend and value and use_list else None
+                elif kind is str or kind is int or kind is float or value is None:
+                    children = None
+                else:
+                    value, children = _open(value, descend, use_list)
+                if not dotted:
+                    name = inner = prefix + (key,)
+                elif type(key) is str and separator not in key and esc_char not in key:
+                    name = prefix + key
+                    inner = name + separator
+                else:
+                    name, inner = _dotted_names(prefix, key, separator, esc_char)
+                if children is None:
+                    yield name, value
+                else:
+                    if not leaves_only:
+                        yield name, value
+                    stack.append((prefix, items, depth))
+                    stack.append((inner, children, depth + 1))
+                    break
+
+    def diff(self, other):
+        """Compare with other document and list differences.
+
+        Result is a list of ``add``, ``remove`` and ``change`` operations
+        which turn this document into other one when passed to
+        :meth:`apply_patch`. Dictionaries are compared key by key and lists
+        item by item, unless ``no_list`` is set. Values of different type,
+        or not equal, are reported as a single ``change`` of the whole value,
+        and so are empty dictionaries which get digit keys, as setting such
+        keys would turn them into lists.
+
+        Sub-documents shared by both sides, or equal ones, are skipped
+        without walking them, so cost depends mostly on size of changes.
+
+        :param other: Dictionary or Dotty to compare with
+        :raises AttributeError: If other is not a dictionary
+        :return list: List of DiffOp
+        """
+        if isinstance(other, Dotty):
+            other = other._data
+        if not isinstance(other, (Mapping, dict)):
+            raise AttributeError('Dictionary must be type of dict')
+        separator, esc_char = self.separator, self.esc_char
+        use_list = not self._settings.no_list
+
+        def name(prefix, key, last=True):
+            return prefix + _escape_key(key, separator, esc_char, last)
+
+        ops = []
+        stack = [('', self._data, other)] if self._data is not other else []
+        while stack:
+            prefix, old, new = stack.pop()
+            for key, value, other_value in _common_items(old, new):
+                if value is other_value:
+                    continue
+                value = value._data if isinstance(value, Dotty) else value
+                other_value = other_value._data if isinstance(other_value, Dotty) else other_value
+                kind = type(value)
+                if kind is not type(other_value):
+                    ops.append(DiffOp('change', name(prefix, key), other_value))
+                elif value == other_value:
+                    continue
+                elif _patchable(value, other_value, use_list):
+                    stack.append((name(prefix, key, False) + separator, value, other_value))
+                else:
+                    ops.append(DiffOp('change', name(prefix, key), other_value))
+            ops.extend(DiffOp(op, name(prefix, key), value)
+                       for op, key, value in _other_items(old, new))
+        return ops
+
+    def apply_patch(self, ops):
+        """Apply operations returned by :meth:`diff`.
+
+        Operations are applied in order with the same semantics as
+        setting and deleting deep keys. Added and changed values are
+        copied, so patch can be applied to many documents.
+
+        :param ops: Iterable of DiffOp or (op, key, value) triples
+        :raises ValueError: If operation is unknown
+        :raises KeyError: If removed key does not exist
+        """
+        for op, key, value in ops:
+            if op == 'remove':
+                del self[key]
+            elif op == 'add' or op == 'change':
+                self[key] = _deep_copy(value)
+            else:
+                raise ValueError('Unknown operation {!r}'.format(op))
+
+    def cache_clear(self):
+        """Clear read cache.
+
+        Call it after changing wrapped dictionary directly,
+        without going through Dotty.
+        """
+        self._invalidate()
+
+    def cache_info(self):
+        """Return read cache statistics.
+
+        :return CacheInfo: Hits, misses, maxsize and current size or None if cache is disabled
+        """
+        if self._cache is None:
+            return None
+        return self._cache.info()
+
+    def _invalidate(self):
+        if self._cache is not None:
+            self._cache.clear()
+        if self._owned is not None and not self._owned.shared():
+            self._owned = None
+        self._fingerprint = None
+        if self._views is not None:
+            self._views.generation += 1
+
+    def fingerprint(self):
+        """Return structural fingerprint of wrapped dictionary.
+
+        Fingerprint is computed once and kept until next write made
+        through Dotty. Equal documents always have equal fingerprints,
+        so documents compared many times, like snapshots, can be told
+        apart by fingerprints without comparing them. Equal fingerprints
+        do not prove documents are equal.
+
+        Like read cache, fingerprint does not track changes made directly
+        in wrapped dictionary or in containers read from Dotty, call
+        :meth:`cache_clear` after them. Equality never uses fingerprint.
+
+        :return int: Fingerprint or None if document contains reference cycle
+            or value which can not be hashed
+        """
+        if self._fingerprint is None:
+            self._fingerprint = _structural_fingerprint(self._data)
+        return self._fingerprint
+
+    def compile(self, key):
+        """Compile dot notated chain of keys into reusable path.
+
+        Compiled paths are cached, so compiling the same key
+        again is cheap. Returned path can be used with every
+        Dotty accessor in place of string key.
+
+        :param str key: Single key or chain of keys
+        :return DottyPath: Compiled path
+        """
+        if isinstance(key, DottyPath):
+            return key
+        settings = self._settings
+        return _compile(key, settings.separator, settings.esc_char)
 
     def _split(self, key):
         """Split dot notated chain of keys.
@@ -330,20 +1871,427 @@ class Dotty:
         :param str key: Single key or chain of keys
         :return list: List of keys
         """
-        if not isinstance(key, str):
-            return [key]
-        esc_stamp = (self.esc_char + self.separator, '<#esc#>')
-        skp_stamp = ('\\' + self.esc_char + self.separator, '<#skp#>' + self.separator)
+        return split_key(key, self.separator, self.esc_char)
+
+
+class _ViewState:
+    """State shared by Dotty and its views.
+
+    Generation is increased on every write made through Dotty or any of
+    its views, so views know when to find their nested dictionary again.
+    A few recently used views are kept alive, other views are held by
+    weak references, so unused views do not pile up in their root.
+    """
+
+    __slots__ = ('generation', 'views', 'recent')
+
+    recent_size = 16
+
+    def __init__(self):
+        self.generation = 0
+        self.views = weakref.WeakValueDictionary()
+        self.recent = ReadCache(self.recent_size)
+
+    def get(self, path):
+        """Get view of deep key and mark it as recently used.
+
+        :param DottyPath path: Compiled path
+        :return: View or None if there is no view of deep key
+        """
+        view = self.recent.get(path, None)
+        if view is None:
+            view = self.views.get(path)
+            if view is not None:
+                self.recent.put(path, view)
+        return view
+
+    def put(self, path, view):
+        """Remember view of deep key.
+
+        :param DottyPath path: Compiled path
+        :param Dotty view: View of nested dictionary
+        """
+        self.views[path] = view
+        self.recent.put(path, view)
+
+
+class DottyView(Dotty):
+    """View of nested dictionary of Dotty.
+
+    Views are created with :meth:`Dotty.view`. View finds its nested
+    dictionary once and again only after writes made through its root
+    Dotty or any view of it. It has no read cache of its own.
+
+    Changes made directly in wrapped dictionaries are not tracked, so
+    call :meth:`cache_clear` after them. Views of :class:`ThreadSafeDotty`
+    hold its lock. When key of view is removed or replaced with value
+    other than dictionary, access through view raises KeyError or
+    TypeError respectively.
+
+    :param Dotty root: Dotty owning nested dictionary
+    :param DottyPath prefix: Path to nested dictionary
+    :raises KeyError: If prefix does not exist
+    :raises AttributeError: If value under prefix is not a dictionary
+    """
+
+    __slots__ = ('_root', '_prefix', '_node', '_seen')
+
+    def __init__(self, root, prefix):
+        if root._views is None:
+            root._views = _ViewState()
+        self._root = root
+        self._prefix = prefix
+        self._settings = root._settings
+        self._cache = None
+        self._views = root._views
+        self._refresh()
+
+    def __repr__(self):
+        return 'DottyView(key={!r}, dictionary={})'.format(
+            join_keys(self._prefix.keys, self.separator, self.esc_char), self._data)
+
+    @property
+    def _data(self):
+        if self._seen != self._views.generation:
+            try:
+                self._refresh()
+            except AttributeError as error:
+                # AttributeError raised in property would fall back to __getattr__
+                raise TypeError(*error.args) from None
+        return self._node
+
+    @property
+    def _owned(self):
+        return self._root._owned
+
+    @property
+    def _fingerprint(self):
+        return None
+
+    def _refresh(self):
+        root = self._root
+        node = root._get_from(root._data, self._prefix.segments, 0)
+        if not isinstance(node, (Mapping, dict)):
+            raise AttributeError('Dictionary must be type of dict')
+        self._node = node
+        self._seen = self._views.generation
+
+    def _invalidate(self):
+        root = self._root
+        root._invalidate()
+        if root._owned is not None:
+            root._own_path(self._prefix.segments)
+
+    def view(self, key):
+        return self._root.view(DottyPath.from_keys(self._prefix.keys + self.compile(key).keys))
+
+    def snapshot(self):
+        """Returns a copy-on-write copy of nested dictionary.
+
+        Snapshot is taken of root Dotty, so returned view of it
+        shares containers with this view until either of them is changed.
+
+        :return DottyView: View of the same key in snapshot of root Dotty
+        """
+        return self._root.snapshot().view(self._prefix)
+
+    def fingerprint(self):
+        return _structural_fingerprint(self._data)
+
+
+_leaf_types = frozenset((str, int, float, bool, bytes, type(None)))
+
+
+def _copy_container(value, memo, refs, stack):
+    """Copy container without its items, which are copied later.
+
+    Copy is remembered in memo and pushed to stack, so its items are
+    copied too. Tuple is copied into list, which is turned into tuple
+    once all its items are copied.
+
+    :param value: Any value
+    :param dict memo: Copies of already visited containers by their id
+    :param dict refs: Places referring to unfinished tuples by their id
+    :param list stack: Copies waiting for their items to be copied
+    :return: Copy of container or value itself
+    """
+    if isinstance(value, Dotty):
+        value = value._data
+    found = memo.get(id(value))
+    if found is not None:
+        return found
+    if type(value) is dict:
+        copy = value.copy()
+    elif type(value) is list:
+        copy = value[:]
+    elif isinstance(value, Mapping):
+        copy = dict(value.items())
+    elif isinstance(value, list) or type(value) is tuple:
+        copy = list(value)
+    else:
+        return value
+    memo[id(value)] = copy
+    if type(value) is tuple:
+        refs[id(copy)] = []
+        stack.append((None, value, copy))
+    stack.append((value, None, copy))
+    return copy
+
+
+def _finish_tuple(original, copy, memo, refs):
+    """Turn copied items of tuple into tuple and put it where it belongs.
+
+    :param tuple original: Copied tuple
+    :param list copy: Copied items of tuple
+    :param dict memo: Copies of already visited containers by their id
+    :param dict refs: Places referring to unfinished tuples by their id
+    """
+    value = memo[id(original)] = tuple(copy)
+    for container, key in refs.pop(id(copy)):
+        container[key] = value
+
+
+def _copy_plain(data, originals, depth):
+    """Copy tree of plain dicts and lists with recursion.
 
-        stamp_esc = ('<#esc#>', self.separator)
-        stamp_skp = ('<#skp#>', self.esc_char)
+    Every copied container is appended to originals, so caller can tell
+    if any of them was met twice, as shared or recursive reference.
+    Gives up on tuples, Dotty objects and other containers, and on trees
+    deeper than :data:`_plain_depth`.
+
+    :param data: Dictionary or list
+    :param list originals: Already copied containers
+    :param int depth: Depth of data in copied tree
+    :return: Deep copy of data or None if data is not a tree of plain dicts and lists
+    """
+    if depth > _plain_depth:
+        return None
+    originals.append(data)
+    if type(data) is dict:
+        copy = data.copy()
+        items = data.items()
+    else:
+        copy = data[:]
+        items = enumerate(data)
+    for key, value in items:
+        kind = type(value)
+        if kind in _leaf_types:
+            continue
+        if kind is dict or kind is list:
+            value = _copy_plain(value, originals, depth + 1)
+            if value is None:
+                return None
+            copy[key] = value
+        elif isinstance(value, (Dotty, Mapping, list, tuple)):
+            return None
+    return copy
+
+
+# recursion of _copy_plain stays far below default recursion limit
+_plain_depth = 100
+
+
+def _deep_copy(data):
+    """Copy nested dicts, lists and tuples without recursion.
+
+    Nested Dotty objects are unwrapped. Every container is copied once,
+    so shared and recursive references are preserved in the copy.
+    Tuples are built after all their items are copied.
+
+    Trees of plain dicts and lists are copied by :func:`_copy_plain`
+    first. Only when it gives up, or when some container was met twice,
+    all containers are copied again with memo of copies.
+
+    :param data: Dictionary, dict-like object or any other value
+    :return: Deep copy of data
+    """
+    if type(data) is dict or type(data) is list:
+        originals = []
+        copy = _copy_plain(data, originals, 0)
+        if copy is not None and len(set(map(id, originals))) == len(originals):
+            return copy
+    memo = {}
+    refs = {}
+    stack = []
+    leaf_types = _leaf_types
+    result = _copy_container(data, memo, refs, stack)
+    while stack:
+        source, finished, copy = stack.pop()
+        if source is None:
+            _finish_tuple(finished, copy, memo, refs)
+            continue
+        items = copy.items() if type(copy) is dict else enumerate(copy)
+        for key, value in items:
+            if type(value) in leaf_types:
+                continue
+            item = _copy_container(value, memo, refs, stack)
+            if item is not value:
+                copy[key] = item
+            if id(item) in refs:
+                refs[id(item)].append((copy, key))
+    # tuple is built only after its items
+    return memo.get(id(data), result)
+
+
+def _deep_equal(first, second):
+    """Compare nested dicts, lists and tuples without recursion.
+
+    Containers are compared by length first. Pair of containers which
+    is already being compared is assumed equal, so reference cycles
+    do not loop forever. Nested Dotty objects are unwrapped.
+
+    :param first: Dictionary or dict-like object
+    :param second: Dictionary or dict-like object
+    :return bool: True if both are equal
+    """
+    seen = set()
+    stack = [(first, second)]
+    while stack:
+        first, second = stack.pop()
+        if first is second:
+            continue
+        first = first._data if isinstance(first, Dotty) else first
+        second = second._data if isinstance(second, Dotty) else second
+        pairs = _item_pairs(first, second)
+        if pairs is None:
+            if first != second:
+                return False
+            continue
+        if pairs is False:
+            return False
+        pair = (id(first), id(second))
+        if pair not in seen:
+            seen.add(pair)
+            stack.extend(pairs)
+    return True
+
+
+def _item_pairs(first, second):
+    """Pair items of two containers of the same kind.
+
+    :param first: Any value
+    :param second: Any value
+    :return: Iterable of (first item, second item) pairs, None if values
+        are not containers of the same kind, False if containers differ
+        in length or keys
+    """
+    if isinstance(first, (dict, Mapping)) and isinstance(second, (dict, Mapping)):
+        if len(first) != len(second):
+            return False
+        try:
+            return [(value, second[key]) for key, value in first.items()]
+        except KeyError:
+            return False
+    if (isinstance(first, list) and isinstance(second, list)) or \
+            (isinstance(first, tuple) and isinstance(second, tuple)):
+        if len(first) != len(second):
+            return False
+        return zip(first, second)
+    return None
 
-        key = key.replace(*skp_stamp).replace(*esc_stamp)
-        keys = key.split(self.separator)
-        for i, k in enumerate(keys):
-            keys[i] = k.replace(*stamp_esc).replace(*stamp_skp)
 
-        return keys
+_FINGERPRINT_MASK = (1 << 64) - 1
+
+
+def _structural_fingerprint(data):
+    """Compute hash of nested dicts, lists and tuples without recursion.
+
+    Scalars contribute their hash, so values equal to each other like
+    ``1`` and ``1.0`` give the same fingerprint. Items of dictionaries
+    and other mappings are combined regardless of order, items of lists,
+    other mutable sequences and tuples in order. Sets contribute hash of
+    frozen set, so equal sets and frozen sets give the same fingerprint.
+
+    :param data: Dictionary or dict-like object
+    :return int: Fingerprint or None if data contains reference cycle
+        or value which can not be hashed
+    """
+    active = set()
+    frames = []     # open containers: [is_dict, items, accumulator, hash of key, id]
+    try:
+        result = _enter_fingerprint(data, frames, active)
+        while frames:
+            frame = frames[-1]
+            if result is not None:
+                if frame[0]:
+                    frame[2] = (frame[2] + hash((frame[3], result))) & _FINGERPRINT_MASK
+                else:
+                    frame[2] = (frame[2] * 1000003 ^ result) & _FINGERPRINT_MASK
+            result = _fingerprint_items(frame, frames, active)
+    except (RecursionError, TypeError):
+        return None
+    return result
+
+
+def _enter_fingerprint(value, frames, active):
+    """Open frame of container or return hash of other value.
+
+    :param value: Any value
+    :param list frames: Open containers
+    :param set active: Ids of open containers
+    :raises RecursionError: If container is already open
+    :raises TypeError: If value can not be hashed
+    :return int: Hash of value or None if container was opened
+    """
+    if isinstance(value, Dotty):
+        value = value._data
+    if isinstance(value, (dict, Mapping)):
+        frame = [True, iter(value.items()), 1, None, id(value)]
+    elif isinstance(value, bytearray):
+        return hash(bytes(value))
+    elif isinstance(value, (list, tuple, MutableSequence)):
+        frame = [False, iter(value), 3 if isinstance(value, tuple) else 2, None, id(value)]
+    elif isinstance(value, (set, frozenset)):
+        return hash(frozenset(value))
+    else:
+        return hash(value)
+    if frame[4] in active:
+        raise RecursionError
+    active.add(frame[4])
+    frames.append(frame)
+    return None
+
+
+def _fingerprint_items(frame, frames, active):
+    """Combine hashes of container items until nested container is opened.
+
+    :param list frame: Frame of container
+    :param list frames: Open containers
+    :param set active: Ids of open containers
+    :return int: Hash of container or None if nested container was opened
+    """
+    is_dict, acc = frame[0], frame[2]
+    for item in frame[1]:
+        if is_dict:
+            key_hash = frame[3] = hash(item[0])
+            item = item[1]
+        kind = type(item)
+        if kind is str or kind is int or kind is float or kind is bool or item is None:
+            value = hash(item)
+        else:
+            frame[2] = acc
+            value = _enter_fingerprint(item, frames, active)
+            if value is None:
+                return None
+        if is_dict:
+            acc = (acc + hash((key_hash, value))) & _FINGERPRINT_MASK
+        else:
+            acc = (acc * 1000003 ^ value) & _FINGERPRINT_MASK
+    frames.pop()
+    active.discard(frame[4])
+    return acc
+
+
+def _json_default(obj):
+    """Unwrap nested Dotty for json backends.
+
+    :param obj: Object not serializable by backend
+    :raises TypeError: If object is not Dotty
+    :return dict: Wrapped dictionary
+    """
+    if isinstance(obj, Dotty):
+        return obj._data
+    raise TypeError('Object of type {} is not JSON serializable'.format(type(obj).__name__))
 
 
 class DottyEncoder(json.JSONEncoder):
@@ -356,7 +2304,7 @@ class DottyEncoder(json.JSONEncoder):
 
         :return: Serializable data
         """
-        if hasattr(obj, '_data'):
+        if isinstance(obj, Dotty):
             return obj._data
         else:
             return json.JSONEncoder.default(self, obj)
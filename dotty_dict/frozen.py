@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Immutable Dotty with structural sharing.
+
+Every change returns a new document. Only containers on the way to
+changed key are copied, all the other ones are shared between old and
+new document. Documents are never changed in place, so they can be
+shared between threads without locking.
+"""
+try:
+    from collections.abc import Mapping
+except ImportError:  # pragma: no cover
+    from collections import Mapping
+
+from dotty_dict.dotty_dict import Dotty, _deep_copy, _leaf_types, _Ownership, _ViewState
+
+__author__ = 'Pawel Zadrozny'
+__copyright__ = 'Copyright (c) 2017, Pawel Zadrozny'
+
+
+class FrozenDotty(Dotty):
+    """Immutable dictionary wrapper.
+
+    Supports the same dot notation, list indices, slices and predicates
+    as Dotty. Setting, deleting and popping keys raises TypeError,
+    use :meth:`set` and :meth:`delete` which return new document instead.
+
+    Given dictionary is deeply copied, so later changes made in it do not
+    affect frozen document. Values read from document are shared with it
+    and must not be changed in place.
+
+    Hash is computed from content once and cached, so frozen documents
+    can be used as dictionary keys and set members.
+
+    :param dict dictionary: Any dictionary or dict-like object
+    :param str separator: Character used to chain deep access.
+    :param str esc_char: Escape character for separator.
+    :param bool no_list: If set to True then numeric keys will NOT be converted to list indices
+    """
+
+    __slots__ = ()
+
+    def __init__(self, dictionary, separator='.', esc_char='\\', no_list=False):
+        super(FrozenDotty, self).__init__(dictionary, separator=separator, esc_char=esc_char,
+                                          no_list=no_list)
+        self._data = _deep_copy(dictionary)
+
+    def __repr__(self):
+        return 'FrozenDotty(dictionary={}, separator={!r}, esc_char={!r})'.format(
+            self._data, self.separator, self.esc_char)
+
+    def __hash__(self):
+        fingerprint = self.fingerprint()
+        return 0 if fingerprint is None else fingerprint
+
+    def __getattr__(self, item):
+        if item in self._mutating_methods:
+            raise AttributeError('FrozenDotty is immutable, use set or delete instead of {}'.format(
+                item))
+        return getattr(self._data, item)
+
+    def __setitem__(self, key, value):
+        raise TypeError('FrozenDotty is immutable, use set instead')
+
+    def __delitem__(self, key):
+        raise TypeError('FrozenDotty is immutable, use delete instead')
+
+    def pop(self, key, default=None):
+        raise TypeError('FrozenDotty is immutable, use delete instead')
+
+    def setdefault(self, key, default=None):
+        raise TypeError('FrozenDotty is immutable, use set instead')
+
+    def set_many(self, mapping, atomic=False):
+        raise TypeError('FrozenDotty is immutable, use set instead')
+
+    def deep_update(self, other):
+        raise TypeError('FrozenDotty is immutable, use set instead')
+
+    def apply_patch(self, ops):
+        raise TypeError('FrozenDotty is immutable, use set instead')
+
+    def set(self, key, value):
+        """Return new document with value set under deep key.
+
+        Missing containers are created and list indices are handled
+        the same as when setting key in Dotty. Value is deeply copied.
+
+        :param str key: Single key, chain of keys or compiled path
+        :param Any value: Value to set
+        :return FrozenDotty: New document
+        """
+        if type(value) not in _leaf_types:
+            value = _deep_copy(value)
+        new = self._derive()
+        Dotty.__setitem__(new, key, value)
+        new._owned = None
+        return new
+
+    def delete(self, key):
+        """Return new document without deep key.
+
+        :param str key: Single key, chain of keys or compiled path
+        :raises KeyError: If key does not exist
+        :return FrozenDotty: New document
+        """
+        new = self._derive()
+        Dotty.__delitem__(new, key)
+        new._owned = None
+        return new
+
+    def copy(self):
+        """Return the same document, as it can not be changed anyway.
+
+        :return FrozenDotty: This document
+        """
+        return self
+
+    def view(self, key):
+        """Return frozen document of nested dictionary under deep key.
+
+        Returned document shares all containers with this one, so it is
+        created without copying. Recently used views are cached, and so
+        are views still in use, so asking for view of the same key again
+        returns the same object.
+
+        :param str key: Single key or chain of keys
+        :raises KeyError: If key does not exist
+        :raises AttributeError: If value under key is not a dictionary
+        :return FrozenDotty: Frozen nested document
+        """
+        path = self.compile(key)
+        if self._views is None:
+            self._views = _ViewState()
+        view = self._views.get(path)
+        if view is None:
+            node = self[path]
+            if not isinstance(node, (Mapping, dict)):
+                raise AttributeError('Dictionary must be type of dict')
+            view = FrozenDotty._wrap(node, self._settings)
+            self._views.put(path, view)
+        return view
+
+    def thaw(self):
+        """Return mutable Dotty sharing containers with this document.
+
+        Writes made through returned Dotty copy containers on the way
+        to changed key, the same way as :meth:`Dotty.snapshot` does.
+
+        :return: Dotty instance
+        """
+        clone = self._clone(self._data.copy())
+        clone._owned = _Ownership(clone._data, None)
+        return clone
+
+    snapshot = thaw
+
+    def _derive(self):
+        """Create new document sharing all containers but the root one.
+
+        Returned document copies containers on its first write.
+
+        :return FrozenDotty: New document
+        """
+        new = FrozenDotty._wrap(self._data.copy(), self._settings)
+        new._owned = _Ownership(new._data, None)
+        return new
@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""JSON serializers used by Dotty.
+
+Standard library :mod:`json` is always available. Faster libraries
+``orjson``, ``msgspec`` and ``ujson`` are used when installed.
+
+Backend ``auto`` picks the fastest installed library and falls back
+to standard library when it can not handle given data, for example
+integers too large for 64 bits.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+__author__ = 'Pawel Zadrozny'
+__copyright__ = 'Copyright (c) 2017, Pawel Zadrozny'
+
+
+class JSONBackend:
+    """JSON serializer and parser pair.
+
+    :param str name: Name of backend
+    :param dumps: Function taking object and default hook, returning json string
+    :param loads: Function taking json string or bytes, returning object
+    """
+
+    def __init__(self, name, dumps, loads):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self):
+        return 'JSONBackend(name={!r})'.format(self.name)
+
+
+def _json_dumps(obj, default):
+    return json.dumps(obj, default=default)
+
+
+def _orjson_dumps(obj, default):
+    return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+
+def _msgspec_dumps(obj, default):
+    return msgspec.json.encode(obj, enc_hook=default).decode('utf-8')
+
+
+def _ujson_dumps(obj, default):
+    return ujson.dumps(obj, default=default, ensure_ascii=True)
+
+
+_backends = {'json': JSONBackend('json', _json_dumps, json.loads)}
+if orjson is not None:
+    _backends['orjson'] = JSONBackend('orjson', _orjson_dumps, orjson.loads)
+if msgspec is not None:
+    _backends['msgspec'] = JSONBackend('msgspec', _msgspec_dumps, msgspec.json.decode)
+if ujson is not None:
+    _backends['ujson'] = JSONBackend('ujson', _ujson_dumps, ujson.loads)
+
+_preference = ('orjson', 'msgspec', 'ujson', 'json')
+
+
+def _with_fallback(backend):
+    if backend.name == 'json':
+        return backend
+    fallback = _backends['json']
+
+    def dumps(obj, default):
+        try:
+            return backend.dumps(obj, default)
+        except (TypeError, ValueError, OverflowError):
+            return fallback.dumps(obj, default)
+
+    def loads(data):
+        try:
+            return backend.loads(data)
+        except (TypeError, ValueError, OverflowError):
+            return fallback.loads(data)
+
+    return JSONBackend('auto:' + backend.name, dumps, loads)
+
+
+_backends['auto'] = _with_fallback(next(_backends[n] for n in _preference if n in _backends))
+_default = _backends['json']
+
+
+def available_backends():
+    """Return names of installed backends.
+
+    :return list: Backend names
+    """
+    return sorted(_backends)
+
+
+def get_backend(name=None):
+    """Return backend by name.
+
+    :param str name: Backend name, if not given default backend is returned
+    :raises ValueError: If backend is unknown or not installed
+    :return JSONBackend: Backend
+    """
+    if name is None:
+        return _default
+    if isinstance(name, JSONBackend):
+        return name
+    try:
+        return _backends[name]
+    except KeyError:
+        raise ValueError('JSON backend {!r} is not available, choose one of: {}'.format(
+            name, ', '.join(available_backends())))
+
+
+def set_default_backend(name):
+    """Set backend used by Dotty when no backend is given explicitly.
+
+    :param str name: Backend name
+    :raises ValueError: If backend is unknown or not installed
+    """
+    global _default
+    _default = get_backend(name)
@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Read-only Dotty over memory-mapped json document.
+
+Document is not parsed as a whole. Offsets of keys and list items are
+indexed when container is accessed for the first time, and only the
+requested values are decoded. Pages of memory-mapped file are shared
+by all processes reading the same file.
+"""
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+import json
+import mmap
+import re
+
+from dotty_dict.dotty_dict import ReadCache, _compile, _escape_key, _missing
+
+__author__ = 'Pawel Zadrozny'
+__copyright__ = 'Copyright (c) 2017, Pawel Zadrozny'
+
+WHITESPACE_RE = re.compile(rb'[ \t\n\r]*')
+STRING_RE = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+SCALAR_RE = re.compile(rb'[^,\]}\s]+')
+TOKEN_RE = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|([\[{])|([\]}])')
+
+
+class MappedDotty(Mapping):
+    """Read-only Dotty over json file mapped into memory.
+
+    Supports the same dot notation, list indices, slices and predicates as Dotty.
+    Any attempt to change document raises TypeError. Separators in top level
+    keys are escaped when iterating, so every key can be used to get its value.
+
+    :param str path: Path to json file with object at top level
+    :param str separator: Character used to chain deep access.
+    :param str esc_char: Escape character for separator.
+    :param bool no_list: If set to True then numeric keys will NOT be converted to list indices
+    :param int cache_size: Number of decoded values kept in cache, 0 disables cache
+    :raises AttributeError: If document is not json object
+    """
+
+    def __init__(self, path, separator='.', esc_char='\\', no_list=False, cache_size=0):
+        self.separator = separator
+        self.esc_char = esc_char
+        self.no_list = no_list
+        self._cache = ReadCache(cache_size) if cache_size > 0 else None
+        self._children = {}
+        with open(path, 'rb') as fp:
+            self._buf = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        start = WHITESPACE_RE.match(self._buf, 0).end()
+        if self._buf[start:start + 1] != b'{':
+            self.close()
+            raise AttributeError('Dictionary must be type of dict')
+        self._root = start
+        self._index(start)
+
+    def __repr__(self):
+        return 'MappedDotty(separator={!r}, esc_char={!r})'.format(self.separator, self.esc_char)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Unmap json file."""
+        self._buf.close()
+
+    def __len__(self):
+        return len(self._index(self._root))
+
+    def __iter__(self):
+        # keys are escaped, so they can be passed back to __getitem__
+        separator, esc_char = self.separator, self.esc_char
+        for key in self._index(self._root):
+            yield _escape_key(key, separator, esc_char) if separator in key else key
+
+    def __getitem__(self, key):
+        path = _compile(key, self.separator, self.esc_char)
+        cache = self._cache
+        if cache is None or path.has_slice:
+            return self._get_from(self._root, path.segments, 0)
+        value = cache.get(path)
+        if value is _missing:
+            value = self._get_from(self._root, path.segments, 0)
+            cache.put(path, value)
+        return value
+
+    def __contains__(self, key):
+        segments = _compile(key, self.separator, self.esc_char).segments
+        node = self._root
+        try:
+            for segment in segments:
+                node = self._step(node, segment)
+        except (KeyError, IndexError):
+            return False
+        return True
+
+    def __setitem__(self, key, value):
+        raise TypeError('MappedDotty is read-only')
+
+    def __delitem__(self, key):
+        raise TypeError('MappedDotty is read-only')
+
+    def get(self, key, default=None):
+        """Get value from deep key or default if key does not exist.
+
+        :param str key: Single key or chain of keys
+        :param Any default: Default value if deep key does not exist
+        :return: Any or default value
+        """
+        try:
+            return self[key]
+        except (KeyError, IndexError):
+            return default
+
+    def to_dict(self):
+        """Decode whole document.
+
+        :return dict: Decoded document
+        """
+        return self._decode(self._root)
+
+    def _get_from(self, node, segments, start):
+        """Get decoded value under deep key.
+
+        :param int node: Offset of value to start from
+        :param tuple segments: Compiled path segments
+        :param int start: Position of first segment to use
+        :return: Decoded value
+        :raises KeyError: If key does not exist
+        """
+        buf = self._buf
+        last = len(segments) - 1
+        for pos in range(start, last + 1):
+            segment = segments[pos]
+            if segment[2] is not None and not self.no_list and buf[node:node + 1] == b'[':
+                items = self._index(node)
+                if type(segment[2]) is slice:
+                    items = items[segment[2]]
+                else:
+                    items = [item for item in items if self._test(item[0], segment[2])]
+                if pos < last:
+                    return [self._get_from(item[0], segments, pos + 1) for item in items]
+                return [self._decode(item[0]) for item in items]
+            node = self._step(node, segment)
+            if buf[node:node + 4] == b'null':
+                return None
+        return self._decode(node)
+
+    def _test(self, node, predicate):
+        """Check predicate against list item without decoding whole item.
+
+        :param int node: Offset of list item
+        :param Predicate predicate: Condition on field of item
+        :return bool: True if item matches
+        """
+        if self._buf[node:node + 1] != b'{':
+            return False
+        field = self._index(node).get(predicate.field)
+        if field is None:
+            return predicate.test(False, None)
+        return predicate.test(True, self._decode(field[0]))
+
+    def _step(self, node, segment):
+        """Return offset of value one level deeper.
+
+        :param int node: Offset of container
+        :param tuple segment: Compiled path segment
+        :return int: Offset of value under segment
+        :raises KeyError: If key does not exist
+        :raises IndexError: If list index is out of range
+        """
+        kind = self._buf[node:node + 1]
+        key, index, _ = segment
+        if kind == b'{':
+            return self._index(node)[str(key)][0]
+        if kind == b'[' and index is not None and not self.no_list:
+            return self._index(node)[index][0]
+        raise KeyError("List index must be an integer, got {}".format(key))
+
+    def _decode(self, node):
+        return json.loads(self._buf[node:self._end(node)].decode('utf-8'))
+
+    def _end(self, node):
+        """Return offset right after value starting at node.
+
+        :param int node: Offset of value
+        :return int: End offset
+        """
+        buf = self._buf
+        char = buf[node:node + 1]
+        if char == b'"':
+            match = STRING_RE.match(buf, node)
+        elif char == b'{' or char == b'[':
+            depth = 0
+            for match in TOKEN_RE.finditer(buf, node):
+                if match.lastindex == 1:
+                    depth += 1
+                elif match.lastindex == 2:
+                    depth -= 1
+                    if not depth:
+                        return match.end()
+            match = None
+        else:
+            match = SCALAR_RE.match(buf, node)
+        if match is None:
+            raise json.JSONDecodeError('Unterminated value', '', node)
+        return match.end()
+
+    def _index(self, node):
+        """Return offsets of container items.
+
+        Index is built on first access and kept for later use.
+
+        :param int node: Offset of container
+        :return: Dictionary of keys or list of (start, end) offsets
+        """
+        children = self._children.get(node)
+        if children is not None:
+            return children
+
+        buf = self._buf
+        is_map = buf[node:node + 1] == b'{'
+        close = b'}' if is_map else b']'
+        children = {} if is_map else []
+        pos = WHITESPACE_RE.match(buf, node + 1).end()
+        if buf[pos:pos + 1] != close:
+            while True:
+                if is_map:
+                    key, pos = self._key(pos)
+                end = self._end(pos)
+                if is_map:
+                    children[key] = (pos, end)
+                else:
+                    children.append((pos, end))
+                pos = WHITESPACE_RE.match(buf, end).end()
+                char = buf[pos:pos + 1]
+                if char == close:
+                    break
+                if char != b',':
+                    raise json.JSONDecodeError("Expecting ',' delimiter", '', pos)
+                pos = WHITESPACE_RE.match(buf, pos + 1).end()
+        self._children[node] = children
+        return children
+
+    def _key(self, pos):
+        """Decode key of dictionary item.
+
+        :param int pos: Offset of key
+        :return tuple: Decoded key and offset of its value
+        """
+        buf = self._buf
+        match = STRING_RE.match(buf, pos)
+        if match is None:
+            raise json.JSONDecodeError(
+                'Expecting property name enclosed in double quotes', '', pos)
+        key = match.group()
+        key = json.loads(key.decode('utf-8')) if b'\\' in key else key[1:-1].decode('utf-8')
+        pos = WHITESPACE_RE.match(buf, match.end()).end()
+        if buf[pos:pos + 1] != b':':
+            raise json.JSONDecodeError("Expecting ':' delimiter", '', pos)
+        return key, WHITESPACE_RE.match(buf, pos + 1).end()
@@ -0,0 +1,475 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Streaming json loader.
+
+Json document is read from file-like object in chunks and parsed
+incrementally, so only selected parts of the document are kept in memory.
+
+Selected paths use the same dot notation as Dotty. Star ``*`` matches
+any single key or list index, e.g. ``data.items.*.id``.
+"""
+import codecs
+import json
+import re
+from json.decoder import scanstring
+
+from dotty_dict.dotty_dict import Dotty, join_keys, split_key
+
+__author__ = 'Pawel Zadrozny'
+__copyright__ = 'Copyright (c) 2017, Pawel Zadrozny'
+
+NUMBER_RE = re.compile(r'(-?(?:0|[1-9]\d*))(\.\d+)?([eE][-+]?\d+)?')
+NUMBER_CHARS_RE = re.compile(r'[0-9+\-.eE]*')
+WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+SKIP_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|"|[\[\]{}]')
+LITERALS = (('true', True), ('false', False), ('null', None))
+
+_full, _prefix, _none = 'full', 'prefix', 'none'
+_OPENING = {'{': ('start_map', 'end_map', '}'), '[': ('start_array', 'end_array', ']')}
+_CLOSING = {'}': 'end_map', ']': 'end_array'}
+
+
+class _Reader:
+    """Buffered reader of text or binary file-like object.
+
+    :param fp: File-like object with read method
+    :param int chunk_size: Number of characters or bytes read at once
+    """
+
+    def __init__(self, fp, chunk_size):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = None
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.offset = 0         # characters dropped from buffer
+        self.lines = 0          # line breaks dropped from buffer
+        self.line_start = 0     # position of first character of current line
+
+    def fill(self):
+        """Read next chunk into buffer.
+
+        Already consumed part of buffer is dropped.
+
+        :return bool: False if there is nothing more to read
+        """
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        if isinstance(chunk, bytes):
+            if self.decoder is None:
+                self.decoder = codecs.getincrementaldecoder('utf-8')()
+            text = self.decoder.decode(chunk, final=not chunk)
+        else:
+            text = chunk or ''
+        if not chunk:
+            self.eof = True
+        lines = self.buf.count('\n', 0, self.pos)
+        if lines:
+            self.lines += lines
+            self.line_start = self.offset + self.buf.rfind('\n', 0, self.pos) + 1
+        self.offset += self.pos
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+        return bool(chunk)
+
+    def error(self, msg, pos=None):
+        """Return error at position of buffer.
+
+        Position, line and column of error are counted from the start of
+        document, not from the start of buffer.
+
+        :param str msg: Error message
+        :param int pos: Position in buffer, current position by default
+        :return json.JSONDecodeError: Error to raise
+        """
+        pos = self.pos if pos is None else pos
+        lineno = self.lines + self.buf.count('\n', 0, pos) + 1
+        newline = self.buf.rfind('\n', 0, pos)
+        if newline < 0:
+            colno = self.offset + pos - self.line_start + 1
+        else:
+            colno = pos - newline
+        error = json.JSONDecodeError(msg, self.buf, pos)
+        error.pos, error.lineno, error.colno = self.offset + pos, lineno, colno
+        error.args = ('{}: line {} column {} (char {})'.format(msg, lineno, colno, error.pos),)
+        return error
+
+    def next_char(self):
+        """Skip whitespaces and return next character without consuming it.
+
+        :return str: Next character or empty string at the end of input
+        """
+        while True:
+            pos = self.pos = WHITESPACE_RE.match(self.buf, self.pos).end()
+            if pos < len(self.buf):
+                return self.buf[pos]
+            if not self.fill():
+                return ''
+
+    def read_string(self):
+        while True:
+            try:
+                value, self.pos = scanstring(self.buf, self.pos + 1)
+                return value
+            except json.JSONDecodeError as error:
+                if self.eof:
+                    raise self.error(error.msg, error.pos)
+                self.fill()
+
+    def read_number(self):
+        while True:
+            end = NUMBER_CHARS_RE.match(self.buf, self.pos).end()
+            if end < len(self.buf) or self.eof:
+                break
+            self.fill()
+        match = NUMBER_RE.match(self.buf, self.pos, end)
+        if match is None or match.end() != end:
+            raise self.error('Expecting value')
+        integer, frac, exp = match.groups()
+        self.pos = end
+        if frac or exp:
+            return float(integer + (frac or '') + (exp or ''))
+        return int(integer)
+
+    def read_value(self, char):
+        """Read scalar value starting with given character.
+
+        :param str char: Next character
+        :return: String, number, boolean or None
+        """
+        if char == '"':
+            return self.read_string()
+        if char == '-' or char.isdigit():
+            return self.read_number()
+        if char:
+            return self.read_literal()
+        raise self.error('Expecting value')
+
+    def read_literal(self):
+        while len(self.buf) - self.pos < 5 and not self.eof:
+            self.fill()
+        for name, value in LITERALS:
+            if self.buf.startswith(name, self.pos):
+                self.pos += len(name)
+                return value
+        raise self.error('Expecting value')
+
+    def skip_container(self):
+        """Move past the end of container which has just been opened.
+
+        Skipped part is only checked for balanced brackets and strings.
+        """
+        depth = 1
+        while depth:
+            match = SKIP_RE.search(self.buf, self.pos)
+            if match is None or match.group() == '"':
+                self.pos = len(self.buf) if match is None else match.start()
+                if self.eof:
+                    raise self.error('Unterminated container')
+                self.fill()
+                continue
+            self.pos = match.end()
+            token = match.group()
+            if token == '[' or token == '{':
+                depth += 1
+            elif token == ']' or token == '}':
+                depth -= 1
+
+
+def iter_events(fp, chunk_size=65536):
+    """Parse json document and yield parser events.
+
+    Events are pairs of name and value. Names are ``start_map``, ``end_map``,
+    ``start_array``, ``end_array``, ``key`` and ``value``. Only ``key`` and
+    ``value`` events carry value, other have None.
+
+    Sending True into generator right after ``start_map`` or ``start_array``
+    skips the whole container without parsing it. Next event is the one
+    following the end of skipped container.
+
+    :param fp: File-like object opened in text or binary mode
+    :param int chunk_size: Number of characters or bytes read at once
+    :raises json.JSONDecodeError: If document is not valid json
+    """
+    reader = _Reader(fp, chunk_size)
+    stack = []
+    expect_value = True
+    while True:
+        char = reader.next_char()
+        if expect_value:
+            container = _OPENING.get(char)
+            if container is None:
+                yield 'value', reader.read_value(char)
+                expect_value = False
+                continue
+            start, end, closing = container
+            reader.pos += 1
+            if (yield start, None):
+                reader.skip_container()
+            elif reader.next_char() == closing:
+                reader.pos += 1
+                yield end, None
+            else:
+                stack.append(closing)
+                if closing == '}':
+                    yield 'key', _read_key(reader)
+                continue
+            expect_value = False
+            continue
+
+        if not stack:
+            if char:
+                raise reader.error('Extra data')
+            return
+        event = _read_delimiter(reader, char, stack)
+        expect_value = char == ','
+        if event is not None:
+            yield event
+
+
+def _read_delimiter(reader, char, stack):
+    """Consume comma or end of container following value.
+
+    :param _Reader reader: Reader positioned at delimiter
+    :param str char: Next character
+    :param list stack: Closing brackets of open containers
+    :return: Key event following comma in dictionary, end event or None
+    """
+    if char == ',':
+        reader.pos += 1
+        if stack[-1] == '}':
+            return 'key', _read_key(reader)
+        return None
+    if char != stack[-1]:
+        raise reader.error("Expecting ',' delimiter")
+    reader.pos += 1
+    stack.pop()
+    return _CLOSING[char], None
+
+
+def _read_key(reader):
+    if reader.next_char() != '"':
+        raise reader.error('Expecting property name enclosed in double quotes')
+    key = reader.read_string()
+    if reader.next_char() != ':':
+        raise reader.error("Expecting ':' delimiter")
+    reader.pos += 1
+    return key
+
+
+def _compile_patterns(paths, separator, esc_char):
+    if paths is None:
+        return None
+    if isinstance(paths, str):
+        paths = [paths]
+    return [tuple(split_key(path, separator, esc_char)) for path in paths]
+
+
+def _match(patterns, keys):
+    """Check how chain of keys matches selected paths.
+
+    :param list patterns: Split selected paths
+    :param list keys: Current chain of keys
+    :return str: Full match, prefix of selected path or no match
+    """
+    result = _none
+    depth = len(keys)
+    for pattern in patterns:
+        if len(pattern) < depth:
+            continue
+        for want, key in zip(pattern, keys):
+            if want != '*' and want != str(key):
+                break
+        else:
+            if len(pattern) == depth:
+                return _full
+            result = _prefix
+    return result
+
+
+def _select(patterns, frames, event):
+    """Check how value starting with event matches selected paths.
+
+    :param list patterns: Split selected paths or None
+    :param list frames: Open containers
+    :param str event: Event starting value
+    :return str: Full match, prefix of selected path or no match
+    """
+    if patterns is None:
+        return _full if event == 'value' else _prefix
+    return _match(patterns, [f[1] for f in frames])
+
+
+def _iter_nodes(fp, patterns, chunk_size):
+    """Yield selected nodes of json document.
+
+    When patterns are None every leaf is selected. Leaf is a scalar value,
+    empty dictionary or empty list.
+
+    :param fp: File-like object opened in text or binary mode
+    :param list patterns: Split selected paths or None
+    :param int chunk_size: Number of characters or bytes read at once
+    :return: Generator of (chain of keys, kinds of containers) and value pairs
+    """
+    frames = []     # open containers: [is_array, current key, number of children]
+    build = []      # containers of selected value being built
+    events = iter_events(fp, chunk_size)
+    skip = None
+
+    while True:
+        try:
+            event, value = events.send(skip)
+        except StopIteration:
+            return
+        skip = None
+
+        if event == 'end_map' or event == 'end_array':
+            node = _close_container(frames, build, patterns, event)
+            if node is not None:
+                yield node
+            continue
+
+        # key and events starting new value
+        if _add_event(frames, build, event, value):
+            continue
+
+        status = _select(patterns, frames, event)
+        if status == _none:
+            skip = True
+        elif event != 'value':
+            _open_container(frames, build, event, status == _full)
+        elif status == _full:
+            yield _node(frames), value
+
+
+def _close_container(frames, build, patterns, event):
+    """Close container and return selected node completed by it.
+
+    :param list frames: Open containers
+    :param list build: Containers of selected value being built
+    :param list patterns: Split selected paths or None
+    :param str event: End event of container
+    :return: Pair of node and value or None
+    """
+    frame = frames.pop()
+    if build:
+        done = build.pop()
+        if not build:
+            return _node(frames), done
+    elif patterns is None and frame[2] == 0:
+        return _node(frames), {} if event == 'end_map' else []
+    return None
+
+
+def _add_event(frames, build, event, value):
+    """Track key or new value in its container.
+
+    New value is added to value being built, if any.
+
+    :param list frames: Open containers
+    :param list build: Containers of selected value being built
+    :param str event: Key event or event starting value
+    :param value: Value of key or value event
+    :return bool: True if event is key or part of value being built
+    """
+    if event == 'key':
+        frames[-1][1] = value
+        return True
+    if frames:
+        frame = frames[-1]
+        if frame[0]:
+            frame[1] = frame[2]
+        frame[2] += 1
+    if not build:
+        return False
+    child = value if event == 'value' else {} if event == 'start_map' else []
+    parent = build[-1]
+    if isinstance(parent, list):
+        parent.append(child)
+    else:
+        parent[frames[-1][1]] = child
+    if event != 'value':
+        build.append(child)
+        frames.append([event == 'start_array', None, 0])
+    return True
+
+
+def _open_container(frames, build, event, selected):
+    """Open container which is selected or may contain selected values.
+
+    :param list frames: Open containers
+    :param list build: Containers of selected value being built
+    :param str event: Start event of container
+    :param bool selected: If set to True then container is built as selected value
+    """
+    frames.append([event == 'start_array', None, 0])
+    if selected:
+        build.append({} if event == 'start_map' else [])
+
+
+def _node(frames):
+    """Return chain of keys and kinds of containers leading to value.
+
+    :param list frames: Open containers
+    :return tuple: Chain of keys and flags telling which container is a list
+    """
+    return tuple(f[1] for f in frames), tuple(f[0] for f in frames)
+
+
+def iter_items(fp, paths=None, separator='.', esc_char='\\', chunk_size=65536):
+    """Parse json document and yield (dotted_key, value) pairs.
+
+    Without paths every leaf of document is yielded. Leaf is a scalar value,
+    empty dictionary or empty list. With paths every node matching any of paths
+    is yielded as a whole, while all the other parts of document are skipped.
+
+    :param fp: File-like object opened in text or binary mode
+    :param paths: Dot notated path or list of paths to select
+    :param str separator: Character used to chain deep access.
+    :param str esc_char: Escape character for separator.
+    :param int chunk_size: Number of characters or bytes read at once
+    :raises json.JSONDecodeError: If document is not valid json
+    """
+    patterns = _compile_patterns(paths, separator, esc_char)
+    for (keys, _), value in _iter_nodes(fp, patterns, chunk_size):
+        yield join_keys(keys, separator, esc_char), value
+
+
+def load(fp, paths=None, separator='.', esc_char='\\', chunk_size=65536, no_list=False):
+    """Load json document into Dotty.
+
+    With paths only nodes matching any of paths are loaded,
+    the rest of document is parsed but not kept in memory.
+
+    :param fp: File-like object opened in text or binary mode
+    :param paths: Dot notated path or list of paths to select
+    :param str separator: Character used to chain deep access.
+    :param str esc_char: Escape character for separator.
+    :param int chunk_size: Number of characters or bytes read at once
+    :param bool no_list: If set to True then numeric keys will NOT be converted to list indices
+    :raises json.JSONDecodeError: If document is not valid json
+    :return: Dotty instance
+    """
+    patterns = _compile_patterns(paths, separator, esc_char)
+    root = {}
+    for (keys, kinds), value in _iter_nodes(fp, patterns, chunk_size):
+        if not keys:
+            root = value
+            continue
+        if kinds[0]:
+            raise AttributeError('Dictionary must be type of dict')
+        data = root
+        for pos, key in enumerate(keys):
+            last = pos == len(keys) - 1
+            child = value if last else ([] if kinds[pos + 1] else {})
+            if kinds[pos]:
+                while len(data) <= key:
+                    data.append(None)
+                if last or data[key] is None:
+                    data[key] = child
+            elif last or key not in data:
+                data[key] = child
+            data = data[key]
+    return Dotty(root, separator=separator, esc_char=esc_char, no_list=no_list)
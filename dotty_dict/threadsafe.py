@@ -0,0 +1,331 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Dotty safe to share between threads.
+
+Reads hold shared lock, so they do not block each other. Writes hold
+exclusive lock. Lazy iterators collect their results under shared lock
+when they are created, so writes made during iteration do not break
+them.
+"""
+from functools import wraps
+import threading
+
+from dotty_dict.dotty_dict import Dotty, DottyView, ReadCache, _ViewState, _missing
+
+__author__ = 'Pawel Zadrozny'
+__copyright__ = 'Copyright (c) 2017, Pawel Zadrozny'
+
+
+class _Guard:
+    """Context manager calling acquire and release functions.
+
+    :param acquire: Function called on enter
+    :param release: Function called on exit
+    """
+
+    __slots__ = ('acquire', 'release')
+
+    def __init__(self, acquire, release):
+        self.acquire = acquire
+        self.release = release
+
+    def __enter__(self):
+        self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class RWLock:
+    """Reentrant readers-writer lock.
+
+    Many threads can hold read lock at the same time, while write lock
+    is held by single thread and excludes readers. Waiting writers are
+    preferred over new readers, so writes are not starved.
+
+    Thread holding any lock can acquire read lock again, and thread
+    holding write lock can acquire write lock again. Upgrading read
+    lock to write lock raises RuntimeError, as it could deadlock.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = {}
+        self._writer = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+
+    def acquire_read(self):
+        me = threading.get_ident()
+        with self._cond:
+            readers = self._readers
+            if me not in readers and self._writer != me:
+                while self._writer is not None or self._waiting_writers:
+                    self._cond.wait()
+            readers[me] = readers.get(me, 0) + 1
+
+    def release_read(self):
+        me = threading.get_ident()
+        with self._cond:
+            readers = self._readers
+            depth = readers[me] - 1
+            if depth:
+                readers[me] = depth
+            else:
+                del readers[me]
+                if not readers:
+                    self._cond.notify_all()
+
+    def acquire_write(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            if me in self._readers:
+                raise RuntimeError('Read lock can not be upgraded to write lock')
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self):
+        with self._cond:
+            self._writer_depth -= 1
+            if not self._writer_depth:
+                self._writer = None
+                self._cond.notify_all()
+
+    def reading(self):
+        """Return context manager holding read lock.
+
+        :return: Context manager
+        """
+        return _Guard(self.acquire_read, self.release_read)
+
+    def writing(self):
+        """Return context manager holding write lock.
+
+        :return: Context manager
+        """
+        return _Guard(self.acquire_write, self.release_write)
+
+
+class _SynchronizedReadCache(ReadCache):
+    """Read cache which can be used by many readers at once.
+
+    Even reading from cache changes order of entries, so every
+    operation is guarded with mutex.
+    """
+
+    def __init__(self, maxsize=32):
+        super(_SynchronizedReadCache, self).__init__(maxsize)
+        self._mutex = threading.Lock()
+
+    def get(self, key, default=_missing):
+        with self._mutex:
+            return super(_SynchronizedReadCache, self).get(key, default)
+
+    def put(self, key, value):
+        with self._mutex:
+            super(_SynchronizedReadCache, self).put(key, value)
+
+    def clear(self):
+        with self._mutex:
+            super(_SynchronizedReadCache, self).clear()
+
+    def info(self):
+        with self._mutex:
+            return super(_SynchronizedReadCache, self).info()
+
+
+class _SynchronizedViewState(_ViewState):
+    """State of views which can be used by many readers at once.
+
+    Views are created under read lock, so every operation on cached
+    views is guarded with mutex.
+    """
+
+    __slots__ = ('_mutex',)
+
+    def __init__(self):
+        super(_SynchronizedViewState, self).__init__()
+        self._mutex = threading.Lock()
+
+    def get(self, path):
+        with self._mutex:
+            return super(_SynchronizedViewState, self).get(path)
+
+    def put(self, path, view):
+        with self._mutex:
+            super(_SynchronizedViewState, self).put(path, view)
+
+
+def _reading(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        lock = self.lock
+        lock.acquire_read()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            lock.release_read()
+    return wrapper
+
+
+def _writing(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        lock = self.lock
+        lock.acquire_write()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            lock.release_write()
+    return wrapper
+
+
+def _iterating(method):
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        lock = self.lock
+        lock.acquire_read()
+        try:
+            results = list(method(self, *args, **kwargs))
+        finally:
+            lock.release_read()
+        return iter(results)
+    return wrapper
+
+
+class _Locked:
+    """Methods of Dotty holding lock available as ``lock`` attribute."""
+
+    __slots__ = ()
+
+    def __getattr__(self, item):
+        attr = getattr(self._data, item)
+        if item not in self._mutating_methods:
+            return attr
+
+        @wraps(attr)
+        def locked(*args, **kwargs):
+            with self.lock.writing():
+                self._invalidate()
+                return getattr(self._data, item)(*args, **kwargs)
+        return locked
+
+    __str__ = _reading(Dotty.__str__)
+    __hash__ = _reading(Dotty.__hash__)
+    __eq__ = _reading(Dotty.__eq__)
+    __len__ = _reading(Dotty.__len__)
+    __contains__ = _reading(Dotty.__contains__)
+    __getitem__ = _reading(Dotty.__getitem__)
+    get = _reading(Dotty.get)
+    get_many = _reading(Dotty.get_many)
+    get_many_dict = _reading(Dotty.get_many_dict)
+    copy = _reading(Dotty.copy)
+    to_dict = _reading(Dotty.to_dict)
+    to_json = _reading(Dotty.to_json)
+    diff = _reading(Dotty.diff)
+    fingerprint = _reading(Dotty.fingerprint)
+
+    __setitem__ = _writing(Dotty.__setitem__)
+    __delitem__ = _writing(Dotty.__delitem__)
+    pop = _writing(Dotty.pop)
+    setdefault = _writing(Dotty.setdefault)
+    set_many = _writing(Dotty.set_many)
+    deep_update = _writing(Dotty.deep_update)
+    apply_patch = _writing(Dotty.apply_patch)
+    snapshot = _writing(Dotty.snapshot)
+    cache_clear = _writing(Dotty.cache_clear)
+
+    find = _iterating(Dotty.find)
+    find_items = _iterating(Dotty.find_items)
+    flatten = _iterating(Dotty.flatten)
+    walk = _iterating(Dotty.walk)
+    deep_items = _iterating(Dotty.deep_items)
+    deep_keys = _iterating(Dotty.deep_keys)
+
+
+class ThreadSafeDotty(_Locked, Dotty):
+    """Dictionary wrapper safe to share between threads.
+
+    Works the same as Dotty. Every read holds shared lock and every write
+    holds exclusive lock of this Dotty, available as :attr:`lock`. Hold
+    write lock to make a few operations atomic::
+
+        with dot.lock.writing():
+            dot['counter'] = dot['counter'] + 1
+
+    Iterators returned by :meth:`find`, :meth:`flatten`, :meth:`walk` and
+    other lazy iterators collect all their results under read lock when
+    they are created, so they do not hold lock while iterating and later
+    writes do not break them. Cost of collecting depends on number of
+    results, not on size of the document. Like any other values read
+    from ThreadSafeDotty, yielded dicts and lists are not copied, so they
+    see later writes made in them.
+
+    Views returned by :meth:`view` hold lock of this Dotty too.
+    Wrapped dictionary must be changed only through ThreadSafeDotty.
+    Views returned by ``keys()``, ``values()`` and ``items()`` of wrapped
+    dict are not protected.
+
+    :param dict dictionary: Any dictionary or dict-like object
+    :param str separator: Character used to chain deep access.
+    :param str esc_char: Escape character for separator.
+    :param bool no_list: If set to True then numeric keys will NOT be converted to list indices
+    :param int cache_size: Number of values kept in read cache, 0 disables cache
+    """
+
+    __slots__ = ('lock',)
+
+    def __init__(self, dictionary, separator='.', esc_char='\\', no_list=False, cache_size=0):
+        super(ThreadSafeDotty, self).__init__(dictionary, separator=separator, esc_char=esc_char,
+                                              no_list=no_list)
+        self._cache = _SynchronizedReadCache(cache_size) if cache_size > 0 else None
+        self.lock = RWLock()
+        self._views = _SynchronizedViewState()
+
+    def __repr__(self):
+        with self.lock.reading():
+            return 'ThreadSafeDotty(dictionary={}, separator={!r}, esc_char={!r})'.format(
+                self._data, self.separator, self.esc_char)
+
+    @_reading
+    def view(self, key):
+        """Returns view of nested dictionary under deep key.
+
+        Works the same as :meth:`Dotty.view`, but every read made through
+        view holds shared lock and every write holds exclusive lock of
+        this Dotty.
+
+        :param str key: Single key or chain of keys
+        :raises KeyError: If key does not exist
+        :raises AttributeError: If value under key is not a dictionary
+        :return DottyView: View of nested dictionary
+        """
+        path = self.compile(key)
+        view = self._views.get(path)
+        if view is None:
+            view = _LockedView(self, path)
+            self._views.put(path, view)
+        return view
+
+
+class _LockedView(_Locked, DottyView):
+    """View of nested dictionary of ThreadSafeDotty holding its lock."""
+
+    __slots__ = ()
+
+    @property
+    def lock(self):
+        return self._root.lock
+
+    __repr__ = _reading(DottyView.__repr__)
+    fingerprint = _reading(DottyView.fingerprint)
+    snapshot = DottyView.snapshot
@@ -0,0 +1,345 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Declarative transformations of documents.
+
+Transformation is described with rules copying value from deep key of
+source document to deep key of new document, optionally passing it
+through function first. Projection is described with mapping of target
+keys to source keys. Large collections of documents can be transformed
+in parallel by pool of processes.
+"""
+from collections import deque
+from itertools import islice
+import multiprocessing
+import os
+import queue
+
+from dotty_dict.dotty_dict import Dotty, _build_trie, _missing
+
+__author__ = 'Pawel Zadrozny'
+__copyright__ = 'Copyright (c) 2017, Pawel Zadrozny'
+
+
+def _compile_builder(targets, no_list):
+    """Compile target paths into nested plan of new document.
+
+    Plan is tuple of ``(key, position, children)`` nodes, where leaf
+    nodes point to position of value and other nodes have children.
+    Plan can be made only for unique paths of plain dictionary keys,
+    which are not prefixes of one another.
+
+    :param tuple targets: Compiled target paths
+    :param bool no_list: If set to True then numeric keys will NOT be converted to list indices
+    :return tuple: Plan or None if targets need full Dotty assignment
+    """
+    root = {}
+    for position, path in enumerate(targets):
+        node = root
+        for pos, (key, index, list_slice) in enumerate(path.segments):
+            in_list = index is not None or list_slice is not None
+            if type(key) is not str or (in_list and not no_list):
+                return None
+            if pos == len(path.segments) - 1:
+                if key in node:
+                    return None
+                node[key] = position
+            else:
+                node = node.setdefault(key, {})
+                if type(node) is int:
+                    return None
+
+    def freeze(node):
+        return tuple((key, value, None) if type(value) is int else (key, None, freeze(value))
+                     for key, value in node.items())
+    return freeze(root)
+
+
+def _build(plan, values):
+    """Build new document from compiled plan.
+
+    Missing values are skipped, and so are nested dictionaries
+    left empty because of them.
+
+    :param tuple plan: Plan compiled by :func:`_compile_builder`
+    :param list values: Values in order of target paths
+    :return dict: New document
+    """
+    document = {}
+    for key, position, children in plan:
+        if children is None:
+            value = values[position]
+            if value is _missing:
+                continue
+        else:
+            value = _build(children, values)
+            if not value:
+                continue
+        document[key] = value
+    return document
+
+
+class _Reshape:
+    """Compiled pairs of source and target keys.
+
+    Source keys are arranged in prefix tree, so document is read in
+    single pass and common part of keys is walked only once. New
+    document is built from nested plan, falling back to
+    :meth:`Dotty.set_many` when target keys contain list indices.
+
+    :param sources: Iterable of source keys
+    :param targets: Iterable of target keys
+    :param str separator: Character used to chain deep access.
+    :param str esc_char: Escape character for separator.
+    :param bool no_list: If set to True then numeric keys will NOT be converted to list indices
+    """
+
+    def __init__(self, sources, targets, separator, esc_char, no_list):
+        self.separator = separator
+        self.esc_char = esc_char
+        self.no_list = no_list
+        self._reader = Dotty({}, separator=separator, esc_char=esc_char, no_list=no_list)
+        self._sources = tuple(self._reader.compile(key) for key in sources)
+        self._targets = tuple(self._reader.compile(key) for key in targets)
+        self._trie = _build_trie(self._sources)
+        self._plan = _compile_builder(self._targets, no_list)
+
+    def _read(self, document):
+        if type(document) is not dict and isinstance(document, Dotty):
+            document = document._data
+        values = [_missing] * len(self._sources)
+        self._reader._collect(document, self._trie, self._sources, values)
+        return values
+
+    def _write(self, values):
+        if self._plan is not None:
+            return _build(self._plan, values)
+        target = Dotty({}, separator=self.separator, esc_char=self.esc_char,
+                       no_list=self.no_list)
+        target.set_many([(path, value) for path, value in zip(self._targets, values)
+                         if value is not _missing])
+        return target._data
+
+
+class Transform(_Reshape):
+    """Transformation of documents described by rules.
+
+    Every rule is ``(source, target)`` or ``(source, target, function)``
+    tuple of deep keys. Value of source key is passed through function,
+    if given, and set under target key of new document. Rules with
+    missing source key are skipped. When many rules share target key,
+    the last one wins.
+
+    Keys are compiled once, when transformation is created. Transform
+    can be pickled, as long as its functions can be, so it can be sent
+    to other processes.
+
+    :param rules: Iterable of (source, target) or (source, target, function) tuples
+    :param str separator: Character used to chain deep access.
+    :param str esc_char: Escape character for separator.
+    :param bool no_list: If set to True then numeric keys will NOT be converted to list indices
+    :raises ValueError: If rule is not a pair or triple
+    """
+
+    def __init__(self, rules, separator='.', esc_char='\\', no_list=False):
+        self.rules = []
+        for rule in rules:
+            if len(rule) == 2:
+                rule = tuple(rule) + (None,)
+            elif len(rule) != 3:
+                raise ValueError('Rule must be (source, target) or (source, target, function), '
+                                 'got {!r}'.format(rule))
+            self.rules.append(tuple(rule))
+        super(Transform, self).__init__([rule[0] for rule in self.rules],
+                                        [rule[1] for rule in self.rules],
+                                        separator, esc_char, no_list)
+        self._functions = [(position, rule[2]) for position, rule in enumerate(self.rules)
+                           if rule[2] is not None]
+
+    def __repr__(self):
+        return 'Transform(rules={!r})'.format(self.rules)
+
+    def __reduce__(self):
+        return Transform, (self.rules, self.separator, self.esc_char, self.no_list)
+
+    def __call__(self, document):
+        """Transform single document.
+
+        :param document: Dictionary or Dotty instance
+        :return dict: New document
+        """
+        values = self._read(document)
+        for position, function in self._functions:
+            value = values[position]
+            if value is not _missing:
+                values[position] = function(value)
+        return self._write(values)
+
+
+class Projection(_Reshape):
+    """Projection of documents into new shape.
+
+    Projection is described with mapping of target keys to source
+    keys, e.g. ``{'user.name': 'data.user.personal.name'}``. Both sides
+    are compiled once, and every document is read and built in single
+    pass, with common part of keys walked only once.
+
+    Missing source keys are handled according to policy:
+
+    * ``skip`` - target key is not set,
+    * ``default`` - target key is set to default value,
+    * ``raise`` - KeyError is raised.
+
+    :param dict spec: Target keys mapped to source keys
+    :param str missing: Policy for missing source keys, one of: skip, default, raise
+    :param Any default: Value set for missing source keys with default policy
+    :param str separator: Character used to chain deep access.
+    :param str esc_char: Escape character for separator.
+    :param bool no_list: If set to True then numeric keys will NOT be converted to list indices
+    :raises ValueError: If policy is unknown
+    """
+
+    _policies = ('skip', 'default', 'raise')
+
+    def __init__(self, spec, missing='skip', default=None, separator='.', esc_char='\\',
+                 no_list=False):
+        if missing not in self._policies:
+            raise ValueError('Missing key policy must be one of: {}, got {!r}'.format(
+                ', '.join(self._policies), missing))
+        self.spec = dict(spec)
+        self.missing = missing
+        self.default = default
+        targets = list(self.spec)
+        super(Projection, self).__init__([self.spec[key] for key in targets], targets,
+                                         separator, esc_char, no_list)
+
+    def __repr__(self):
+        return 'Projection(spec={!r}, missing={!r})'.format(self.spec, self.missing)
+
+    def __reduce__(self):
+        return Projection, (self.spec, self.missing, self.default, self.separator,
+                            self.esc_char, self.no_list)
+
+    def __call__(self, document):
+        """Project single document.
+
+        :param document: Dictionary or Dotty instance
+        :raises KeyError: If source key is missing and policy is raise
+        :return dict: New document
+        """
+        values = self._read(document)
+        if self.missing != 'skip':
+            for position, value in enumerate(values):
+                if value is not _missing:
+                    continue
+                if self.missing == 'raise':
+                    raise KeyError(list(self.spec.values())[position])
+                values[position] = self.default
+        return self._write(values)
+
+
+_worker_function = None
+
+
+def _init_worker(function):
+    global _worker_function
+    _worker_function = function
+
+
+def _apply_chunk(chunk):
+    function = _worker_function
+    return [function(item) for item in chunk]
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _chunk_result(result):
+    if isinstance(result, BaseException):
+        raise result
+    return result
+
+
+def parallel_map(function, records, processes=None, chunk_size=1000, ordered=True):
+    """Apply function to every record using pool of processes.
+
+    Records are sent to workers in chunks, and only a few chunks per
+    worker are in flight at once, so records can be lazy iterable of any
+    size. Function is sent to every worker only once, when pool starts,
+    so :class:`Transform` keys are compiled once per worker, not per
+    chunk. Function and records must be picklable.
+
+    Results are yielded in order of records. With ``ordered`` set to
+    False chunks are yielded as soon as they are done, so slow chunk does
+    not hold back the others, but order of results is lost.
+
+    :param function: Picklable function taking single record, e.g. :class:`Transform`
+    :param records: Iterable of records
+    :param int processes: Number of worker processes, CPU count by default,
+        0 applies function in current process
+    :param int chunk_size: Number of records sent to worker at once
+    :param bool ordered: If set to False then results are yielded in order of completion
+    :return: Generator of results
+    """
+    chunks = _chunks(records, chunk_size)
+    if processes == 0:
+        return (function(record) for chunk in chunks for record in chunk)
+    processes = processes or os.cpu_count() or 1
+    if ordered:
+        return _map_ordered(function, chunks, processes)
+    return _map_unordered(function, chunks, processes)
+
+
+def _map_ordered(function, chunks, processes):
+    """Apply function in pool of processes, yielding results in order of chunks.
+
+    :param function: Picklable function taking single record
+    :param chunks: Iterable of lists of records
+    :param int processes: Number of worker processes
+    :return: Generator of results
+    """
+    limit = 2 * processes
+    pool = multiprocessing.Pool(processes, initializer=_init_worker, initargs=(function,))
+    try:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(_apply_chunk, (chunk,)))
+            if len(pending) >= limit:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _map_unordered(function, chunks, processes):
+    """Apply function in pool of processes, yielding results of chunks as soon as they are done.
+
+    :param function: Picklable function taking single record
+    :param chunks: Iterable of lists of records
+    :param int processes: Number of worker processes
+    :return: Generator of results
+    """
+    limit = 2 * processes
+    pool = multiprocessing.Pool(processes, initializer=_init_worker, initargs=(function,))
+    try:
+        done = queue.Queue()
+        running = 0
+        for chunk in chunks:
+            pool.apply_async(_apply_chunk, (chunk,), callback=done.put, error_callback=done.put)
+            running += 1
+            if running >= limit:
+                running -= 1
+                yield from _chunk_result(done.get())
+        while running:
+            running -= 1
+            yield from _chunk_result(done.get())
+    finally:
+        pool.terminate()
+        pool.join()
@@ -57,6 +57,37 @@ def api_request():
     # end of api_request
 
 
+def reshape_response():
+    from dotty_dict.transform import Projection
+
+    response = {
+        'status': {'code': 200, 'msg': 'User created'},
+        'data': {
+            'user': {
+                'id': 123,
+                'personal': {'name': 'Arnold', 'email': 'arnold@dotty.dict'},
+                'privileges': {'granted': ['login', 'guest', 'superuser']},
+            },
+        },
+    }
+
+    # target keys mapped to source keys, compiled once and reused for every response
+    to_user = Projection({
+        'id': 'data.user.id',
+        'profile.name': 'data.user.personal.name',
+        'profile.email': 'data.user.personal.email',
+        'profile.phone': 'data.user.personal.phone',
+        'roles': 'data.user.privileges.granted',
+    }, missing='default', default=None)
+
+    assert to_user(response) == {
+        'id': 123,
+        'profile': {'name': 'Arnold', 'email': 'arnold@dotty.dict', 'phone': None},
+        'roles': ['login', 'guest', 'superuser'],
+    }
+    # end of reshape_response
+
+
 def list_embedded():
     from dotty_dict import dotty
 
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import asyncio
+import unittest
+from unittest import mock
+
+from dotty_dict.aio import AsyncDotty
+
+
+class MemoryStore:
+    """Local stand-in for asynchronous key-value store."""
+
+    def __init__(self, data):
+        self.data = data
+        self.calls = []
+
+    async def get(self, key):
+        self.calls.append(('get', key))
+        await asyncio.sleep(0)
+        return self.data.get(key)
+
+
+class BatchMemoryStore(MemoryStore):
+    async def get_many(self, keys):
+        self.calls.append(('get_many', sorted(keys)))
+        await asyncio.sleep(0)
+        return [self.data.get(key) for key in keys]
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class TestAsyncDotty(unittest.TestCase):
+    def setUp(self):
+        self.users = BatchMemoryStore({
+            'alice': {'name': 'Alice', 'roles': ['admin', 'dev']},
+            'bob': {'name': 'Bob', 'roles': []},
+        })
+        self.store = BatchMemoryStore({
+            'users': self.users,
+            'config': {'db': {'host': 'localhost', 'port': 5432}, 'items': [{'id': 1}, {'id': 2}]},
+            'empty': None,
+        })
+
+    def test_get(self):
+        dot = AsyncDotty(self.store)
+        self.assertEqual(run(dot.get('config.db.port')), 5432)
+        self.assertEqual(run(dot.get('users.alice.roles.1')), 'dev')
+        self.assertListEqual(run(dot.get('config.items.:.id')), [1, 2])
+        self.assertIs(run(dot.get('users')), self.users)
+
+    def test_get_missing(self):
+        dot = AsyncDotty(self.store)
+        self.assertIsNone(run(dot.get('missing.key')))
+        self.assertEqual(run(dot.get('config.db.user', 'root')), 'root')
+        self.assertEqual(run(dot.get('users.carol.name', '?')), '?')
+        self.assertEqual(run(dot.get('empty', 1)), 1)
+
+    def test_get_many_fetches_level_at_once(self):
+        dot = AsyncDotty(self.store)
+        values = run(dot.get_many([
+            'users.alice.name', 'users.bob.name', 'config.db.host', 'users.alice.roles.0',
+        ]))
+        self.assertListEqual(values, ['Alice', 'Bob', 'localhost', 'admin'])
+        self.assertListEqual(self.store.calls, [('get_many', ['config', 'users'])])
+        self.assertListEqual(self.users.calls, [('get_many', ['alice', 'bob'])])
+
+    def test_store_without_get_many(self):
+        store = MemoryStore({'a': {'b': 1}, 'c': 2})
+        dot = AsyncDotty(store)
+        self.assertListEqual(run(dot.get_many(['a.b', 'c', 'd'], 0)), [1, 2, 0])
+        self.assertCountEqual(store.calls, [('get', 'a'), ('get', 'c'), ('get', 'd')])
+
+    def test_ttl_cache(self):
+        dot = AsyncDotty(self.store, ttl=10)
+        with mock.patch('dotty_dict.aio.monotonic', return_value=100.0):
+            run(dot.get('config.db.host'))
+            run(dot.get('config.db.port'))
+        self.assertEqual(len(self.store.calls), 1)
+        with mock.patch('dotty_dict.aio.monotonic', return_value=111.0):
+            run(dot.get('config.db.port'))
+        self.assertEqual(len(self.store.calls), 2)
+        dot.cache_clear()
+        run(dot.get('config.db.port'))
+        self.assertEqual(len(self.store.calls), 3)
+
+    def test_expired_values_are_removed_from_cache(self):
+        dot = AsyncDotty(self.store, ttl=10)
+        with mock.patch('dotty_dict.aio.monotonic', return_value=100.0):
+            run(dot.get_many(['config.db.host', 'users.alice.name']))
+        self.assertEqual(len(dot._cache), 3)
+        with mock.patch('dotty_dict.aio.monotonic', return_value=105.0):
+            run(dot.get('empty'))
+        self.assertEqual(len(dot._cache), 4)
+        with mock.patch('dotty_dict.aio.monotonic', return_value=112.0):
+            run(dot.get('empty'))
+        self.assertListEqual(list(dot._cache), [('empty',)])
+
+    def test_no_cache_by_default(self):
+        dot = AsyncDotty(self.store)
+        run(dot.get('config.db.host'))
+        run(dot.get('config.db.host'))
+        self.assertEqual(len(self.store.calls), 2)
+
+    def test_custom_separator(self):
+        dot = AsyncDotty(self.store, separator=',')
+        self.assertEqual(run(dot.get('config,db,host')), 'localhost')
+
+    def test_reject_store_without_coroutine_get(self):
+        with self.assertRaises(AttributeError):
+            AsyncDotty({'a': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
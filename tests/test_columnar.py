@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import unittest
+from array import array
+
+from dotty_dict import Dotty, dotty
+from dotty_dict import columnar
+from dotty_dict.columnar import extract
+
+
+class TestExtract(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            {'user': {'id': 1, 'tags': ['a', 'b']}, 'metrics': {'latency': 0.5}},
+            {'user': {'id': 2, 'tags': []}, 'metrics': {}},
+            {'user': {'id': 3, 'tags': ['c']}, 'metrics': None},
+        ]
+
+    def test_columns(self):
+        columns = extract(self.records, ['user.id', 'metrics.latency'])
+        self.assertDictEqual(columns, {
+            'user.id': [1, 2, 3],
+            'metrics.latency': [0.5, None, None],
+        })
+
+    def test_matches_dotty_get(self):
+        keys = ['user.id', 'user.tags.0', 'user.tags.:1', 'user.tags.5', 'metrics.latency.x',
+                'missing']
+        columns = extract(self.records, keys, default='-')
+        for key in keys:
+            self.assertListEqual(columns[key], [dotty(r).get(key, '-') for r in self.records])
+
+    def test_defaults(self):
+        columns = extract(self.records, ['user.tags.0', 'metrics.latency', 'missing'],
+                          default=0, defaults={'user.tags.0': ''})
+        self.assertListEqual(columns['user.tags.0'], ['a', '', 'c'])
+        self.assertListEqual(columns['metrics.latency'], [0.5, 0, None])
+        self.assertListEqual(columns['missing'], [0, 0, 0])
+
+    def test_typecodes(self):
+        columns = extract(self.records, ['user.id', 'metrics.latency'],
+                          defaults={'metrics.latency': -1.0},
+                          typecodes={'user.id': 'q'})
+        self.assertEqual(columns['user.id'], array('q', [1, 2, 3]))
+        self.assertListEqual(columns['metrics.latency'], [0.5, -1.0, None])
+
+    def test_typed_columns_get_default_in_place_of_none(self):
+        columns = extract([{'u': None}, {'u': {'id': None}}, {'u': {'id': 5}}, {}],
+                          ['u.id'], default=0, typecodes={'u.id': 'l'})
+        self.assertEqual(columns['u.id'], array('l', [0, 0, 5, 0]))
+
+    def test_records_iterator_of_dotty(self):
+        records = (Dotty(r, separator='/') for r in self.records)
+        columns = extract(records, ['user/id', 'user/tags/0'], separator='/')
+        self.assertListEqual(columns['user/id'], [1, 2, 3])
+        self.assertListEqual(columns['user/tags/0'], ['a', None, 'c'])
+
+    def test_compiled_paths(self):
+        path = dotty().compile('user.id')
+        self.assertListEqual(extract(self.records, [path])[path], [1, 2, 3])
+
+    def test_no_records(self):
+        self.assertDictEqual(extract([], ['a']), {'a': []})
+
+    @unittest.skipIf(columnar.numpy is None, 'NumPy is not installed')
+    def test_numpy(self):  # pragma: no cover
+        columns = extract(self.records, ['user.id', 'metrics.latency'], as_numpy=True,
+                          defaults={'metrics.latency': float('nan')},
+                          typecodes={'user.id': 'q', 'metrics.latency': 'd'})
+        self.assertEqual(columns['user.id'].dtype, columnar.numpy.int64)
+        self.assertListEqual(columns['user.id'].tolist(), [1, 2, 3])
+
+    @unittest.skipIf(columnar.numpy is not None, 'NumPy is installed')
+    def test_numpy_not_installed(self):
+        with self.assertRaises(ValueError):
+            extract(self.records, ['user.id'], as_numpy=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import gc
 import unittest
 
-from dotty_dict import Dotty, dotty
+from dotty_dict import Dotty, DottyView, dotty
 
 
 class TestDottyPrivateMembers(unittest.TestCase):
@@ -37,6 +38,65 @@ class TestDottyPublicMembers(unittest.TestCase):
         top_dot = dotty({'testlist': dot_list})
         self.assertDictEqual(top_dot.to_dict(), expected_dict)
 
+    def test_to_dict_is_deep_copy(self):
+        plain_dict = {'deep': {'list': [{'a': 1}]}}
+        result = dotty(plain_dict).to_dict()
+        result['deep']['list'][0]['a'] = 2
+        self.assertEqual(plain_dict['deep']['list'][0]['a'], 1)
+
+    def test_to_dict_keeps_types_of_keys_and_values(self):
+        obj = object()
+        plain_dict = {1: ('a', [1, 2], dotty({'b': 2})), 'obj': obj, None: {1.5}}
+        result = dotty(plain_dict).to_dict()
+        self.assertDictEqual(result, {1: ('a', [1, 2], {'b': 2}), 'obj': obj, None: {1.5}})
+        self.assertIsInstance(result[1][2], dict)
+        self.assertIsNot(result[1][1], plain_dict[1][1])
+
+    def test_to_dict_preserves_shared_references(self):
+        shared = {'x': 1}
+        result = dotty({'a': shared, 'b': [shared], 'c': (shared,)}).to_dict()
+        self.assertIs(result['a'], result['b'][0])
+        self.assertIs(result['a'], result['c'][0])
+        self.assertIsNot(result['a'], shared)
+
+    def test_to_dict_with_recursive_references(self):
+        plain_dict = {'a': []}
+        plain_dict['a'].append(plain_dict)
+        plain_dict['t'] = (plain_dict['a'],)
+        result = dotty(plain_dict).to_dict()
+        self.assertIs(result['a'][0], result)
+        self.assertIs(result['t'][0], result['a'])
+
+    def test_to_dict_of_plain_dicts_and_lists(self):
+        shared = [1]
+        recursive = {'s': [shared, shared]}
+        recursive['self'] = [recursive]
+        result = dotty(recursive).to_dict()
+        self.assertIs(result['s'][0], result['s'][1])
+        self.assertIsNot(result['s'][0], shared)
+        self.assertIs(result['self'][0], result)
+        deep = inner = {}
+        for _ in range(200):
+            inner['n'] = inner = {}
+        copied = dotty(deep).to_dict()
+        self.assertEqual(copied, deep)
+        self.assertIsNot(copied['n'], deep['n'])
+
+    def test_to_dict_shallow(self):
+        nested = {'b': 1}
+        result = dotty({'a': nested, 'dot': dotty({'c': 2})}).to_dict(mode='shallow')
+        self.assertIs(result['a'], nested)
+        self.assertDictEqual(result['dot'], {'c': 2})
+        self.assertIsInstance(result['dot'], dict)
+
+    def test_to_dict_view(self):
+        plain_dict = {'a': 1}
+        self.assertIs(dotty(plain_dict).to_dict(mode='view'), plain_dict)
+
+    def test_to_dict_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            dotty().to_dict(mode='other')
+
 
 class TestDictSpecificMethods(unittest.TestCase):
     def setUp(self):
@@ -217,3 +277,483 @@ class TestDictSpecificMethods(unittest.TestCase):
         dot = dotty().fromkeys({'a', 'b', 'c'}, value=10)
         self.assertDictEqual(dot.to_dict(), {'a': 10, 'b': 10, 'c': 10})
         self.assertIsInstance(dot, Dotty)
+
+
+class TestGetMany(unittest.TestCase):
+    def setUp(self):
+        self.dot = dotty({
+            'status': {'code': 200},
+            'data': {
+                'user': {
+                    'id': 123,
+                    'personal': {'name': 'Arnold', 'email': 'arnold@dotty.dict', 'phone': None},
+                    'roles': [{'name': 'login'}, {'name': 'guest'}, {'name': 'superuser'}],
+                },
+            },
+        })
+
+    def test_get_many_in_order(self):
+        result = self.dot.get_many(['data.user.personal.name', 'status.code',
+                                    'data.user.personal.email', 'data.user.id'])
+        self.assertListEqual(result, ['Arnold', 200, 'arnold@dotty.dict', 123])
+
+    def test_get_many_with_default(self):
+        result = self.dot.get_many(['data.user.id', 'data.user.missing', 'data.other.key'], default=0)
+        self.assertListEqual(result, [123, 0, 0])
+
+    def test_get_many_repeated_and_nested_keys(self):
+        result = self.dot.get_many(['data.user.id', 'data.user.id', 'status'])
+        self.assertListEqual(result, [123, 123, {'code': 200}])
+
+    def test_get_many_with_list_index_and_slice(self):
+        result = self.dot.get_many(['data.user.roles.0.name', 'data.user.roles.1:.name',
+                                    'data.user.roles.9.name'])
+        self.assertListEqual(result, ['login', ['guest', 'superuser'], None])
+
+    def test_get_many_matches_get(self):
+        keys = ['data.user.personal.phone', 'data.user.personal.phone.number', 'status.code.x']
+        self.assertListEqual(self.dot.get_many(keys, 'x'), [self.dot.get(k, 'x') for k in keys])
+
+    def test_get_many_with_compiled_paths(self):
+        path = self.dot.compile('data.user.id')
+        self.assertListEqual(self.dot.get_many([path, 'status.code']), [123, 200])
+
+    def test_get_many_dict(self):
+        result = self.dot.get_many_dict(['data.user.id', 'status.code', 'missing'])
+        self.assertDictEqual(result, {'data.user.id': 123, 'status.code': 200, 'missing': None})
+
+    def test_get_many_with_slice_below_list_index(self):
+        dot = dotty({'a': [{'b': [{'c': 1}, {'c': 2}]}]})
+        self.assertListEqual(dot.get_many(['a.0.b.:.c', 'a.0.b.1.c']), [[1, 2], 2])
+
+
+class TestSetMany(unittest.TestCase):
+    def test_set_many_creates_nested_keys(self):
+        dot = dotty()
+        dot.set_many({
+            'request.data.payload.name': 'Arnold',
+            'request.data.payload.email': 'arnold@dotty.dict',
+            'request.data.headers.content_type': 'application/json',
+            'request.url': 'http://127.0.0.1/api/user/create',
+        })
+        self.assertDictEqual(dot._data, {'request': {
+            'data': {
+                'payload': {'name': 'Arnold', 'email': 'arnold@dotty.dict'},
+                'headers': {'content_type': 'application/json'},
+            },
+            'url': 'http://127.0.0.1/api/user/create',
+        }})
+
+    def test_set_many_with_lists(self):
+        dot = dotty({'field': [{'a': 1}]})
+        dot.set_many([('field.0.b', 2), ('field.2.c', 3), ('other.1', 'x')])
+        self.assertDictEqual(dot._data, {
+            'field': [{'a': 1, 'b': 2}, None, {'c': 3}],
+            'other': [None, 'x'],
+        })
+
+    def test_set_many_keeps_order_of_overlapping_keys(self):
+        items = [('a.b', 1), ('a', {'c': 2}), ('a.d', 3), ('x.y', 1), ('x.y', 2)]
+        expected = dotty()
+        for key, value in items:
+            expected[key] = value
+        dot = dotty()
+        dot.set_many(items)
+        self.assertDictEqual(dot._data, expected._data)
+        self.assertDictEqual(dot._data, {'a': {'c': 2, 'd': 3}, 'x': {'y': 2}})
+
+    def test_set_many_skips_replaced_values(self):
+        dot = dotty({'a': [1]})
+        dot.set_many([('a.0', 1), ('a.c', None), ('a', None)])
+        self.assertDictEqual(dot._data, {'a': None})
+
+    def test_set_many_invalidates_cache(self):
+        dot = dotty({'a': 1}, cache_size=8)
+        self.assertEqual(dot['a'], 1)
+        dot.set_many({'a': 2})
+        self.assertEqual(dot['a'], 2)
+
+    def test_set_many_is_not_atomic_by_default(self):
+        dot = dotty({'a': 1, 'text': 'abc'})
+        with self.assertRaises(AttributeError):
+            dot.set_many([('a', 2), ('text.x.y', 3)])
+        self.assertEqual(dot['a'], 2)
+
+    def test_set_many_atomic_reverts_all_writes(self):
+        plain = {'a': {'b': 1}, 'list': [1], 'text': 'abc'}
+        dot = dotty(plain)
+        with self.assertRaises(AttributeError):
+            dot.set_many([('a.b', 2), ('a.c.d', 3), ('list.3', 4), ('new.key', 5),
+                          ('text.x.y', 6)], atomic=True)
+        self.assertDictEqual(dot._data, {'a': {'b': 1}, 'list': [1], 'text': 'abc'})
+
+
+class TestDeepUpdate(unittest.TestCase):
+    def test_deep_update_merges_nested_dicts(self):
+        dot = dotty({'a': {'b': 1, 'c': {'d': 2}}, 'e': [1, 2]})
+        dot.deep_update({'a': {'c': {'f': 3}, 'g': 4}, 'e': [3], 'h': 5})
+        self.assertDictEqual(dot._data, {
+            'a': {'b': 1, 'c': {'d': 2, 'f': 3}, 'g': 4},
+            'e': [3],
+            'h': 5,
+        })
+
+    def test_deep_update_replaces_non_dict_values(self):
+        dot = dotty({'a': 1, 'b': {'c': 2}})
+        dot.deep_update({'a': {'x': 1}, 'b': 'text'})
+        self.assertDictEqual(dot._data, {'a': {'x': 1}, 'b': 'text'})
+
+    def test_deep_update_with_dotty(self):
+        dot = dotty({'a': {'b': 1}})
+        dot.deep_update(dotty({'a': dotty({'c': 2})}))
+        self.assertDictEqual(dot._data, {'a': {'b': 1, 'c': 2}})
+
+
+class TestFlatten(unittest.TestCase):
+    def setUp(self):
+        self.data = {
+            'a': {'b': [1, {'c': 2}, [], {}], 'x.y': {'z\\': 3}},
+            'e': {},
+            'f': None,
+        }
+
+    def test_flatten_yields_leaves_in_order(self):
+        self.assertListEqual(list(dotty(self.data).flatten()), [
+            ('a.b.0', 1),
+            ('a.b.1.c', 2),
+            ('a.b.2', []),
+            ('a.b.3', {}),
+            ('a.x\\.y.z\\', 3),
+            ('e', {}),
+            ('f', None),
+        ])
+
+    def test_flatten_no_list_keeps_lists_as_leaves(self):
+        dot = dotty({'a': {'b': [1, 2]}}, no_list=True)
+        self.assertListEqual(list(dot.flatten()), [('a.b', [1, 2])])
+
+    def test_flatten_unwraps_nested_dotty(self):
+        dot = dotty({'a': dotty({'b': 1})})
+        self.assertListEqual(list(dot.flatten()), [('a.b', 1)])
+
+    def test_unflatten_round_trip(self):
+        dot = Dotty.unflatten(dotty(self.data).flatten())
+        self.assertIsInstance(dot, Dotty)
+        self.assertDictEqual(dot._data, self.data)
+
+    def test_unflatten_custom_separator(self):
+        dot = Dotty(self.data, separator=',', esc_char='\\')
+        flat = dict(dot.flatten())
+        self.assertEqual(flat['a,x.y,z\\'], 3)
+        result = Dotty.unflatten(flat, separator=',')
+        self.assertDictEqual(result._data, self.data)
+        self.assertEqual(result.separator, ',')
+
+    def test_unflatten_fills_missing_list_items(self):
+        dot = Dotty.unflatten([('a.2', 'c'), ('a.0', 'a')])
+        self.assertDictEqual(dot._data, {'a': ['a', None, 'c']})
+
+    def test_unflatten_no_list(self):
+        dot = Dotty.unflatten({'a.0': 1}, no_list=True)
+        self.assertDictEqual(dot._data, {'a': {'0': 1}})
+
+    def test_unflatten_rejects_key_on_list(self):
+        with self.assertRaises(KeyError):
+            Dotty.unflatten([('a.0', 1), ('a.b', 2)])
+
+
+class TestWalk(unittest.TestCase):
+    def setUp(self):
+        self.dot = dotty({
+            'a': {'b': [1, {'c': 2}], 'd.e': 3},
+            'f': {},
+            'g': 4,
+        })
+
+    def test_walk_yields_every_node_before_its_items(self):
+        self.assertListEqual(list(self.dot.walk()), [
+            (('a',), {'b': [1, {'c': 2}], 'd.e': 3}),
+            (('a', 'b'), [1, {'c': 2}]),
+            (('a', 'b', 0), 1),
+            (('a', 'b', 1), {'c': 2}),
+            (('a', 'b', 1, 'c'), 2),
+            (('a', 'd.e'), 3),
+            (('f',), {}),
+            (('g',), 4),
+        ])
+
+    def test_walk_leaves_only(self):
+        self.assertListEqual([keys for keys, _ in self.dot.walk(leaves_only=True)], [
+            ('a', 'b', 0), ('a', 'b', 1, 'c'), ('a', 'd.e'), ('f',), ('g',),
+        ])
+
+    def test_deep_keys_are_escaped(self):
+        self.assertListEqual(list(self.dot.deep_keys()), [
+            'a', 'a.b', 'a.b.0', 'a.b.1', 'a.b.1.c', 'a.d\\.e', 'f', 'g',
+        ])
+
+    def test_deep_keys_with_max_depth(self):
+        self.assertListEqual(list(self.dot.deep_keys(max_depth=2)), ['a', 'a.b', 'a.d\\.e', 'f', 'g'])
+        self.assertListEqual(list(self.dot.deep_keys(max_depth=1, leaves_only=True)), ['a', 'f', 'g'])
+        self.assertListEqual(list(self.dot.deep_keys(max_depth=0)), [])
+
+    def test_deep_items_no_list(self):
+        dot = dotty({'a': [{'b': 1}]}, no_list=True)
+        self.assertListEqual(list(dot.deep_items()), [('a', [{'b': 1}])])
+
+    def test_deep_items_round_trip_through_getitem(self):
+        for key, value in self.dot.deep_items():
+            self.assertEqual(self.dot[key], value)
+
+    def test_deep_keys_escape_trailing_escape_character(self):
+        dot = dotty({'a\\': {'b': 1}})
+        keys = list(dot.deep_keys())
+        self.assertListEqual(keys, ['a\\', 'a\\\\.b'])
+        self.assertEqual(dot[keys[1]], 1)
+
+
+class TestDiff(unittest.TestCase):
+    def setUp(self):
+        self.old = {
+            'a': {'b': [1, 2, 3, {'x': 1}], 'c': 's', 'd': 1},
+            'e': {'k': 1},
+            'shared': {'big': list(range(10))},
+        }
+        self.new = {
+            'a': {'b': [1, 5], 'c': 's', 'd': 1.0, 'n': {}},
+            'e': [1],
+            'shared': self.old['shared'],
+        }
+
+    def test_diff_operations(self):
+        ops = dotty(self.old).diff(self.new)
+        self.assertCountEqual(ops, [
+            ('change', 'e', [1]),
+            ('change', 'a.d', 1.0),
+            ('add', 'a.n', {}),
+            ('change', 'a.b.1', 5),
+            ('remove', 'a.b.3', None),
+            ('remove', 'a.b.2', None),
+        ])
+        self.assertEqual(ops[0].op, 'change')
+
+    def test_diff_of_equal_documents_is_empty(self):
+        dot = dotty(self.old)
+        self.assertListEqual(dot.diff(dotty(dot.to_dict())), [])
+        self.assertListEqual(dot.diff(self.old), [])
+
+    def test_diff_escapes_keys(self):
+        ops = dotty({'a.b': {'c': 1}}).diff({'a.b': {'c': 2}})
+        self.assertListEqual(ops, [('change', 'a\\.b.c', 2)])
+
+    def test_diff_no_list_changes_whole_list(self):
+        ops = dotty({'a': [1, 2]}, no_list=True).diff({'a': [1, 3]})
+        self.assertListEqual(ops, [('change', 'a', [1, 3])])
+
+    def test_diff_rejects_non_dict(self):
+        with self.assertRaises(AttributeError):
+            dotty().diff([])
+
+    def test_apply_patch(self):
+        dot = dotty(self.old)
+        dot.apply_patch(dot.diff(self.new))
+        self.assertDictEqual(dot._data, self.new)
+
+    def test_apply_patch_appends_list_items(self):
+        new = {'a': {'b': [1, 2, 3, {'x': 2}, 7]}, 'e': {'k': 1}, 'shared': {}}
+        dot = dotty(self.old)
+        dot.apply_patch(dot.diff(new))
+        self.assertDictEqual(dot._data, new)
+
+    def test_apply_patch_with_digit_keys(self):
+        for old, new in [({'a': {'x': 1}}, {'a': {'0': 1, 'b': 2}}),
+                         ({'a': {}}, {'a': {'0': 1, '1': 2}}),
+                         ({'a': {'0': 1}}, {'a': {'1': 2}}),
+                         ({'x': 1}, {'0': 1})]:
+            dot = dotty(old)
+            dot.apply_patch(dot.diff(new))
+            self.assertDictEqual(dot._data, new)
+
+    def test_apply_patch_copies_values(self):
+        value = {'x': [1]}
+        dot = dotty()
+        dot.apply_patch([('add', 'a', value)])
+        self.assertIsNot(dot['a'], value)
+        self.assertDictEqual(dot['a'], value)
+
+    def test_apply_patch_rejects_unknown_operation(self):
+        with self.assertRaises(ValueError):
+            dotty().apply_patch([('move', 'a', None)])
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.plain = {'a': {'b': {'c': 1}, 'list': [1, {'x': 1}]}, 'other': {'y': 2}}
+        self.dot = dotty(self.plain)
+
+    def test_copy_keeps_settings(self):
+        dot = Dotty({'a': 1}, separator=',', esc_char='|', no_list=True, cache_size=8)
+        copied = dot.copy()
+        self.assertEqual((copied.separator, copied.esc_char, copied.no_list),
+                         (',', '|', True))
+        self.assertEqual(copied.cache_info().maxsize, 8)
+
+    def test_snapshot_is_isolated_from_writes(self):
+        snap = self.dot.snapshot()
+        snap['a.b.c'] = 2
+        snap['a.list.1.x'] = 2
+        del snap['other.y']
+        self.assertEqual(snap.pop('a.list.0'), 1)
+        self.assertDictEqual(self.plain, {
+            'a': {'b': {'c': 1}, 'list': [1, {'x': 1}]}, 'other': {'y': 2},
+        })
+        self.assertDictEqual(snap.to_dict(), {
+            'a': {'b': {'c': 2}, 'list': [{'x': 2}]}, 'other': {},
+        })
+
+    def test_original_writes_do_not_reach_snapshot(self):
+        snap = self.dot.snapshot()
+        self.dot['a.b.c'] = 3
+        self.dot.set_many({'other.y': 4})
+        self.dot.deep_update({'a': {'list': []}})
+        self.assertEqual(snap['a.b.c'], 1)
+        self.assertEqual(snap['other.y'], 2)
+        self.assertListEqual(snap['a.list'], [1, {'x': 1}])
+
+    def test_snapshot_shares_unchanged_subtrees(self):
+        snap = self.dot.snapshot()
+        snap['a.b.c'] = 2
+        self.assertIs(snap['other'], self.dot['other'])
+        self.assertIs(snap['a.list'], self.dot['a.list'])
+        self.assertIsNot(snap['a.b'], self.dot['a.b'])
+
+    def test_path_is_copied_once(self):
+        snap = self.dot.snapshot()
+        snap['a.b.c'] = 2
+        copied = snap['a.b']
+        snap['a.b.d'] = 3
+        self.assertIs(snap['a.b'], copied)
+
+    def test_copied_containers_are_not_retained(self):
+        snap = self.dot.snapshot()
+        for i in range(10000):
+            self.dot['tmp'] = {'x': 0}
+            self.dot['tmp.x'] = i
+            del self.dot['tmp']
+        self.assertLessEqual(len(self.dot._owned.containers), self.dot._owned.limit)
+        self.assertLess(self.dot._owned.limit, 1000)
+        self.assertNotIn('tmp', snap)
+
+    def test_writes_are_made_in_place_once_snapshot_is_gone(self):
+        snap = self.dot.snapshot()
+        self.dot['a.b.c'] = 2
+        inner = self.dot['a.b']
+        del snap
+        gc.collect()
+        self.dot['a.b.c'] = 3
+        self.assertIsNone(self.dot._owned)
+        self.assertEqual(inner['c'], 3)
+
+    def test_snapshot_of_snapshot(self):
+        first = self.dot.snapshot()
+        first['a.b.c'] = 2
+        second = first.snapshot()
+        second['a.b.c'] = 3
+        self.assertEqual(first['a.b.c'], 2)
+        self.assertEqual(second['a.b.c'], 3)
+        self.assertEqual(self.dot['a.b.c'], 1)
+
+
+class TestView(unittest.TestCase):
+    def setUp(self):
+        self.plain = {'a': {'b': {'c': 1, 'd': [1, 2]}}, 'other': {'x': 1}, 'n': 5}
+        self.dot = dotty(self.plain, cache_size=8)
+
+    def test_read(self):
+        view = self.dot.view('a.b')
+        self.assertIsInstance(view, DottyView)
+        self.assertEqual(view['c'], 1)
+        self.assertEqual(view['d.1'], 2)
+        self.assertEqual(view, {'c': 1, 'd': [1, 2]})
+        self.assertIs(view.to_dict(mode='view'), self.plain['a']['b'])
+        self.assertIs(view.settings, self.dot.settings)
+
+    def test_views_are_cached(self):
+        view = self.dot.view('a.b')
+        self.assertIs(self.dot.view('a.b'), view)
+        self.assertIs(self.dot.view('a').view('b'), view)
+
+    def test_recent_views_are_reused(self):
+        first = id(self.dot.view('a.b'))
+        for _ in range(3):
+            self.assertEqual(id(self.dot.view('a.b')), first)
+
+    def test_unused_views_are_released(self):
+        dot = dotty({str(i): {} for i in range(50)})
+        kept = dot.view('0')
+        for i in range(50):
+            dot.view(str(i))
+        gc.collect()
+        self.assertEqual(len(dot._views.views), dot._views.recent_size + 1)
+        self.assertIs(dot.view('0'), kept)
+
+    def test_view_of_key_replaced_with_scalar(self):
+        view = self.dot.view('a.b')
+        self.dot['a.b'] = 3
+        with self.assertRaises(TypeError):
+            view['c']
+        self.dot['a'] = None
+        with self.assertRaises(TypeError):
+            view['c']
+        self.dot['a'] = {'b': {'c': 4}}
+        self.assertEqual(view['c'], 4)
+
+    def test_write_through_view_clears_root_cache(self):
+        self.assertEqual(self.dot['a.b.c'], 1)
+        self.dot.view('a')['b.c'] = 2
+        self.assertEqual(self.dot['a.b.c'], 2)
+        self.dot.view('a.b').update({'c': 3})
+        self.assertEqual(self.dot['a.b.c'], 3)
+
+    def test_view_follows_replaced_dictionary(self):
+        view = self.dot.view('a.b')
+        self.dot['a'] = {'b': {'c': 'new'}}
+        self.assertEqual(view['c'], 'new')
+        del self.dot['a']
+        with self.assertRaises(KeyError):
+            view['c']
+
+    def test_view_respects_snapshot(self):
+        snap = self.dot.snapshot()
+        view = self.dot.view('a.b')
+        view['c'] = 2
+        view['d.0'] = 0
+        self.assertEqual(self.dot['a.b.c'], 2)
+        self.assertEqual(snap['a.b.c'], 1)
+        self.assertListEqual(snap['a.b.d'], [1, 2])
+        self.assertListEqual(self.dot['a.b.d'], [0, 2])
+
+    def test_snapshot_of_view(self):
+        view = self.dot.view('a.b')
+        snap = view.snapshot()
+        snap['c'] = 2
+        self.assertEqual(view['c'], 1)
+        self.assertEqual(snap['c'], 2)
+
+    def test_fingerprint(self):
+        view = self.dot.view('a.b')
+        before = view.fingerprint()
+        self.dot['a.b.c'] = 2
+        self.assertNotEqual(view.fingerprint(), before)
+        self.assertEqual(view.fingerprint(), dotty({'c': 2, 'd': [1, 2]}).fingerprint())
+
+    def test_invalid_key(self):
+        with self.assertRaises(KeyError):
+            self.dot.view('missing')
+        with self.assertRaises(AttributeError):
+            self.dot.view('n')
+
+    def test_repr(self):
+        self.assertEqual(repr(self.dot.view('other')),
+                         "DottyView(key='other', dictionary={'x': 1})")
+
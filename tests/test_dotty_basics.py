@@ -1,8 +1,11 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 import unittest
+from collections import OrderedDict, UserDict, UserList
 
-from dotty_dict import dotty
+from dotty_dict import Dotty, dotty
+from dotty_dict.frozen import FrozenDotty
+from dotty_dict.threadsafe import ThreadSafeDotty
 
 
 class TestDottyBasics(unittest.TestCase):
@@ -52,3 +55,105 @@ class TestDottyBasics(unittest.TestCase):
         self.assertEqual(dot.pop('does.not.exist', None), None)
         self.assertEqual(dot.pop('does.not.exist', 55), 55)
         self.assertEqual(dot.pop('does.not.exist', 'my_value'), 'my_value')
+
+    def test_pop_from_non_container_returns_default(self):
+        for value in ('s', None, 5):
+            dot = dotty({'a': value})
+            self.assertEqual(dot.pop('a.b', 7), 7)
+            self.assertEqual(dot['a'], value)
+
+    def test_hash_by_content(self):
+        first = dotty({'a': {'b': 1}})
+        second = dotty({'a': {'b': 1}})
+        self.assertEqual(hash(first), hash(second))
+
+    def test_hash_by_identity(self):
+        plain = {'a': {'b': 1}}
+        first = dotty(plain, identity_hash=True)
+        self.assertEqual(hash(first), hash(dotty(plain, identity_hash=True)))
+        self.assertNotEqual(hash(first), hash(dotty({'a': {'b': 1}}, identity_hash=True)))
+
+    def test_equality_by_identity(self):
+        plain = {'a': 1}
+        first = dotty(plain, identity_hash=True)
+        self.assertEqual(first, dotty(plain, identity_hash=True))
+        self.assertEqual(first, plain)
+        self.assertEqual(first, dotty(plain))
+        self.assertNotEqual(first, dotty({'a': 1}, identity_hash=True))
+        self.assertNotEqual(first, {'a': 1})
+        self.assertNotEqual(dotty({'a': 1}), first)
+        self.assertEqual(len({first, dotty({'a': 1}, identity_hash=True)}), 2)
+
+    def test_hash_by_identity_does_not_change_on_write(self):
+        dot = dotty(identity_hash=True)
+        before = hash(dot)
+        dot['a.b'] = 1
+        self.assertEqual(hash(dot), before)
+        self.assertIn(dot, {dot})
+
+    def test_equality_with_mixed_key_types(self):
+        self.assertEqual(dotty({1: 'a', 'b': 2}), dotty({'b': 2, 1: 'a'}))
+        self.assertNotEqual(dotty({1: 'a', 'b': 2}), {1: 'a', 'b': 3})
+
+    def test_equality_unwraps_nested_dotty(self):
+        self.assertEqual(dotty({'a': dotty({'b': 1})}), {'a': {'b': 1}})
+
+    def test_equality_with_reference_cycles(self):
+        first, second = {'a': 1}, {'a': 1}
+        first['self'], second['self'] = first, second
+        self.assertEqual(dotty(first), dotty(second))
+        second['a'] = 2
+        self.assertNotEqual(dotty(first), dotty(second))
+
+    def test_fingerprint(self):
+        first = dotty({'a': {'b': [1, 2]}, 'c': 1})
+        second = dotty({'c': 1.0, 'a': {'b': [1, 2]}})
+        self.assertEqual(first.fingerprint(), second.fingerprint())
+        self.assertEqual(first, second)
+        second['a.b.0'] = 3
+        self.assertNotEqual(first.fingerprint(), second.fingerprint())
+        self.assertNotEqual(first, second)
+
+    def test_fingerprint_does_not_affect_equality(self):
+        first, second = dotty({'a': {'x': 1}}), dotty({'a': UserDict({'x': 1})})
+        self.assertEqual(first, second)
+        self.assertEqual(first.fingerprint(), second.fingerprint())
+        self.assertEqual(first, second)
+        third, fourth = dotty({'l': [1]}), dotty({'l': [1]})
+        self.assertEqual(third.fingerprint(), fourth.fingerprint())
+        third['l'].append(2)
+        self.assertNotEqual(third, fourth)
+
+    def test_fingerprint_of_equal_containers_of_other_types(self):
+        self.assertEqual(dotty({'a': UserList([1]), 's': {1}}).fingerprint(),
+                         dotty({'a': [1], 's': frozenset([1])}).fingerprint())
+        unhashable = type('Unhashable', (), {'__hash__': None})()
+        self.assertIsNone(dotty({'a': UserDict({'x': [unhashable]})}).fingerprint())
+
+    def test_fingerprint_of_recursive_document(self):
+        plain = {}
+        plain['self'] = plain
+        self.assertIsNone(dotty(plain).fingerprint())
+
+    def test_instances_have_no_dict(self):
+        for dot in (dotty(), Dotty({}, separator='/'), FrozenDotty({}), ThreadSafeDotty({})):
+            self.assertFalse(hasattr(dot, '__dict__'))
+
+    def test_settings_are_shared(self):
+        self.assertIs(dotty().settings, Dotty({}).settings)
+        self.assertIs(Dotty({}, separator='/', no_list=True).settings,
+                      Dotty({}, separator='/', no_list=True).settings)
+        self.assertIsNot(dotty().settings, dotty(no_list=True).settings)
+        self.assertIs(dotty().copy().settings, dotty().settings)
+
+    def test_settings_are_read_only(self):
+        dot = Dotty({}, separator='/', esc_char='#', no_list=True, identity_hash=True)
+        self.assertEqual((dot.separator, dot.esc_char, dot.no_list, dot.identity_hash),
+                         ('/', '#', True, True))
+        with self.assertRaises(AttributeError):
+            dot.separator = '.'
+
+    def test_create_from_mapping(self):
+        plain = OrderedDict(a={'b': 1})
+        self.assertEqual(dotty(plain)['a.b'], 1)
+        self.assertIs(dotty(plain).to_dict(mode='view'), plain)
@@ -1,16 +1,86 @@
 import unittest
 from unittest.mock import MagicMock
 
-from dotty_dict import dotty
+from dotty_dict import Dotty, dotty
 
 
 class TestDottyCache(unittest.TestCase):
 
     def test_getitem_cache(self):
-        dot = dotty()
-        dot.__getitem__.cache_clear()
+        dot = dotty(cache_size=32)
         dot._data = MagicMock()
         for _ in range(10):
             dot.get('x.y.z')
-        self.assertEqual(dot.__getitem__.cache_info().hits, 9)
-        dot.__getitem__.cache_clear()
+        self.assertEqual(dot.cache_info().hits, 9)
+        dot.cache_clear()
+
+    def test_cache_is_disabled_by_default(self):
+        dot = dotty({'a': {'b': 1}})
+        self.assertIsNone(dot.cache_info())
+        dot._data['a']['b'] = 2
+        self.assertEqual(dot['a.b'], 2)
+
+    def test_cache_is_per_instance(self):
+        first = dotty({'a': 1}, cache_size=8)
+        second = dotty({'a': 2}, cache_size=8)
+        self.assertEqual(first['a'], 1)
+        self.assertEqual(second['a'], 2)
+        self.assertEqual(first.cache_info().currsize, 1)
+        self.assertEqual(second.cache_info().currsize, 1)
+
+    def test_string_and_compiled_key_share_cache_entry(self):
+        dot = dotty({'a': {'b': 1}}, cache_size=8)
+        dot['a.b']
+        dot[dot.compile('a.b')]
+        self.assertEqual(dot.cache_info().hits, 1)
+
+    def test_least_recently_used_value_is_evicted(self):
+        dot = Dotty({'a': 1, 'b': 2, 'c': 3}, cache_size=2)
+        dot['a']
+        dot['b']
+        dot['a']
+        dot['c']
+        self.assertEqual(dot.cache_info().currsize, 2)
+        dot['a']
+        self.assertEqual(dot.cache_info().hits, 2)
+        dot['b']
+        self.assertEqual(dot.cache_info().misses, 4)
+
+    def test_set_invalidates_cache(self):
+        dot = dotty({'a': {'b': 1}}, cache_size=8)
+        self.assertEqual(dot['a.b'], 1)
+        dot['a.b'] = 2
+        self.assertEqual(dot['a.b'], 2)
+
+    def test_delete_invalidates_cache(self):
+        dot = dotty({'a': {'b': 1}}, cache_size=8)
+        self.assertEqual(dot['a.b'], 1)
+        del dot['a.b']
+        self.assertIsNone(dot.get('a.b'))
+
+    def test_pop_invalidates_cache(self):
+        dot = dotty({'a': {'b': 1}}, cache_size=8)
+        self.assertEqual(dot['a.b'], 1)
+        dot.pop('a.b')
+        self.assertIsNone(dot.get('a.b'))
+
+    def test_dict_methods_invalidate_cache(self):
+        dot = dotty({'a': 1}, cache_size=8)
+        self.assertEqual(dot['a'], 1)
+        dot.update({'a': 2})
+        self.assertEqual(dot['a'], 2)
+        dot.clear()
+        self.assertIsNone(dot.get('a'))
+
+    def test_cache_clear_after_direct_change(self):
+        plain = {'a': 1}
+        dot = dotty(plain, cache_size=8)
+        self.assertEqual(dot['a'], 1)
+        plain['a'] = 2
+        dot.cache_clear()
+        self.assertEqual(dot['a'], 2)
+
+    def test_slices_are_not_cached(self):
+        dot = dotty({'a': [1, 2, 3]}, cache_size=8)
+        self.assertListEqual(dot['a.:2'], [1, 2])
+        self.assertEqual(dot.cache_info().currsize, 0)
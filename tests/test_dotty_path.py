@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import unittest
+
+from dotty_dict import Dotty, DottyPath, dotty
+
+
+class TestDottyPath(unittest.TestCase):
+    def setUp(self):
+        self.dot = dotty({
+            'data': {
+                'user': {
+                    'personal': {'email': 'arnold@dotty.dict'},
+                },
+                'items': [{'id': 1}, {'id': 2}, {'id': 3}],
+            },
+        })
+
+    def test_compile_splits_keys(self):
+        path = DottyPath('data.user.personal.email')
+        self.assertTupleEqual(path.keys, ('data', 'user', 'personal', 'email'))
+        self.assertEqual(len(path), 4)
+
+    def test_compile_classifies_segments(self):
+        path = DottyPath('items.0.1:3.name')
+        self.assertEqual(path.segments[0], ('items', None, None))
+        self.assertEqual(path.segments[1], ('0', 0, None))
+        self.assertEqual(path.segments[2], ('1:3', None, slice(1, 3)))
+        self.assertEqual(path.segments[3], ('name', None, None))
+
+    def test_compile_with_custom_separator(self):
+        dot = Dotty({}, separator=',', esc_char='$')
+        path = dot.compile('chain,of$,keys')
+        self.assertTupleEqual(path.keys, ('chain', 'of,keys'))
+
+    def test_compile_is_cached(self):
+        self.assertIs(self.dot.compile('data.user'), self.dot.compile('data.user'))
+
+    def test_compile_returns_path_unchanged(self):
+        path = DottyPath('data.user')
+        self.assertIs(self.dot.compile(path), path)
+
+    def test_paths_with_the_same_keys_are_equal(self):
+        self.assertEqual(DottyPath('a.b'), DottyPath('a#b', separator='#'))
+        self.assertEqual(hash(DottyPath('a.b')), hash(DottyPath('a#b', separator='#')))
+        self.assertNotEqual(DottyPath('a.b'), DottyPath('a.c'))
+
+    def test_get_with_path(self):
+        path = DottyPath('data.user.personal.email')
+        self.assertEqual(self.dot[path], 'arnold@dotty.dict')
+        self.assertEqual(self.dot.get(path), 'arnold@dotty.dict')
+        self.assertIsNone(self.dot.get(DottyPath('data.user.missing')))
+
+    def test_get_with_slice_path(self):
+        self.assertListEqual(self.dot[DottyPath('data.items.:2.id')], [1, 2])
+
+    def test_contains_with_path(self):
+        self.assertIn(DottyPath('data.items.1.id'), self.dot)
+        self.assertNotIn(DottyPath('data.items.5.id'), self.dot)
+
+    def test_set_and_delete_with_path(self):
+        path = DottyPath('data.user.personal.name')
+        self.dot[path] = 'Arnold'
+        self.assertEqual(self.dot['data.user.personal.name'], 'Arnold')
+        del self.dot[path]
+        self.assertNotIn('data.user.personal.name', self.dot)
+
+    def test_pop_with_path(self):
+        self.assertEqual(self.dot.pop(DottyPath('data.user.personal.email')), 'arnold@dotty.dict')
+        self.assertDictEqual(self.dot['data.user.personal'], {})
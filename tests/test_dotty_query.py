@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import types
+import unittest
+
+from dotty_dict import Dotty, dotty
+from dotty_dict.dotty_dict import Predicate
+
+
+class TestFind(unittest.TestCase):
+    def setUp(self):
+        self.dot = dotty({
+            'id': 0,
+            'shop': {
+                'items': [
+                    {'id': 1, 'price': 10, 'tags': [{'id': 11}]},
+                    {'id': 2, 'price': 20},
+                    {'id': 3},
+                ],
+                'owner': {'id': 4, 'name': 'Arnold'},
+            },
+        })
+
+    def test_find_returns_generator(self):
+        self.assertIsInstance(self.dot.find('shop.items.*.price'), types.GeneratorType)
+
+    def test_star_over_list(self):
+        self.assertListEqual(list(self.dot.find('shop.items.*.price')), [10, 20])
+
+    def test_star_over_dict(self):
+        self.assertListEqual(list(self.dot.find('shop.*.id')), [4])
+        self.assertListEqual(list(self.dot.find('shop.owner.*')), [4, 'Arnold'])
+
+    def test_double_star_in_document_order(self):
+        self.assertListEqual(list(self.dot.find('**.id')), [0, 1, 11, 2, 3, 4])
+
+    def test_double_star_matches_empty_chain(self):
+        self.assertListEqual(list(self.dot.find('shop.**.owner.name')), ['Arnold'])
+
+    def test_trailing_double_star_yields_node_and_descendants(self):
+        self.assertListEqual(list(self.dot.find('shop.owner.**')),
+                             [{'id': 4, 'name': 'Arnold'}, 4, 'Arnold'])
+
+    def test_many_double_stars_yield_each_node_once(self):
+        dot = dotty({'a': {'x': {'a': {'b': 1}}}})
+        self.assertListEqual(list(dot.find_items('**.a.**.b')), [('a.x.a.b', 1)])
+
+    def test_find_items_paths(self):
+        self.assertListEqual(list(self.dot.find_items('shop.items.*.price')),
+                             [('shop.items.0.price', 10), ('shop.items.1.price', 20)])
+
+    def test_find_items_escapes_separator(self):
+        dot = dotty({'a': {'b.c': 1}})
+        self.assertListEqual(list(dot.find_items('a.*')), [('a.b\\.c', 1)])
+
+    def test_slice_and_index(self):
+        self.assertListEqual(list(self.dot.find_items('shop.items.1:.id')),
+                             [('shop.items.1.id', 2), ('shop.items.2.id', 3)])
+        self.assertListEqual(list(self.dot.find('shop.items.0.tags.*.id')), [11])
+
+    def test_missing_keys_are_skipped(self):
+        self.assertListEqual(list(self.dot.find('shop.*.missing')), [])
+        self.assertListEqual(list(self.dot.find('nothing.**')), [])
+
+    def test_no_list_does_not_enter_lists(self):
+        dot = dotty({'a': [{'b': 1}], 'c': {'0': {'b': 2}}}, no_list=True)
+        self.assertListEqual(list(dot.find('*.*.b')), [2])
+
+    def test_custom_separator(self):
+        dot = Dotty({'a': {'b': {'c': 1}}}, separator=',')
+        self.assertListEqual(list(dot.find_items('**,c')), [('a,b,c', 1)])
+
+    def test_compiled_path(self):
+        path = self.dot.compile('shop.items.*.id')
+        self.assertListEqual(list(self.dot.find(path)), [1, 2, 3])
+
+
+class TestPredicates(unittest.TestCase):
+    def setUp(self):
+        self.dot = dotty({
+            'items': [
+                {'id': 1, 'price': 5, 'status': 'paid', 'active': True},
+                {'id': 2, 'price': 15, 'status': 'new'},
+                {'id': 3, 'price': 25.5, 'active': False},
+                {'id': 4, 'price': 'n/a'},
+                'not a dict',
+            ],
+        })
+
+    def test_parse(self):
+        predicate = Predicate.parse('?price>=10')
+        self.assertEqual((predicate.field, predicate.op, predicate.value), ('price', '>=', 10))
+        self.assertEqual(Predicate.parse('?status=paid').value, 'paid')
+        self.assertEqual(Predicate.parse('?status="10"').value, '10')
+        self.assertTrue(Predicate.parse('?!status').negate)
+        self.assertIsNone(Predicate.parse('?'))
+        self.assertIsNone(Predicate.parse('plain'))
+
+    def test_comparison(self):
+        self.assertListEqual(self.dot['items.?price>10.id'], [2, 3])
+        self.assertListEqual(self.dot['items.?price<=15.id'], [1, 2])
+        self.assertListEqual(self.dot['items.?price>25\\.4.id'], [3])
+
+    def test_equality(self):
+        self.assertListEqual(self.dot['items.?status=paid.id'], [1])
+        self.assertListEqual(self.dot['items.?status==new.id'], [2])
+        self.assertListEqual(self.dot['items.?active=true.id'], [1])
+        self.assertListEqual(self.dot['items.?status!=paid.id'], [2])
+
+    def test_existence(self):
+        self.assertListEqual(self.dot['items.?active.id'], [1, 3])
+        self.assertListEqual(self.dot['items.?!status.id'], [3, 4])
+
+    def test_predicate_as_last_segment(self):
+        self.assertListEqual(self.dot['items.?status=paid'], [self.dot['items.0']])
+
+    def test_no_match_returns_empty_list(self):
+        self.assertListEqual(self.dot['items.?price>100.id'], [])
+
+    def test_predicate_is_plain_key_in_dict(self):
+        dot = dotty({'?weird': 1})
+        self.assertEqual(dot['?weird'], 1)
+
+    def test_stream_matches(self):
+        matches = self.dot.find_items('items.?price>10.id')
+        self.assertTupleEqual(next(matches), ('items.1.id', 2))
+        self.assertListEqual(list(matches), [('items.2.id', 3)])
+
+    def test_predicate_with_wildcard(self):
+        dot = dotty({'a': {'items': [{'id': 1}]}, 'b': {'items': [{'id': 2, 'x': 0}]}})
+        self.assertListEqual(list(dot.find('*.items.?x.id')), [2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -250,3 +250,32 @@ class TestDottyValueAccess(unittest.TestCase):
         self.assertEqual(dict_bool, 'bool')
         self.assertEqual(dict_none, 'None')
         self.assertEqual(nested_dict_float, 'nested_float')
+
+    def test_very_deep_key(self):
+        key = '.'.join('k{}'.format(i) for i in range(2000))
+        dot = dotty()
+        dot[key] = 'bottom'
+        self.assertEqual(dot[key], 'bottom')
+        self.assertIn(key, dot)
+        self.assertEqual(dot.pop(key), 'bottom')
+        self.assertNotIn(key, dot)
+
+    def test_has_key_with_falsy_value(self):
+        dot = dotty({'flags': [0, False], 'empty': {'value': ''}})
+        self.assertIn('flags.0', dot)
+        self.assertIn('flags.1', dot)
+        self.assertIn('empty.value', dot)
+
+    def test_set_and_delete_integer_dict_key(self):
+        dot = dotty({'field': {1: 'one'}})
+        dot['field.1'] = 'uno'
+        self.assertDictEqual(dot._data, {'field': {1: 'uno'}})
+        del dot['field.1']
+        self.assertDictEqual(dot._data, {'field': {}})
+
+    def test_pop_from_list(self):
+        dot = dotty({'field': [{'a': 1}, {'b': 2}]})
+        self.assertEqual(dot.pop('field.1.b'), 2)
+        self.assertDictEqual(dot.pop('field.0'), {'a': 1})
+        self.assertEqual(dot.pop('field.5', 'missing'), 'missing')
+        self.assertDictEqual(dot._data, {'field': [{}]})
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import threading
+import unittest
+
+from dotty_dict import Dotty
+from dotty_dict.frozen import FrozenDotty
+
+
+class TestFrozenDotty(unittest.TestCase):
+    def setUp(self):
+        self.plain = {'a': {'b': [1, {'c': 2}]}, 'other': {'d': 3}}
+        self.frozen = FrozenDotty(self.plain)
+
+    def test_access(self):
+        self.assertEqual(self.frozen['a.b.1.c'], 2)
+        self.assertListEqual(self.frozen['a.b.:'], [1, {'c': 2}])
+        self.assertIn('other.d', self.frozen)
+        self.assertIsInstance(self.frozen, Dotty)
+
+    def test_source_dictionary_is_copied(self):
+        self.plain['a']['b'].append(5)
+        self.assertListEqual(self.frozen['a.b'], [1, {'c': 2}])
+
+    def test_writes_raise(self):
+        with self.assertRaises(TypeError):
+            self.frozen['a.x'] = 1
+        with self.assertRaises(TypeError):
+            del self.frozen['a']
+        with self.assertRaises(TypeError):
+            self.frozen.pop('a')
+        with self.assertRaises(TypeError):
+            self.frozen.set_many({'a.x': 1})
+        with self.assertRaises(AttributeError):
+            self.frozen.update({'x': 1})
+
+    def test_set_returns_new_document(self):
+        changed = self.frozen.set('a.b.1.c', 5)
+        self.assertIsInstance(changed, FrozenDotty)
+        self.assertEqual(changed['a.b.1.c'], 5)
+        self.assertEqual(self.frozen['a.b.1.c'], 2)
+
+    def test_set_shares_untouched_containers(self):
+        changed = self.frozen.set('a.b.1.c', 5)
+        self.assertIs(changed['other'], self.frozen['other'])
+        self.assertIsNot(changed['a.b'], self.frozen['a.b'])
+
+    def test_set_creates_missing_containers(self):
+        changed = self.frozen.set('x.0.y', [1])
+        self.assertDictEqual(changed.to_dict(), {
+            'a': {'b': [1, {'c': 2}]}, 'other': {'d': 3}, 'x': [{'y': [1]}],
+        })
+
+    def test_delete(self):
+        changed = self.frozen.delete('a.b.0')
+        self.assertListEqual(changed['a.b'], [{'c': 2}])
+        self.assertListEqual(self.frozen['a.b'], [1, {'c': 2}])
+        with self.assertRaises(KeyError):
+            self.frozen.delete('missing')
+
+    def test_hash(self):
+        same = FrozenDotty({'other': {'d': 3}, 'a': {'b': [1, {'c': 2}]}})
+        self.assertEqual(hash(self.frozen), hash(same))
+        self.assertEqual(self.frozen, same)
+        self.assertEqual(len({self.frozen, same, self.frozen.set('other.d', 4)}), 2)
+
+    def test_view(self):
+        view = self.frozen.view('a')
+        self.assertIsInstance(view, FrozenDotty)
+        self.assertIs(self.frozen.view('a'), view)
+        self.assertIs(view['b'], self.frozen['a.b'])
+        with self.assertRaises(TypeError):
+            view['b'] = 1
+        with self.assertRaises(AttributeError):
+            self.frozen.view('a.b')
+
+    def test_thaw(self):
+        thawed = self.frozen.thaw()
+        thawed['a.b.1.c'] = 5
+        self.assertNotIsInstance(thawed, FrozenDotty)
+        self.assertEqual(self.frozen['a.b.1.c'], 2)
+
+    def test_share_between_threads(self):
+        results = []
+
+        def worker(number):
+            document = self.frozen
+            for i in range(100):
+                document = document.set('counter', i)
+            results.append((number, document['counter'], self.frozen.get('counter')))
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertListEqual(sorted(results), [(n, 99, None) for n in range(4)])
+
+
+if __name__ == '__main__':
+    unittest.main()
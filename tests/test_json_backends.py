@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import json
+import unittest
+
+from dotty_dict import Dotty, dotty, json_backends
+
+
+class TestJSONBackends(unittest.TestCase):
+    def setUp(self):
+        self.dot = dotty({'a': {'b': [1, 2.5, None, True]}, 'nested': dotty({'c': 'd'})})
+        self.expected = {'a': {'b': [1, 2.5, None, True]}, 'nested': {'c': 'd'}}
+
+    def tearDown(self):
+        json_backends.set_default_backend('json')
+
+    def test_default_backend_is_standard_library(self):
+        self.assertEqual(self.dot.to_json(), json.dumps(self.expected))
+
+    def test_every_available_backend_unwraps_dotty(self):
+        for name in json_backends.available_backends():
+            self.assertDictEqual(json.loads(self.dot.to_json(backend=name)), self.expected)
+
+    def test_every_available_backend_parses_json(self):
+        document = json.dumps(self.expected)
+        for name in json_backends.available_backends():
+            dot = Dotty.from_json(document, backend=name)
+            self.assertIsInstance(dot, Dotty)
+            self.assertEqual(dot['a.b.1'], 2.5)
+            self.assertEqual(Dotty.from_json(document.encode('utf-8'), backend=name), self.expected)
+
+    def test_from_json_rejects_non_object(self):
+        with self.assertRaises(AttributeError):
+            Dotty.from_json('[1, 2]')
+
+    def test_non_serializable_value(self):
+        for name in json_backends.available_backends():
+            with self.assertRaises(TypeError):
+                dotty({'a': object()}).to_json(backend=name)
+
+    def test_auto_backend_falls_back_to_standard_library(self):
+        dot = dotty({'big': 2 ** 70, 1: 'int key'})
+        self.assertEqual(dot.to_json(backend='auto'), json.dumps(dot._data))
+
+    def test_set_default_backend(self):
+        json_backends.set_default_backend('auto')
+        self.assertIs(json_backends.get_backend(), json_backends.get_backend('auto'))
+        self.assertDictEqual(json.loads(self.dot.to_json()), self.expected)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            self.dot.to_json(backend='unknown')
+        with self.assertRaises(ValueError):
+            json_backends.set_default_backend('unknown')
@@ -255,3 +255,8 @@ class TestNoList(unittest.TestCase):
 
     def test_normal_key(self):
         self.assertEqual(self.dot['field1.key'], 'value6')
+
+    def test_set_numeric_key(self):
+        dot = dotty(no_list=True)
+        dot['field.1.key'] = 'value'
+        self.assertDictEqual(dot._data, {'field': {'1': {'key': 'value'}}})
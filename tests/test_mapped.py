@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import json
+import os
+import tempfile
+import unittest
+
+from dotty_dict.mapped import MappedDotty
+
+
+class TestMappedDotty(unittest.TestCase):
+    def setUp(self):
+        self.document = {
+            'catalog': {
+                'items': [
+                    {'id': 1, 'name': 'żółw', 'flags': [True, None], 'price': {'net': 1.5}},
+                    {'id': 2, 'name': 'say "hi" \\ [}', 'flags': [], 'price': {'net': -2e3}},
+                    {'id': 3, 'name': 'pies', 'flags': [False], 'price': None},
+                ],
+                'key.with.dot': {'deeper': 'value'},
+                'empty': {},
+            },
+            'version': 7,
+        }
+        fd, self.path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(fd, 'w', encoding='utf-8') as fp:
+            json.dump(self.document, fp, indent=2, ensure_ascii=False)
+        self.dot = MappedDotty(self.path)
+
+    def tearDown(self):
+        self.dot.close()
+        os.remove(self.path)
+
+    def test_access_values(self):
+        self.assertEqual(self.dot['version'], 7)
+        self.assertEqual(self.dot['catalog.items.0.name'], 'żółw')
+        self.assertEqual(self.dot['catalog.items.1.name'], 'say "hi" \\ [}')
+        self.assertEqual(self.dot['catalog.items.1.price.net'], -2e3)
+        self.assertDictEqual(self.dot['catalog.items.0'], self.document['catalog']['items'][0])
+        self.assertEqual(self.dot[r'catalog.key\.with\.dot.deeper'], 'value')
+
+    def test_access_slices(self):
+        self.assertListEqual(self.dot['catalog.items.:.id'], [1, 2, 3])
+        self.assertListEqual(self.dot['catalog.items.1:.flags'], [[], [False]])
+        self.assertListEqual(self.dot['catalog.items.::2'], self.document['catalog']['items'][::2])
+
+    def test_access_predicates(self):
+        self.assertListEqual(self.dot['catalog.items.?id>1.name'], ['say "hi" \\ [}', 'pies'])
+        self.assertListEqual(self.dot['catalog.items.?name=pies.id'], [3])
+        self.assertListEqual(self.dot['catalog.items.?!missing.id'], [1, 2, 3])
+
+    def test_none_on_the_way_returns_none(self):
+        self.assertIsNone(self.dot['catalog.items.2.price.net'])
+
+    def test_missing_keys(self):
+        with self.assertRaises(KeyError):
+            self.dot['catalog.missing']
+        with self.assertRaises(KeyError):
+            self.dot['catalog.items.name']
+        with self.assertRaises(IndexError):
+            self.dot['catalog.items.5']
+        self.assertEqual(self.dot.get('catalog.items.5.id', 'default'), 'default')
+
+    def test_contains(self):
+        self.assertIn('catalog.items.1.flags', self.dot)
+        self.assertIn('catalog.empty', self.dot)
+        self.assertNotIn('catalog.items.3', self.dot)
+        self.assertNotIn('catalog.items.2.price.net', self.dot)
+
+    def test_mapping_methods(self):
+        self.assertEqual(len(self.dot), 2)
+        self.assertListEqual(sorted(self.dot.keys()), ['catalog', 'version'])
+        self.assertDictEqual(self.dot.to_dict(), self.document)
+
+    def test_mapping_methods_with_separator_in_top_level_key(self):
+        document = {'a.b': 1, 'c': {'d': 2}, 'e\\': 3}
+        fd, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(fd, 'w', encoding='utf-8') as fp:
+            json.dump(document, fp)
+        try:
+            with MappedDotty(path) as dot:
+                self.assertListEqual(sorted(dot), ['a\\.b', 'c', 'e\\'])
+                self.assertDictEqual(dict(dot.items()), {'a\\.b': 1, 'c': {'d': 2}, 'e\\': 3})
+                self.assertListEqual(sorted(dot.values(), key=str), [1, 3, {'d': 2}])
+                self.assertEqual(dot, {'a\\.b': 1, 'c': {'d': 2}, 'e\\': 3})
+        finally:
+            os.remove(path)
+
+    def test_read_only(self):
+        with self.assertRaises(TypeError):
+            self.dot['version'] = 8
+        with self.assertRaises(TypeError):
+            del self.dot['version']
+
+    def test_cache(self):
+        with MappedDotty(self.path, cache_size=8) as dot:
+            self.assertEqual(dot['catalog.items.0.id'], 1)
+            self.assertEqual(dot['catalog.items.0.id'], 1)
+            self.assertEqual(dot._cache.info().hits, 1)
+
+    def test_reject_non_object_document(self):
+        with open(self.path, 'w') as fp:
+            json.dump([1, 2], fp)
+        with self.assertRaises(AttributeError):
+            MappedDotty(self.path)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import io
+import json
+import unittest
+
+from dotty_dict import Dotty, streaming
+from dotty_dict.dotty_dict import join_keys, split_key
+
+
+class TestJoinKeys(unittest.TestCase):
+    def test_join_keys_is_reverse_of_split_key(self):
+        for keys, sep, esc in [(['a', 'b', 'c'], '.', '\\'),
+                               (['key.with.dot', 'deeper'], '.', '\\'),
+                               (['key.with_backslash\\', 'deeper'], '.', '\\'),
+                               (['abcd', 'efg,hij', 'efg$', 'x'], ',', '$')]:
+            self.assertListEqual(split_key(join_keys(keys, sep, esc), sep, esc), keys)
+
+    def test_join_keys_converts_non_string_keys(self):
+        self.assertEqual(join_keys(['items', 0, 'id']), 'items.0.id')
+
+
+class TestStreaming(unittest.TestCase):
+    def setUp(self):
+        self.document = {
+            'meta': {'count': 3, 'next': None},
+            'data': {
+                'items': [
+                    {'id': 1, 'name': 'żółw', 'price': {'net': 1.5, 'tags': []}},
+                    {'id': 2, 'name': 'kot', 'price': {'net': -2e3, 'tags': ['a] }', '\\"[{']}},
+                    {'id': 3, 'name': 'pies "burek"', 'price': {'net': 0, 'tags': [True, False]}},
+                ],
+                'key.with.dot': {},
+            },
+        }
+        self.text = json.dumps(self.document, indent=2)
+
+    def files(self):
+        for chunk_size in (1, 2, 5, 64, 65536):
+            yield io.StringIO(self.text), chunk_size
+            yield io.BytesIO(self.text.encode('utf-8')), chunk_size
+
+    def test_events_of_small_document(self):
+        events = list(streaming.iter_events(io.StringIO('{"a": [1, {"b": null}], "c": {}}')))
+        self.assertListEqual(events, [
+            ('start_map', None), ('key', 'a'), ('start_array', None), ('value', 1),
+            ('start_map', None), ('key', 'b'), ('value', None), ('end_map', None),
+            ('end_array', None), ('key', 'c'), ('start_map', None), ('end_map', None),
+            ('end_map', None),
+        ])
+
+    def test_load_whole_document(self):
+        for fp, chunk_size in self.files():
+            dot = streaming.load(fp, chunk_size=chunk_size)
+            self.assertIsInstance(dot, Dotty)
+            self.assertDictEqual(dot._data, self.document)
+
+    def test_load_selected_paths(self):
+        for fp, chunk_size in self.files():
+            dot = streaming.load(fp, ['data.items.*.id', 'meta.count'], chunk_size=chunk_size)
+            self.assertDictEqual(dot._data, {
+                'meta': {'count': 3},
+                'data': {'items': [{'id': 1}, {'id': 2}, {'id': 3}]},
+            })
+
+    def test_load_selected_subtree_and_list_index(self):
+        dot = streaming.load(io.StringIO(self.text), ['data.items.1.price'])
+        self.assertDictEqual(dot._data, {
+            'data': {'items': [None, {'price': {'net': -2e3, 'tags': ['a] }', '\\"[{']}}]},
+        })
+        self.assertEqual(dot['data.items.1.price.tags.0'], 'a] }')
+
+    def test_iter_items_of_every_leaf(self):
+        items = dict(streaming.iter_items(io.StringIO(self.text)))
+        self.assertEqual(items['meta.next'], None)
+        self.assertEqual(items['data.items.0.name'], 'żółw')
+        self.assertEqual(items['data.items.0.price.tags'], [])
+        self.assertEqual(items['data.items.2.price.tags.1'], False)
+        self.assertEqual(items['data.key\\.with\\.dot'], {})
+        self.assertEqual(len(items), 17)
+
+    def test_iter_items_of_selected_paths(self):
+        items = list(streaming.iter_items(io.StringIO(self.text), 'data.items.*.price.net'))
+        self.assertListEqual(items, [('data.items.0.price.net', 1.5),
+                                     ('data.items.1.price.net', -2e3),
+                                     ('data.items.2.price.net', 0)])
+
+    def test_iter_items_with_custom_separator(self):
+        items = list(streaming.iter_items(io.StringIO(self.text), ['data,key.with.dot'],
+                                          separator=','))
+        self.assertListEqual(items, [('data,key.with.dot', {})])
+
+    def test_invalid_documents(self):
+        for text in ['', '{"a" 1}', '{"a": 1,}', '[1 2]', '{"a": tru}', '{"a": 1} x', '{"a": 1.}']:
+            with self.assertRaises(json.JSONDecodeError):
+                list(streaming.iter_events(io.StringIO(text)))
+        for text in ['{"a": {"b": "c}}', '{"skip": [1, 2']:
+            with self.assertRaises(json.JSONDecodeError):
+                streaming.load(io.StringIO(text), ['other'])
+
+    def test_error_position_is_counted_from_start_of_document(self):
+        for text in ['{"aaaa": 1, "bbbb": [1, 2, 3], "c": tru}', '{\n "a": 1,\n "b": [1 2]}',
+                     '{"aaaa": 1, "bbbb": "abc\\x"}']:
+            with self.assertRaises(json.JSONDecodeError) as expected:
+                json.loads(text)
+            for chunk_size in (1, 4, 65536):
+                with self.assertRaises(json.JSONDecodeError) as cm:
+                    list(streaming.iter_events(io.StringIO(text), chunk_size=chunk_size))
+                self.assertEqual(str(cm.exception), str(expected.exception))
+
+    def test_load_rejects_array_document(self):
+        with self.assertRaises(AttributeError):
+            streaming.load(io.StringIO('[{"a": 1}]'), ['*.a'])
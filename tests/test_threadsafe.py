@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import threading
+import unittest
+
+from dotty_dict import Dotty
+from dotty_dict.threadsafe import RWLock, ThreadSafeDotty
+
+
+def run_threads(target, count):
+    errors = []
+
+    def guarded(number):
+        try:
+            target(number)
+        except Exception as exc:  # pragma: no cover
+            errors.append(exc)
+
+    threads = [threading.Thread(target=guarded, args=(n,)) for n in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+class TestRWLock(unittest.TestCase):
+    def test_readers_do_not_block_each_other(self):
+        lock = RWLock()
+        inside = threading.Barrier(3, timeout=5)
+
+        def reader(_):
+            with lock.reading():
+                inside.wait()
+
+        self.assertListEqual(run_threads(reader, 3), [])
+
+    def test_writer_excludes_readers(self):
+        lock = RWLock()
+        events = []
+        lock.acquire_write()
+
+        def reader(_):
+            with lock.reading():
+                events.append('read')
+
+        thread = threading.Thread(target=reader, args=(0,))
+        thread.start()
+        thread.join(0.05)
+        events.append('write done')
+        lock.release_write()
+        thread.join()
+        self.assertListEqual(events, ['write done', 'read'])
+
+    def test_reentrant(self):
+        lock = RWLock()
+        with lock.writing():
+            with lock.writing():
+                with lock.reading():
+                    pass
+        with lock.reading():
+            with lock.reading():
+                with self.assertRaises(RuntimeError):
+                    lock.acquire_write()
+
+
+class TestThreadSafeDotty(unittest.TestCase):
+    def test_works_like_dotty(self):
+        dot = ThreadSafeDotty({'a': {'b': [1, 2]}}, cache_size=8)
+        dot['a.c.d'] = 3
+        self.assertEqual(dot['a.c.d'], 3)
+        self.assertEqual(dot.get('a.b.1'), 2)
+        self.assertEqual(dot.setdefault('a.e', 4), 4)
+        self.assertEqual(dot.pop('a.e'), 4)
+        self.assertIn('a.b', dot)
+        dot.update({'x': 1})
+        self.assertEqual(dot['x'], 1)
+        self.assertListEqual(list(dot.find('a.b.*')), [1, 2])
+        self.assertEqual(dot.cache_info().maxsize, 8)
+        self.assertIsInstance(dot, Dotty)
+
+    def test_concurrent_writes_create_every_key(self):
+        dot = ThreadSafeDotty({})
+
+        def writer(number):
+            for i in range(200):
+                dot['shared.list.{}'.format(i)] = i
+                dot['threads.t{}.i{}.value'.format(number, i)] = i
+
+        self.assertListEqual(run_threads(writer, 8), [])
+        self.assertListEqual(dot['shared.list'], list(range(200)))
+        for number in range(8):
+            self.assertEqual(len(dot['threads.t{}'.format(number)]), 200)
+
+    def test_atomic_increment_with_write_lock(self):
+        dot = ThreadSafeDotty({'counter': {'value': 0}}, cache_size=4)
+
+        def incrementer(_):
+            for _ in range(300):
+                with dot.lock.writing():
+                    dot['counter.value'] = dot['counter.value'] + 1
+
+        self.assertListEqual(run_threads(incrementer, 8), [])
+        self.assertEqual(dot['counter.value'], 2400)
+
+    def test_iteration_inside_read_lock(self):
+        dot = ThreadSafeDotty({'a': {'b': 1, 'c': 2}})
+        with dot.lock.reading():
+            self.assertListEqual(list(dot.find('a.*')), [1, 2])
+        with dot.lock.writing():
+            self.assertListEqual(list(dot.deep_keys()), ['a', 'a.b', 'a.c'])
+
+    def test_iteration_sees_no_later_writes(self):
+        dot = ThreadSafeDotty({'a': {'b': 1}})
+        items = dot.flatten()
+        dot['a.c'] = 2
+        self.assertListEqual(list(items), [('a.b', 1)])
+
+    def test_iteration_collects_results_without_copying(self):
+        dot = ThreadSafeDotty({'users': {'u1': {'tags': ['a']}, 'u2': {'tags': []}}})
+        found = dot.find('users.u1.*')
+        dot['users.u1.name'] = 'x'
+        self.assertListEqual(list(found), [['a']])
+        self.assertIs(next(dot.find('users.u1.tags')), dot['users.u1.tags'])
+
+    def test_iteration_does_not_detach_nested_dicts(self):
+        dot = ThreadSafeDotty({'a': {'b': 1}})
+        inner = dot['a']
+        list(dot.walk())
+        dot['a.b'] = 99
+        self.assertDictEqual(inner, {'b': 99})
+
+    def test_iteration_while_writing(self):
+        dot = ThreadSafeDotty({'items': {str(i): {'v': i} for i in range(100)}})
+
+        def worker(number):
+            for i in range(50):
+                if number % 2:
+                    dot['items.{}'.format(1000 * number + i)] = {'v': i}
+                    dot.pop('items.{}'.format(i), None)
+                else:
+                    for _ in dot.flatten():
+                        pass
+
+        self.assertListEqual(run_threads(worker, 8), [])
+
+    def test_view_holds_lock(self):
+        dot = ThreadSafeDotty({'a': {'b': {'c': 1}}})
+        view = dot.view('a')
+        self.assertIs(view.lock, dot.lock)
+        self.assertIs(view.view('b').lock, dot.lock)
+        with dot.lock.reading():
+            self.assertEqual(view['b.c'], 1)
+            with self.assertRaises(RuntimeError):
+                view['b.c'] = 2
+        view['b.c'] = 2
+        self.assertEqual(dot['a.b.c'], 2)
+
+    def test_view_of_key_replaced_with_scalar(self):
+        dot = ThreadSafeDotty({'a': {'b': 1}})
+        view = dot.view('a')
+        dot['a'] = 1
+        with self.assertRaises(TypeError):
+            view['b']
+        with self.assertRaises(TypeError):
+            view.keys()
+
+    def test_dict_methods_of_view_respect_snapshot(self):
+        dot = ThreadSafeDotty({'a': {'b': 1}})
+        view = dot.view('a')
+        snap = view.snapshot()
+        view.update({'b': 2})
+        self.assertEqual(dot['a.b'], 2)
+        self.assertEqual(snap['b'], 1)
+
+    def test_concurrent_writes_through_views(self):
+        dot = ThreadSafeDotty({'counter': {'value': 0}})
+
+        def incrementer(number):
+            view = dot.view('counter')
+            for _ in range(300):
+                with dot.lock.writing():
+                    view['value'] = view['value'] + 1
+
+        self.assertListEqual(run_threads(incrementer, 8), [])
+        self.assertEqual(dot['counter.value'], 2400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+import pickle
+import unittest
+
+from dotty_dict import Dotty
+from dotty_dict.transform import Projection, Transform, parallel_map
+
+
+def make_records(count):
+    return ({'id': str(i), 'user': {'name': 'user{}'.format(i), 'tags': ['a', 'b'][:i % 3]}}
+            for i in range(count))
+
+
+class TestTransform(unittest.TestCase):
+    def setUp(self):
+        self.transform = Transform([
+            ('id', 'data.id', int),
+            ('user.name', 'data.attributes.name', str.upper),
+            ('user.tags.0', 'data.first_tag'),
+            ('user.tags', 'data.tags.0'),
+        ])
+
+    def test_transform(self):
+        document = {'id': '7', 'user': {'name': 'bob', 'tags': ['x', 'y']}}
+        self.assertDictEqual(self.transform(document), {'data': {
+            'id': 7, 'attributes': {'name': 'BOB'}, 'first_tag': 'x', 'tags': [['x', 'y']],
+        }})
+        self.assertDictEqual(document, {'id': '7', 'user': {'name': 'bob', 'tags': ['x', 'y']}})
+
+    def test_missing_source_is_skipped(self):
+        self.assertDictEqual(self.transform(Dotty({'user': {'tags': []}})),
+                             {'data': {'tags': [[]]}})
+
+    def test_custom_separator(self):
+        transform = Transform([('a/b', 'c/d')], separator='/')
+        self.assertDictEqual(transform({'a': {'b': 1}}), {'c': {'d': 1}})
+
+    def test_invalid_rule(self):
+        with self.assertRaises(ValueError):
+            Transform([('a',)])
+
+    def test_pickle(self):
+        copy = pickle.loads(pickle.dumps(self.transform))
+        document = {'id': '1', 'user': {'name': 'x'}}
+        self.assertDictEqual(copy(document), self.transform(document))
+
+    def test_last_rule_wins(self):
+        transform = Transform([('a', 'x.y'), ('b', 'x.y'), ('c', 'x.y')])
+        self.assertDictEqual(transform({'a': 1, 'b': 2}), {'x': {'y': 2}})
+
+
+class TestProjection(unittest.TestCase):
+    def setUp(self):
+        self.response = {
+            'status': {'code': 200, 'msg': 'User created'},
+            'data': {'user': {
+                'id': 123,
+                'personal': {'name': 'Arnold', 'email': 'arnold@dotty.dict'},
+                'privileges': {'granted': ['login', 'guest'], 'denied': []},
+            }},
+        }
+        self.spec = {
+            'id': 'data.user.id',
+            'profile.name': 'data.user.personal.name',
+            'profile.email': 'data.user.personal.email',
+            'profile.phone': 'data.user.personal.phone',
+            'access.first': 'data.user.privileges.granted.0',
+            'access.denied': 'data.user.privileges.denied',
+            'status': 'status.code',
+        }
+
+    def test_skip(self):
+        self.assertDictEqual(Projection(self.spec)(self.response), {
+            'id': 123,
+            'profile': {'name': 'Arnold', 'email': 'arnold@dotty.dict'},
+            'access': {'first': 'login', 'denied': []},
+            'status': 200,
+        })
+
+    def test_default(self):
+        project = Projection(self.spec, missing='default', default='')
+        self.assertEqual(project(Dotty(self.response))['profile']['phone'], '')
+
+    def test_raise(self):
+        project = Projection(self.spec, missing='raise')
+        with self.assertRaises(KeyError) as cm:
+            project(self.response)
+        self.assertEqual(cm.exception.args[0], 'data.user.personal.phone')
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            Projection(self.spec, missing='ignore')
+
+    def test_nested_dict_of_missing_keys_is_skipped(self):
+        project = Projection({'a.b': 'x', 'a.c': 'y', 'd': 'status.code'})
+        self.assertDictEqual(project(self.response), {'d': 200})
+
+    def test_list_targets(self):
+        project = Projection({'codes.0': 'status.code', 'codes.1': 'data.user.id',
+                              'names.:': 'status.msg'})
+        self.assertDictEqual(project(self.response),
+                             {'codes': [200, 123], 'names': {':': 'User created'}})
+
+    def test_slice_sources(self):
+        project = Projection({'privileges': 'data.user.privileges.granted.:1'})
+        self.assertDictEqual(project(self.response), {'privileges': ['login']})
+
+    def test_same_as_dotty(self):
+        source = Dotty(self.response)
+        expected = Dotty({})
+        for target, key in self.spec.items():
+            if key in source:
+                expected[target] = source[key]
+        self.assertDictEqual(Projection(self.spec)(self.response), expected.to_dict())
+
+    def test_pickle(self):
+        project = Projection(self.spec, missing='default', default=0)
+        copy = pickle.loads(pickle.dumps(project))
+        self.assertDictEqual(copy(self.response), project(self.response))
+
+
+class TestParallelMap(unittest.TestCase):
+    def setUp(self):
+        self.transform = Transform([('id', 'id', int), ('user.tags.0', 'tag')])
+        self.expected = [self.transform(r) for r in make_records(50)]
+
+    def test_in_current_process(self):
+        results = list(parallel_map(self.transform, make_records(50), processes=0))
+        self.assertListEqual(results, self.expected)
+
+    def test_ordered(self):
+        results = list(parallel_map(self.transform, make_records(50), processes=2, chunk_size=3))
+        self.assertListEqual(results, self.expected)
+
+    def test_unordered(self):
+        results = list(parallel_map(self.transform, make_records(50), processes=2, chunk_size=3,
+                                    ordered=False))
+        self.assertListEqual(sorted(results, key=lambda r: r['id']), self.expected)
+
+    def test_stop_early(self):
+        results = parallel_map(self.transform, make_records(10 ** 6), processes=2, chunk_size=10)
+        self.assertDictEqual(next(results), {'id': 0})
+        results.close()
+
+    def test_error_is_raised(self):
+        transform = Transform([('user.name', 'id', int)])
+        for ordered in (True, False):
+            with self.assertRaises(ValueError):
+                list(parallel_map(transform, make_records(20), processes=2, chunk_size=4,
+                                  ordered=ordered))
+
+
+if __name__ == '__main__':
+    unittest.main()